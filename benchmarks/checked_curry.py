@@ -0,0 +1,61 @@
+# ruff:file-ignore[implicit-namespace-package, docstring-missing-returns, docstring-missing-exception]
+"""Compare the cost per call of ``curry`` and ``checked_curry`` in the Python and Cython builds.
+
+Run ``python -m benchmarks.checked_curry`` from the root of the repository after building the extensions in place. Every
+number is the minimum over ``REPEAT`` runs of ``NUMBER`` calls, in microseconds per call. The Cython column is skipped if
+``humpy_cytoolz`` is not built.
+"""
+from importlib import import_module
+from types import ModuleType
+from typing import Any
+import contextlib
+import sys
+import timeit
+
+REPEAT: int = 15
+NUMBER: int = 20000
+
+def add3(x: int, y: int, z: int) -> int:
+	"""Add three numbers; the function that is curried."""
+	return x + y + z
+
+def fails(x: int, y: int) -> int:
+	"""Raise ``TypeError`` from the body of a complete call."""
+	message: str = f'raised in the body for {x} and {y}'
+	raise TypeError(message)
+
+def _raise_in_body(f: Any) -> None:
+	with contextlib.suppress(TypeError):
+		f(1, 2)
+
+CASES: dict[str, tuple[Any, str]] = {
+	'f(1)': (add3, 'f(1)'),
+	'f(1)(2)(3)': (add3, 'f(1)(2)(3)'),
+	'f(1, 2, 3)': (add3, 'f(1, 2, 3)'),
+	'TypeError in the body': (fails, 'raise_in_body(f)'),
+}
+
+def microseconds(module: ModuleType, decorator: str, func: Any, statement: str) -> float:
+	"""Return the microseconds per run of ``statement`` with ``f`` bound to ``func`` curried by ``module.<decorator>``."""
+	namespace: dict[str, Any] = {'f': getattr(module, decorator)(func), 'raise_in_body': _raise_in_body}
+	return min(timeit.repeat(statement, globals=namespace, repeat=REPEAT, number=NUMBER)) / NUMBER * 1e6
+
+def main() -> None:
+	"""Print the table of ``CASES`` for every build that can be imported."""
+	builds: dict[str, ModuleType] = {'Python': import_module('humpy_toolz')}
+	try:
+		builds['Cython'] = import_module('humpy_cytoolz')
+	except ImportError:
+		sys.stderr.write('humpy_cytoolz is not built; only the Python build is measured.\n')
+	sys.stdout.write(f'Min of {REPEAT} runs of {NUMBER} calls, curry -> checked_curry, in us:\n')
+	sys.stdout.write((f'{"":24}' + ''.join(f'{name:16}' for name in builds)).rstrip() + '\n')
+	for label, (func, statement) in CASES.items():
+		cells: list[str] = []
+		for module in builds.values():
+			before: float = microseconds(module, 'curry', func, statement)
+			after: float = microseconds(module, 'checked_curry', func, statement)
+			cells.append(f'{f"{before:.2f} -> {after:.2f}":16}')
+		sys.stdout.write((f'{label:24}' + ''.join(cells)).rstrip() + '\n')
+
+if __name__ == '__main__':
+	main()
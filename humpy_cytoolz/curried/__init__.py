@@ -27,7 +27,7 @@ See Also
 from . import operator
 from .exceptions import merge, merge_with
 from humpy_cytoolz import (
-	apply, comp, complement, compose, compose_left, concat, concatv, count, curry, diff, first, flip, frequencies,
+	apply, checked_curry, comp, complement, compose, compose_left, concat, concatv, count, curry, diff, first, flip, frequencies,
 	identity, interleave, isdistinct, isiterable, juxt, last, memoize, merge_sorted, peek, pipe, second, thread_first,
 	thread_last)
 import humpy_cytoolz
@@ -61,6 +61,8 @@ partition_all = humpy_cytoolz.curry(humpy_cytoolz.partition_all)
 partitionby = humpy_cytoolz.curry(humpy_cytoolz.partitionby)
 peekn = humpy_cytoolz.curry(humpy_cytoolz.peekn)
 pluck = humpy_cytoolz.curry(humpy_cytoolz.pluck)
+pmap = humpy_cytoolz.curry(humpy_cytoolz.pmap)
+prefetch = humpy_cytoolz.curry(humpy_cytoolz.prefetch)
 random_sample = humpy_cytoolz.curry(humpy_cytoolz.random_sample)
 reduce = humpy_cytoolz.curry(humpy_cytoolz.reduce)
 reduceby = humpy_cytoolz.curry(humpy_cytoolz.reduceby)
@@ -19,7 +19,12 @@ cdef class curry:
     cdef object _qualname
 
 
-cpdef object memoize(object func, object cache=*, object key=*)
+cdef class checked_curry(curry):
+    pass
+
+
+cpdef object memoize(object func, object cache=*, object key=*, object maxsize=*, object policy=*,
+                     object ttl=*, object getsizeof=*, object concurrency=*)
 
 
 cdef class _memoize:
@@ -29,6 +34,8 @@ cdef class _memoize:
     cdef bint is_unary
     cdef bint may_have_kwargs
 
+    cdef object _key(self, tuple args, dict kwargs)
+
 
 cdef class Compose:
     cdef public object first
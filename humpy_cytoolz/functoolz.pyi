@@ -1,6 +1,7 @@
 
 from collections.abc import Callable, Iterable, Mapping
-from typing import Any, overload
+from humpy_toolz.functoolz import _ArgSpec
+from typing import Any, Literal, overload
 import inspect
 
 type CurryState = tuple[Any, ...]
@@ -48,76 +49,79 @@ class InstanceProperty[Instance, T](property):
 class curry[**P, T]:
 	...
 
+class checked_curry[**P, T](curry[P, T]):
+	...
+
 def _restore_curry[**P, T](cls: type[curry[P, T]], func: str | Callable[P, T], args: tuple[Any, ...], kwargs: Mapping[str, Any] | None, userdict: Iterable[tuple[str, Any]], is_decorated: bool | None) -> curry[P, T] | Callable[P, T]:
 	...
 
 @curry
-def memoize[T](func: Callable[..., T], cache: dict[Any, T] | None = None, key: Callable[[tuple[Any, ...], Mapping[str, Any]], Any] | None = None) -> Callable[..., T]:
+def memoize[T](func: Callable[..., T], cache: dict[Any, T] | None = None, key: Callable[[tuple[Any, ...], Mapping[str, Any]], Any] | None = None, maxsize: int | None = None, policy: Literal['lru', 'lfu'] = 'lru', ttl: float | None = None, getsizeof: Callable[[T], int] | None = None, concurrency: Literal['single_flight'] | None = None) -> Callable[..., T]:
 	...
 
 class Compose:
 	...
 
 @overload
-def compose[**P, T](fn_0: Callable[P, T]) -> Callable[P, T]:
+def compose[**P, T](fn_0: Callable[P, T], *, compile: bool = False) -> Callable[P, T]:
 	...
 
 @overload
-def compose[**P, T0, T1](fn_0: Callable[[T0], T1], fn_1: Callable[P, T0]) -> Callable[P, T1]:
+def compose[**P, T0, T1](fn_0: Callable[[T0], T1], fn_1: Callable[P, T0], *, compile: bool = False) -> Callable[P, T1]:
 	...
 
 @overload
-def compose[**P, T0, T1, T2](fn_0: Callable[[T1], T2], fn_1: Callable[[T0], T1], fn_2: Callable[P, T0]) -> Callable[P, T2]:
+def compose[**P, T0, T1, T2](fn_0: Callable[[T1], T2], fn_1: Callable[[T0], T1], fn_2: Callable[P, T0], *, compile: bool = False) -> Callable[P, T2]:
 	...
 
 @overload
-def compose[**P, T0, T1, T2, T3](fn_0: Callable[[T2], T3], fn_1: Callable[[T1], T2], fn_2: Callable[[T0], T1], fn_3: Callable[P, T0]) -> Callable[P, T3]:
+def compose[**P, T0, T1, T2, T3](fn_0: Callable[[T2], T3], fn_1: Callable[[T1], T2], fn_2: Callable[[T0], T1], fn_3: Callable[P, T0], *, compile: bool = False) -> Callable[P, T3]:
 	...
 
 @overload
-def compose[**P, T0, T1, T2, T3, T4](fn_0: Callable[[T3], T4], fn_1: Callable[[T2], T3], fn_2: Callable[[T1], T2], fn_3: Callable[[T0], T1], fn_4: Callable[P, T0]) -> Callable[P, T4]:
+def compose[**P, T0, T1, T2, T3, T4](fn_0: Callable[[T3], T4], fn_1: Callable[[T2], T3], fn_2: Callable[[T1], T2], fn_3: Callable[[T0], T1], fn_4: Callable[P, T0], *, compile: bool = False) -> Callable[P, T4]:
 	...
 
 @overload
-def compose[**P, T0, T1, T2, T3, T4, T5](fn_0: Callable[[T4], T5], fn_1: Callable[[T3], T4], fn_2: Callable[[T2], T3], fn_3: Callable[[T1], T2], fn_4: Callable[[T0], T1], fn_5: Callable[P, T0]) -> Callable[P, T5]:
+def compose[**P, T0, T1, T2, T3, T4, T5](fn_0: Callable[[T4], T5], fn_1: Callable[[T3], T4], fn_2: Callable[[T2], T3], fn_3: Callable[[T1], T2], fn_4: Callable[[T0], T1], fn_5: Callable[P, T0], *, compile: bool = False) -> Callable[P, T5]:
 	...
 
 @overload
-def compose(*funcs: Callable[..., Any]) -> Callable[..., Any]:
+def compose(*funcs: Callable[..., Any], compile: bool = False) -> Callable[..., Any]:
 	...
 
-def compose(*funcs: Callable[..., Any]) -> Callable[..., Any]:
+def compose(*funcs: Callable[..., Any], compile: bool = False) -> Callable[..., Any]:
 	...
 
 @overload
-def compose_left[**P, T](fn_0: Callable[P, T]) -> Callable[P, T]:
+def compose_left[**P, T](fn_0: Callable[P, T], *, compile: bool = False) -> Callable[P, T]:
 	...
 
 @overload
-def compose_left[**P, T0, T1](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1]) -> Callable[P, T1]:
+def compose_left[**P, T0, T1](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], *, compile: bool = False) -> Callable[P, T1]:
 	...
 
 @overload
-def compose_left[**P, T0, T1, T2](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2]) -> Callable[P, T2]:
+def compose_left[**P, T0, T1, T2](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2], *, compile: bool = False) -> Callable[P, T2]:
 	...
 
 @overload
-def compose_left[**P, T0, T1, T2, T3](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2], fn_3: Callable[[T2], T3]) -> Callable[P, T3]:
+def compose_left[**P, T0, T1, T2, T3](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2], fn_3: Callable[[T2], T3], *, compile: bool = False) -> Callable[P, T3]:
 	...
 
 @overload
-def compose_left[**P, T0, T1, T2, T3, T4](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2], fn_3: Callable[[T2], T3], fn_4: Callable[[T3], T4]) -> Callable[P, T4]:
+def compose_left[**P, T0, T1, T2, T3, T4](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2], fn_3: Callable[[T2], T3], fn_4: Callable[[T3], T4], *, compile: bool = False) -> Callable[P, T4]:
 	...
 
 @overload
-def compose_left[**P, T0, T1, T2, T3, T4, T5](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2], fn_3: Callable[[T2], T3], fn_4: Callable[[T3], T4], fn_5: Callable[[T4], T5]) -> Callable[P, T5]:
+def compose_left[**P, T0, T1, T2, T3, T4, T5](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2], fn_3: Callable[[T2], T3], fn_4: Callable[[T3], T4], fn_5: Callable[[T4], T5], *, compile: bool = False) -> Callable[P, T5]:
 	...
 
 @overload
-def compose_left(*funcs: Callable[..., Any]) -> Callable[..., Any]:
+def compose_left(*funcs: Callable[..., Any], compile: bool = False) -> Callable[..., Any]:
 	...
 
-def compose_left(*funcs: Callable[..., Any]) -> Callable[..., Any]:
+def compose_left(*funcs: Callable[..., Any], compile: bool = False) -> Callable[..., Any]:
 	...
 
 @overload
@@ -170,23 +174,23 @@ def return_none(exc: Exception) -> None:
 class excepts[**P, T]:
 	...
 
-def _check_sigspec[T](sigspec: inspect.Signature | None, func: Callable[..., Any], builtin_func: Callable[..., T], *builtin_args: Any) -> tuple[inspect.Signature | None, T | bool | None]:
+def _check_sigspec[T](sigspec: inspect.Signature | _ArgSpec | None, func: Callable[..., Any], builtin_func: Callable[..., T], *builtin_args: Any) -> tuple[_ArgSpec | None, T | bool | None]:
 	...
 
-def num_required_args(func: Callable[..., Any], sigspec: inspect.Signature | None = None) -> int | None:
+def num_required_args(func: Callable[..., Any], sigspec: inspect.Signature | _ArgSpec | None = None) -> int | None:
 	...
 
-def has_varargs(func: Callable[..., Any], sigspec: inspect.Signature | None = None) -> bool | None:
+def has_varargs(func: Callable[..., Any], sigspec: inspect.Signature | _ArgSpec | None = None) -> bool | None:
 	...
 
-def has_keywords(func: Callable[..., Any], sigspec: inspect.Signature | None = None) -> bool | None:
+def has_keywords(func: Callable[..., Any], sigspec: inspect.Signature | _ArgSpec | None = None) -> bool | None:
 	...
 
-def is_valid_args(func: Callable[..., Any], args: tuple[Any, ...], kwargs: Mapping[str, Any], sigspec: inspect.Signature | None = None) -> bool | None:
+def is_valid_args(func: Callable[..., Any], args: tuple[Any, ...], kwargs: Mapping[str, Any], sigspec: inspect.Signature | _ArgSpec | None = None) -> bool | None:
 	...
 
-def is_partial_args(func: Callable[..., Any], args: tuple[Any, ...], kwargs: Mapping[str, Any], sigspec: inspect.Signature | None = None) -> bool | None:
+def is_partial_args(func: Callable[..., Any], args: tuple[Any, ...], kwargs: Mapping[str, Any], sigspec: inspect.Signature | _ArgSpec | None = None) -> bool | None:
 	...
 
-def is_arity(n: int, func: Callable[..., Any], sigspec: inspect.Signature | None = None) -> bool | None:
+def is_arity(n: int, func: Callable[..., Any], sigspec: inspect.Signature | _ArgSpec | None = None) -> bool | None:
 	...
@@ -7,7 +7,7 @@ import humpy_cytoolz._signatures as _sigs
 
 from humpy_toolz.functoolz import (InstanceProperty, instanceproperty, is_arity,
                              num_required_args, has_varargs, has_keywords,
-                             is_valid_args, is_partial_args)
+                             is_valid_args, is_partial_args, _argspec, _ArgSpec)
 
 cimport cython
 from cpython.dict cimport PyDict_Merge, PyDict_New
@@ -36,17 +36,24 @@ del operator
 cdef object MethodType = types.MethodType
 del types
 
+from humpy_toolz import _caches
+cdef object _memoize_cache = _caches.memoize_cache
+cdef object _cache_info = _caches.cache_info
+cdef object _single_flight = _caches.single_flight
+del _caches
+
 cdef object _is_arity = is_arity
 cdef object _has_varargs = has_varargs
 cdef object _has_keywords = has_keywords
 cdef object _is_valid_args = is_valid_args
 cdef object _is_partial_args = is_partial_args
 cdef object _no_default = no_default
-cdef object _signature_or_spec = _sigs.signature_or_spec
+cdef object _signature_of = _argspec
+cdef object _ArgSpecType = _ArgSpec
 
 
 __all__ = ['identity', 'thread_first', 'thread_last', 'memoize', 'compose', 'compose_left',
-           'pipe', 'complement', 'juxt', 'do', 'curry', 'memoize', 'flip',
+           'pipe', 'complement', 'juxt', 'do', 'curry', 'checked_curry', 'memoize', 'flip',
            'excepts', 'apply']
 
 
@@ -321,7 +328,7 @@ cdef class curry:
         #    kwargs = dict(self.keywords, **kwargs)
 
         if self._sigspec is None:
-            sigspec = self._sigspec = _signature_or_spec(func)
+            sigspec = self._sigspec = _signature_of(func)
             self._has_unknown_args = _has_varargs(func, sigspec) is not False
         else:
             sigspec = self._sigspec
@@ -425,6 +432,53 @@ cdef class curry:
         return (_restore_curry, state)
 
 
+cdef class checked_curry(curry):
+    """Curry a callable function, deciding before each call whether the arguments are complete
+
+	``curry`` calls the function first and, if the call raises ``TypeError``,
+	inspects the signature to decide whether to curry.  ``checked_curry`` checks
+	the arguments against the signature before the call, so a partial
+	application never raises and catches an exception, and a ``TypeError``
+	raised inside the function reaches the caller without a signature check.
+
+	>>> @checked_curry
+	... def mul(x, y):
+	...     return x * y
+	>>> double = mul(2)
+	>>> double(10)
+	20
+
+	A call with every argument costs a little more than with ``curry``.  A
+	function with ``*args``, or without a signature, is curried as by ``curry``.
+
+	See Also
+	--------
+		curry
+	"""
+
+    def __call__(self, *args, **kwargs):
+        cdef object sigspec = self._sigspec
+        cdef curry curried
+
+        if sigspec is None:
+            sigspec = self._sigspec = _signature_of(self.func)
+            self._has_unknown_args = _has_varargs(self.func, sigspec) is not False
+        if type(sigspec) is not _ArgSpecType or sigspec.varargs:
+            return curry.__call__(self, *args, **kwargs)
+        if PyTuple_GET_SIZE(args) == 0:
+            args = self.args
+        elif PyTuple_GET_SIZE(self.args) != 0:
+            args = PySequence_Concat(self.args, args)
+        if self.keywords is not None:
+            PyDict_Merge(kwargs, self.keywords, False)
+        if sigspec.bind(args, kwargs) or not sigspec.bind(args, kwargs, partial=True):
+            return self.func(*args, **kwargs)
+        curried = <curry>type(self)(self.func, *args, **kwargs)
+        curried._sigspec = sigspec
+        curried._has_unknown_args = False
+        return curried
+
+
 cpdef object _restore_curry(cls, func, args, kwargs, is_decorated):
     if isinstance(func, str):
         modname, qualname = func.rsplit(':', 1)
@@ -438,7 +492,8 @@ cpdef object _restore_curry(cls, func, args, kwargs, is_decorated):
     return obj
 
 
-cpdef object memoize(object func, object cache=None, object key=None):
+cpdef object memoize(object func, object cache=None, object key=None, object maxsize=None, object policy='lru',
+                     object ttl=None, object getsizeof=None, object concurrency=None):
     """Cache a function's result for speedy future evaluation
 
 	Considerations:
@@ -474,7 +529,34 @@ cpdef object memoize(object func, object cache=None, object key=None):
 	...     if verbose:
 	...         print('Calculating %s + %s' % (x, y))
 	...     return x + y
+
+	By default the cache grows without bound. With ``maxsize``, it holds at
+	most ``maxsize`` results and evicts the least recently used one first, or,
+	with ``policy='lfu'``, the least frequently used one. With ``getsizeof``, a
+	function such as ``sys.getsizeof``, ``maxsize`` bounds the total
+	``getsizeof`` of the results instead of their number. With ``ttl``, a result
+	expires ``ttl`` seconds after it was computed. These options make a new
+	cache, so they cannot be combined with ``cache``, and its hits, misses,
+	and evictions are counted by ``cache_info``.
+
+	>>> @memoize(maxsize=2)
+	... def double(x):
+	...     return 2 * x
+	>>> [double(x) for x in [1, 2, 1, 3, 2]]
+	[2, 4, 2, 6, 4]
+	>>> double.cache_info()
+	CacheInfo(hits=1, misses=4, evictions=2, maxsize=2, currsize=2)
+
+	By default, concurrent calls with the same uncached arguments each call
+	the function. With ``concurrency='single_flight'``, the first call computes
+	the result while the others wait for it, so a cold cache under many threads
+	calls the function once per key; an exception reaches every waiting call
+	and is not cached. If the function is a coroutine function, the memoized
+	function is too, and the waiting is done by the tasks of the event loop.
 	"""
+    cache = _memoize_cache(cache, maxsize, policy, ttl, getsizeof)
+    if concurrency is not None:
+        return _single_flight(func, cache, _memoize(func, cache, key).cache_key, concurrency)
     return _memoize(func, cache, key)
 
 
@@ -508,24 +590,36 @@ cdef class _memoize:
             self.is_unary = False
             self.may_have_kwargs = True
 
-    def __call__(self, *args, **kwargs):
-        cdef object key
+    cdef object _key(self, tuple args, dict kwargs):
         if self.key is not None:
-            key = self.key(args, kwargs)
+            return self.key(args, kwargs)
         elif self.is_unary:
-            key = args[0]
+            return args[0]
         elif self.may_have_kwargs:
-            key = (args or None,
-                   PyFrozenSet_New(kwargs.items()) if kwargs else None)
+            return (args or None,
+                    PyFrozenSet_New(kwargs.items()) if kwargs else None)
         else:
-            key = args
+            return args
 
-        if key in self.cache:
-            return self.cache[key]
-        else:
+    def cache_key(self, args, kwargs):
+        """The key of ``args`` and ``kwargs`` in the cache, for ``memoize(..., concurrency='single_flight')``."""
+        return self._key(args, kwargs)
+
+    def __call__(self, *args, **kwargs):
+        cdef object key = self._key(args, kwargs)
+        # One lookup that raises `KeyError` on a miss, instead of `in` and then `[]`, so an entry of a bounded cache
+        # cannot expire between the two.
+        try:
+            result = self.cache[key]
+        except KeyError:
             result = PyObject_Call(self.func, args, kwargs)
             self.cache[key] = result
             return result
+        return result
+
+    def cache_info(self):
+        """Report the hits, misses, and evictions of the cache, its ``maxsize``, and its current size."""
+        return _cache_info(self.cache)
 
     def __get__(self, instance, owner):
         if instance is None:
@@ -632,7 +726,7 @@ cdef object c_compose(object funcs):
         return Compose(*funcs)
 
 
-def compose(*funcs):
+def compose(*funcs, compile=False):
     """Compose functions to operate in series.
 
 	Returns a function that applies other functions in sequence.
@@ -646,11 +740,17 @@ def compose(*funcs):
 	>>> compose(str, inc)(3)
 	'4'
 
+	With ``compile=True``, the composition calls its functions without the
+	per-call overhead of a loop, which matters for compositions that are called
+	many times. It is equal to, hashes like, and pickles like the composition
+	without ``compile``.
+
 	See Also
 	--------
 		compose_left
 		pipe
 	"""
+    # `Compose.__call__` loops over `funcs` in C, which leaves no interpreter overhead for `compile` to remove.
     return c_compose(funcs)
 
 
@@ -663,7 +763,7 @@ cdef object c_compose_left(object funcs):
         return Compose(*reversed(funcs))
 
 
-def compose_left(*funcs):
+def compose_left(*funcs, compile=False):
     """Compose functions to operate in series.
 
 	Returns a function that applies other functions in sequence.
@@ -677,6 +777,8 @@ def compose_left(*funcs):
 	>>> compose_left(inc, str)(3)
 	'4'
 
+	``compile=True`` is as in ``compose``.
+
 	See Also
 	--------
 		compose
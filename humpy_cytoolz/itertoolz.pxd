@@ -10,7 +10,10 @@ cdef class accumulate:
     cdef object initial
 
 
-cpdef dict groupby(object key, object seq)
+cpdef object groupby(object key, object seq, object max_memory=*)
+
+
+cdef dict _groupby(object key, object seq)
 
 
 cdef class _merge_sorted:
@@ -31,6 +34,20 @@ cdef class _merge_sorted_key:
     cdef Py_ssize_t loop
 
 
+cdef class _merge_sorted_loser_tree:
+    cdef list iters
+    cdef list values
+    cdef list keys
+    cdef object key
+    cdef Py_ssize_t size
+    cdef Py_ssize_t winner
+    cdef Py_ssize_t *tree
+    cdef bint pending
+
+    cdef int _build(self) except -1
+    cdef int _advance(self) except -1
+
+
 cdef object c_merge_sorted(object seqs, object key=*)
 
 
@@ -52,7 +69,20 @@ cdef class _unique_identity:
     cdef object seen
 
 
-cpdef object unique(object seq, object key=*)
+cdef class _unique_seen_key:
+    cdef object key
+    cdef object iter_seq
+    cdef object contains
+    cdef object add
+
+
+cdef class _unique_seen_identity:
+    cdef object iter_seq
+    cdef object contains
+    cdef object add
+
+
+cpdef object unique(object seq, object key=*, object seen=*)
 
 
 cpdef object isiterable(object x)
@@ -121,17 +151,24 @@ cdef class iterate:
 
 cdef class sliding_window:
     cdef object iterseq
+    cdef object views
     cdef tuple prev
     cdef Py_ssize_t n
 
 
-cpdef object partition(Py_ssize_t n, object seq, object pad=*)
+cpdef object partition(Py_ssize_t n, object seq, object pad=*, bint view=*)
 
 
 cdef class partition_all:
     cdef Py_ssize_t n
     cdef object iterseq
     cdef object seq
+    cdef object views
+    cdef list buffer
+    cdef Py_ssize_t start
+
+    cdef tuple _slice(self)
+    cdef list _refill(self)
 
 
 cpdef object count(object seq)
@@ -183,7 +220,9 @@ cpdef object getter(object index)
 cpdef object join(object leftkey, object leftseq,
                   object rightkey, object rightseq,
                   object left_default=*,
-                  object right_default=*)
+                  object right_default=*,
+                  object strategy=*,
+                  object max_memory=*)
 
 cdef class _join:
     cdef dict d
@@ -280,3 +319,4 @@ cdef class random_sample:
     cdef object iter_seq
     cdef object prob
     cdef object random_func
+    cdef bint skip
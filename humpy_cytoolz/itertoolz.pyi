@@ -1,11 +1,11 @@
 
 from collections.abc import Callable, Collection, Hashable, ItemsView, Iterable, Iterator, KeysView, Mapping, Sequence, ValuesView
-from humpy_toolz._theTypes import Randomable, SupportsDunderLT, SupportsGetItem, SupportsRichComparison
+from humpy_toolz._theTypes import JoinStrategy, Randomable, SupportsAddContains, SupportsDunderLT, SupportsGetItem, SupportsRichComparison
 from humpy_toolz.utils import no_default
 from typing import Any, Literal, overload
 from typing_extensions import TypeIs
 
-__all__ = ('accumulate', 'concat', 'concatv', 'cons', 'count', 'diff', 'drop', 'first', 'frequencies', 'get', 'groupby', 'interleave', 'interpose', 'isdistinct', 'isiterable', 'iterate', 'join', 'last', 'mapcat', 'merge_sorted', 'nth', 'partition', 'partition_all', 'peek', 'peekn', 'pluck', 'random_sample', 'reduceby', 'remove', 'second', 'sliding_window', 'tail', 'take', 'take_nth', 'topk', 'unique')
+__all__ = ('accumulate', 'concat', 'concatv', 'cons', 'count', 'diff', 'drop', 'first', 'frequencies', 'get', 'groupby', 'interleave', 'interpose', 'isdistinct', 'isiterable', 'iterate', 'join', 'last', 'mapcat', 'merge_sorted', 'nth', 'partition', 'partition_all', 'peek', 'peekn', 'pluck', 'pmap', 'prefetch', 'random_sample', 'reduceby', 'remove', 'second', 'sliding_window', 'tail', 'take', 'take_nth', 'topk', 'unique')
 no_pad: Literal['__no__pad__']
 
 def getter[T, V](index: T | Sequence[T]) -> Callable[[SupportsGetItem[T, V]], V | tuple[V, ...]]:
@@ -73,14 +73,22 @@ def get[T, V](ind: T | Sequence[T], seq: SupportsGetItem[T, V], default: V | Lit
     ...
 
 @overload
-def groupby[T, K: Hashable](key: Callable[[T], K], seq: Iterable[T]) -> dict[K, list[T]]:
+def groupby[T, K: Hashable](key: Callable[[T], K], seq: Iterable[T], max_memory: None = None) -> dict[K, list[T]]:
     ...
 
 @overload
-def groupby[K: Hashable, T](key: K, seq: Iterable[T]) -> dict[K, list[T]]:
+def groupby[K: Hashable, T](key: K, seq: Iterable[T], max_memory: None = None) -> dict[K, list[T]]:
     ...
 
-def groupby[T, K: Hashable](key: Callable[[T], K] | K, seq: Iterable[T]) -> dict[K, list[T]]:
+@overload
+def groupby[T, K: Hashable](key: Callable[[T], K], seq: Iterable[T], max_memory: int) -> Iterator[tuple[K, list[T]]]:
+    ...
+
+@overload
+def groupby[K: Hashable, T](key: K, seq: Iterable[T], max_memory: int) -> Iterator[tuple[K, list[T]]]:
+    ...
+
+def groupby[T, K: Hashable](key: Callable[[T], K] | K, seq: Iterable[T], max_memory: int | None = None) -> dict[K, list[T]] | Iterator[tuple[K, list[T]]]:
     ...
 
 def interleave[T](seqs: Iterable[Iterable[T]]) -> Iterator[T]:
@@ -107,70 +115,70 @@ def iterate[T](func: Callable[[T], T], x: T) -> Iterator[T]:
     ...
 
 @overload
-def join[T, U](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U]) -> Iterator[tuple[T, U]]:
+def join[T, U](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], *, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T, U]]:
     ...
 
 @overload
-def join[T, U, L](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], left_default: L) -> Iterator[tuple[T | L, U]]:
+def join[T, U, L](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], left_default: L, *, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T | L, U]]:
     ...
 
 @overload
-def join[T, U, R](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], *, right_default: R) -> Iterator[tuple[T, U | R]]:
+def join[T, U, R](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], *, right_default: R, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T, U | R]]:
     ...
 
 @overload
-def join[T, U, L, R](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], left_default: L, right_default: R) -> Iterator[tuple[T | L, U | R]]:
+def join[T, U, L, R](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], left_default: L, right_default: R, *, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T | L, U | R]]:
     ...
 
 @overload
-def join[T, U](leftkey: Hashable, leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U]) -> Iterator[tuple[T, U]]:
+def join[T, U](leftkey: Hashable, leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], *, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T, U]]:
     ...
 
 @overload
-def join[T, U, L](leftkey: Hashable, leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], left_default: L) -> Iterator[tuple[T | L, U]]:
+def join[T, U, L](leftkey: Hashable, leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], left_default: L, *, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T | L, U]]:
     ...
 
 @overload
-def join[T, U, R](leftkey: Hashable, leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], *, right_default: R) -> Iterator[tuple[T, U | R]]:
+def join[T, U, R](leftkey: Hashable, leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], *, right_default: R, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T, U | R]]:
     ...
 
 @overload
-def join[T, U, L, R](leftkey: Hashable, leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], left_default: L, right_default: R) -> Iterator[tuple[T | L, U | R]]:
+def join[T, U, L, R](leftkey: Hashable, leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], left_default: L, right_default: R, *, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T | L, U | R]]:
     ...
 
 @overload
-def join[T, U](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U]) -> Iterator[tuple[T, U]]:
+def join[T, U](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], *, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T, U]]:
     ...
 
 @overload
-def join[T, U, L](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], left_default: L) -> Iterator[tuple[T | L, U]]:
+def join[T, U, L](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], left_default: L, *, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T | L, U]]:
     ...
 
 @overload
-def join[T, U, R](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], *, right_default: R) -> Iterator[tuple[T, U | R]]:
+def join[T, U, R](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], *, right_default: R, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T, U | R]]:
     ...
 
 @overload
-def join[T, U, L, R](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], left_default: L, right_default: R) -> Iterator[tuple[T | L, U | R]]:
+def join[T, U, L, R](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], left_default: L, right_default: R, *, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T | L, U | R]]:
     ...
 
 @overload
-def join[T, U](leftkey: Hashable, leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U]) -> Iterator[tuple[T, U]]:
+def join[T, U](leftkey: Hashable, leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], *, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T, U]]:
     ...
 
 @overload
-def join[T, U, L](leftkey: Hashable, leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], left_default: L) -> Iterator[tuple[T | L, U]]:
+def join[T, U, L](leftkey: Hashable, leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], left_default: L, *, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T | L, U]]:
     ...
 
 @overload
-def join[T, U, R](leftkey: Hashable, leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], *, right_default: R) -> Iterator[tuple[T, U | R]]:
+def join[T, U, R](leftkey: Hashable, leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], *, right_default: R, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T, U | R]]:
     ...
 
 @overload
-def join[T, U, L, R](leftkey: Hashable, leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], left_default: L, right_default: R) -> Iterator[tuple[T | L, U | R]]:
+def join[T, U, L, R](leftkey: Hashable, leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], left_default: L, right_default: R, *, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T | L, U | R]]:
     ...
 
-def join[T, U, L, R](leftkey: Callable[[T], Hashable] | Hashable, leftseq: Iterable[T], rightkey: Callable[[U], Hashable] | Hashable, rightseq: Iterable[U], left_default: L | Literal['__no__default__'] = no_default, right_default: R | Literal['__no__default__'] = no_default) -> Iterator[tuple[T | L, U | R]]:
+def join[T, U, L, R](leftkey: Callable[[T], Hashable] | Hashable, leftseq: Iterable[T], rightkey: Callable[[U], Hashable] | Hashable, rightseq: Iterable[U], left_default: L | Literal['__no__default__'] = no_default, right_default: R | Literal['__no__default__'] = no_default, *, strategy: JoinStrategy = 'auto', max_memory: int | None = None) -> Iterator[tuple[T | L, U | R]]:
     ...
 
 def last[T](seq: Iterable[T]) -> T:
@@ -186,23 +194,32 @@ def _merge_sorted_binary_key[T](seqs: Sequence[Iterable[T]], key: Callable[[T],
     ...
 
 @overload
-def merge_sorted[TSupportsRichComparison: SupportsRichComparison](*seqs: Iterable[TSupportsRichComparison], key: None = None) -> Iterator[TSupportsRichComparison]:
+def merge_sorted[TSupportsRichComparison: SupportsRichComparison](*seqs: Iterable[TSupportsRichComparison], key: None = None, prefetch: int | None = None) -> Iterator[TSupportsRichComparison]:
     ...
 
 @overload
-def merge_sorted[T](*seqs: Iterable[T], key: Callable[[T], SupportsDunderLT[Any]]) -> Iterator[T]:
+def merge_sorted[T](*seqs: Iterable[T], key: Callable[[T], SupportsDunderLT[Any]], prefetch: int | None = None) -> Iterator[T]:
     ...
 
-def merge_sorted[T](*seqs: Iterable[T], key: Callable[[T], SupportsDunderLT[Any]] | None = None) -> Iterator[T]:
+def merge_sorted[T](*seqs: Iterable[T], key: Callable[[T], SupportsDunderLT[Any]] | None = None, prefetch: int | None = None) -> Iterator[T]:
     ...
 
 def nth[T](n: int, seq: Iterable[T]) -> T:
     ...
 
-def partition[T, L](n: int, seq: Iterable[T], pad: L | Literal['__no__pad__'] = no_pad) -> Iterator[tuple[T, ...]] | Iterator[tuple[T | L, ...]]:
+def partition[T, L](n: int, seq: Iterable[T], pad: L | Literal['__no__pad__'] = no_pad, *, view: bool = False) -> Iterator[tuple[T, ...]] | Iterator[tuple[T | L, ...]]:
+    ...
+
+@overload
+def partition_all[T](n: int, seq: Iterable[T], *, view: Literal[False] = False, reuse: Literal[False] = False) -> Iterator[tuple[T, ...]]:
+    ...
+
+@overload
+def partition_all[T](n: int, seq: Iterable[T], *, view: Literal[False] = False, reuse: Literal[True]) -> Iterator[list[T]]:
     ...
 
-def partition_all[T](n: int, seq: Iterable[T]) -> Iterator[tuple[T, ...]]:
+@overload
+def partition_all(n: int, seq: Any, *, view: Literal[True], reuse: Literal[False] = False) -> Iterator[Any]:
     ...
 
 def peek[T](seq: Iterable[T]) -> tuple[T, Iterator[T]]:
@@ -222,7 +239,13 @@ def pluck[T](ind: Any, seqs: Iterable[Sequence[T] | Mapping[Any, T]], default: T
 def pluck[T](ind: Any | list[Any], seqs: Iterable[Sequence[T] | Mapping[Any, T]], default: T | Literal['__no__default__'] = no_default) -> Iterator[T] | Iterator[tuple[T, ...]]:
     ...
 
-def random_sample[T](prob: float, seq: Iterable[T], random_state: Randomable | int | float | str | bytes | bytearray | None = None) -> Iterator[T]:
+def pmap[T, R](func: Callable[[T], R], seq: Iterable[T], *, ordered: bool = True, max_inflight: int | None = None, workers: int | None = None) -> Iterator[R]:
+    ...
+
+def prefetch[T](n: int, seq: Iterable[T]) -> Iterator[T]:
+    ...
+
+def random_sample[T](prob: float, seq: Iterable[T], random_state: Randomable | int | float | str | bytes | bytearray | None = None, *, skip: bool = False) -> Iterator[T]:
     ...
 
 @overload
@@ -251,30 +274,34 @@ def second[T](seq: Iterable[T]) -> T:
     ...
 
 @overload
-def sliding_window[T](n: Literal[1], seq: Iterable[T]) -> Iterator[tuple[T]]:
+def sliding_window[T](n: Literal[1], seq: Iterable[T], *, view: Literal[False] = False) -> Iterator[tuple[T]]:
+    ...
+
+@overload
+def sliding_window[T](n: Literal[2], seq: Iterable[T], *, view: Literal[False] = False) -> Iterator[tuple[T, T]]:
     ...
 
 @overload
-def sliding_window[T](n: Literal[2], seq: Iterable[T]) -> Iterator[tuple[T, T]]:
+def sliding_window[T](n: Literal[3], seq: Iterable[T], *, view: Literal[False] = False) -> Iterator[tuple[T, T, T]]:
     ...
 
 @overload
-def sliding_window[T](n: Literal[3], seq: Iterable[T]) -> Iterator[tuple[T, T, T]]:
+def sliding_window[T](n: Literal[4], seq: Iterable[T], *, view: Literal[False] = False) -> Iterator[tuple[T, T, T, T]]:
     ...
 
 @overload
-def sliding_window[T](n: Literal[4], seq: Iterable[T]) -> Iterator[tuple[T, T, T, T]]:
+def sliding_window[T](n: Literal[5], seq: Iterable[T], *, view: Literal[False] = False) -> Iterator[tuple[T, T, T, T, T]]:
     ...
 
 @overload
-def sliding_window[T](n: Literal[5], seq: Iterable[T]) -> Iterator[tuple[T, T, T, T, T]]:
+def sliding_window[T](n: int, seq: Iterable[T], *, view: Literal[False] = False) -> Iterator[tuple[T, ...]]:
     ...
 
 @overload
-def sliding_window[T](n: int, seq: Iterable[T]) -> Iterator[tuple[T, ...]]:
+def sliding_window(n: int, seq: Any, *, view: Literal[True]) -> Iterator[Any]:
     ...
 
-def sliding_window(n: int, seq: Iterable[Any]) -> Iterator[tuple[Any, ...]]:
+def sliding_window(n: int, seq: Iterable[Any], *, view: bool = False) -> Iterator[tuple[Any, ...]] | Iterator[Any]:
     ...
 
 @overload
@@ -333,5 +360,5 @@ def topk[T](k: int, seq: Iterable[T], key: Callable[[T], Any] | None = None) ->
 def topk(k: int, seq: Iterable[Any], key: Callable[[Any], Any] | None = None) -> tuple[Any, ...]:
     ...
 
-def unique[T](seq: Iterable[T], key: Callable[[T], Any] | None = None) -> Iterator[T]:
+def unique[T](seq: Iterable[T], key: Callable[[T], Any] | None = None, seen: SupportsAddContains[Any] | None = None) -> Iterator[T]:
     ...
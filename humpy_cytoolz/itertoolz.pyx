@@ -4,7 +4,8 @@
 from cpython.dict cimport PyDict_GetItem, PyDict_SetItem
 from cpython.exc cimport PyErr_Clear, PyErr_GivenExceptionMatches, PyErr_Occurred
 from cpython.list cimport PyList_Append, PyList_GET_ITEM, PyList_GET_SIZE
-from cpython.object cimport PyObject_RichCompareBool, Py_NE
+from cpython.mem cimport PyMem_Free, PyMem_Malloc
+from cpython.object cimport PyObject_RichCompareBool, Py_LT, Py_NE
 from cpython.ref cimport PyObject, Py_INCREF, Py_XDECREF
 from cpython.sequence cimport PySequence_Check
 from cpython.set cimport PySet_Add, PySet_Contains
@@ -18,6 +19,7 @@ import heapq
 import itertools
 import operator
 from humpy_cytoolz import utils
+from humpy_toolz import _buffers, _prefetch, _sampling, _spill, _vectorized
 
 # cdef aliases to eliminate global lookups
 cdef object deque = collections.deque
@@ -29,6 +31,7 @@ cdef object heapreplace = heapq.heapreplace
 del heapq
 
 cdef object chain = itertools.chain
+cdef object itertools_groupby = itertools.groupby
 cdef object islice = itertools.islice
 cdef object zip_longest = itertools.zip_longest
 del itertools
@@ -39,13 +42,37 @@ del operator
 cdef object no_default = utils.no_default
 del utils
 
+cdef object partition_all_views = _buffers.partition_all_views
+cdef object partition_views = _buffers.partition_views
+cdef object sliding_window_views = _buffers.sliding_window_views
+del _buffers
+
+cdef object check_batchsize = _prefetch.check_batchsize
+cdef object parallel_map = _prefetch.parallel_map
+cdef object prefetched_merge = _prefetch.prefetched_merge
+cdef object read_ahead = _prefetch.read_ahead
+del _prefetch
+
+cdef object skip_sample = _sampling.skip_sample
+del _sampling
+
+cdef object grace_join = _spill.grace_join
+cdef object spilling_groupby = _spill.spilling_groupby
+del _spill
+
+cdef object vectorized_frequencies = _vectorized.vectorized_frequencies
+cdef object vectorized_groupby = _vectorized.vectorized_groupby
+cdef object vectorized_reduceby = _vectorized.vectorized_reduceby
+del _vectorized
+
 
 __all__ = ['remove', 'accumulate', 'groupby', 'merge_sorted', 'interleave',
            'unique', 'isiterable', 'isdistinct', 'take', 'drop', 'take_nth',
            'first', 'second', 'nth', 'last', 'get', 'concat', 'concatv',
            'mapcat', 'cons', 'interpose', 'frequencies', 'reduceby', 'iterate',
            'sliding_window', 'partition', 'partition_all', 'count', 'pluck',
-           'join', 'tail', 'diff', 'topk', 'peek', 'peekn', 'random_sample']
+           'join', 'tail', 'diff', 'topk', 'peek', 'peekn', 'pmap', 'prefetch',
+           'random_sample']
 
 
 cpdef object identity(object x):
@@ -133,7 +160,7 @@ cdef inline object _groupby_core(dict d, object key, object item):
         PyList_Append(<object>obj, item)
 
 
-cpdef dict groupby(object key, object seq):
+cpdef object groupby(object key, object seq, object max_memory=None):
     """Group a collection by a key function
 
 	>>> names = ['Alice', 'Bob', 'Charlie', 'Dan', 'Edith', 'Frank']
@@ -153,12 +180,39 @@ cpdef dict groupby(object key, object seq):
 	 'M': [{'gender': 'M', 'name': 'Bob'},
 		   {'gender': 'M', 'name': 'Charlie'}]}
 
+	With ``max_memory``, a number of bytes, ``groupby`` returns a lazy
+	iterator of ``(key, group)`` pairs instead of a dict. When the estimated
+	size of the groups exceeds ``max_memory``, the groups are partitioned into
+	hash buckets that are pickled to temporary files, and the pairs are then
+	yielded bucket by bucket. Keys and items must be picklable, the items of
+	each group keep the order of ``seq``, and the order of the groups is
+	arbitrary. The temporary files are removed when the iterator is exhausted
+	or closed.
+
+	>>> sorted(groupby(iseven, [1, 2, 3, 4, 5, 6, 7, 8], max_memory=2**20))
+	[(False, [1, 3, 5, 7]), (True, [2, 4, 6, 8])]
+
+	If ``seq`` is a one-dimensional NumPy array and ``key`` is a unary ufunc,
+	or ``seq`` is a structured array and ``key`` names fields of it, NumPy
+	computes and sorts the keys, and the keys are Python scalars or tuples.
+
 	Not to be confused with ``itertools.groupby``
 
 	See Also
 	--------
 		countby
 	"""
+    if max_memory is not None:
+        if not callable(key):
+            key = getter(key)
+        return spilling_groupby(key, seq, max_memory)
+    cdef object vectorized = vectorized_groupby(key, seq)
+    if vectorized is not None:
+        return vectorized
+    return _groupby(key, seq)
+
+
+cdef dict _groupby(object key, object seq):
     cdef dict d = {}
     cdef object item, keyval
     cdef Py_ssize_t i, N
@@ -300,6 +354,122 @@ cdef class _merge_sorted_key:
         return next(self.seq1)
 
 
+cdef object _exhausted = object()
+
+# Fewest iterables that `c_merge_sorted` merges by key with `_merge_sorted_loser_tree` instead of a tree of binary merges.
+# Without a key, the binary merges compare as often and are faster.
+cdef Py_ssize_t LOSER_TREE_FAN_IN = 8
+
+
+cdef class _merge_sorted_loser_tree:
+    """ Merge many sorted iterables by key with a tree of losers
+
+    Leaf ``i`` of the tree holds the current key of the ``i``-th iterable
+    and every internal node holds the loser of the match between the winners
+    of its two subtrees, so replacing the overall winner replays only the
+    ``log2(n)`` matches on the path from its leaf to the root, and ``key``
+    is called once per item rather than once per level of binary merges.
+    Ties go to the iterable with the lower index, which keeps the merge
+    stable.  An exhausted iterable is removed and the tree is rebuilt, so
+    the matches never test for exhaustion.
+    """
+    def __cinit__(self, object seqs, object key):
+        self.key = key
+        self.iters = []
+        self.values = []
+        for seq in seqs:
+            it = iter(seq)
+            val = next(it, _exhausted)
+            if val is not _exhausted:
+                self.iters.append(it)
+                self.values.append(val)
+        self.keys = [key(val) for val in self.values]
+        self.size = len(self.values)
+        self.tree = <Py_ssize_t*>PyMem_Malloc(max(self.size, 1) * sizeof(Py_ssize_t))
+        if self.tree is NULL:
+            raise MemoryError()
+        self.pending = False
+        self._build()
+
+    def __dealloc__(self):
+        PyMem_Free(self.tree)
+
+    cdef int _build(self) except -1:
+        cdef Py_ssize_t node, left, right, low, high
+        cdef Py_ssize_t size = self.size
+        cdef Py_ssize_t *winners
+        if size <= 1:
+            self.winner = 0
+            return 0
+        winners = <Py_ssize_t*>PyMem_Malloc(2 * size * sizeof(Py_ssize_t))
+        if winners is NULL:
+            raise MemoryError()
+        try:
+            for node in range(size):
+                winners[size + node] = node
+            for node in range(size - 1, 0, -1):
+                left = winners[2 * node]
+                right = winners[2 * node + 1]
+                if left < right:
+                    low, high = left, right
+                else:
+                    low, high = right, left
+                if PyObject_RichCompareBool(<object>PyList_GET_ITEM(self.keys, high),
+                                            <object>PyList_GET_ITEM(self.keys, low), Py_LT):
+                    winners[node] = high
+                    self.tree[node] = low
+                else:
+                    winners[node] = low
+                    self.tree[node] = high
+            self.winner = winners[1]
+        finally:
+            PyMem_Free(winners)
+        return 0
+
+    cdef int _advance(self) except -1:
+        cdef Py_ssize_t node, challenger
+        cdef Py_ssize_t winner = self.winner
+        cdef bint beats
+        cdef list keys
+        val = next(<object>PyList_GET_ITEM(self.iters, winner), _exhausted)
+        if val is _exhausted:
+            del self.iters[winner]
+            del self.values[winner]
+            del self.keys[winner]
+            self.size -= 1
+            return self._build()
+        self.values[winner] = val
+        self.keys[winner] = self.key(val)
+        keys = self.keys
+        node = (self.size + winner) >> 1
+        while node:
+            challenger = self.tree[node]
+            if challenger < winner:
+                beats = not PyObject_RichCompareBool(<object>PyList_GET_ITEM(keys, winner),
+                                                     <object>PyList_GET_ITEM(keys, challenger), Py_LT)
+            else:
+                beats = PyObject_RichCompareBool(<object>PyList_GET_ITEM(keys, challenger),
+                                                 <object>PyList_GET_ITEM(keys, winner), Py_LT)
+            if beats:
+                self.tree[node] = winner
+                winner = challenger
+            node >>= 1
+        self.winner = winner
+        return 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.pending:
+            self.pending = False
+            self._advance()
+        if self.size == 0:
+            raise StopIteration
+        self.pending = True
+        return <object>PyList_GET_ITEM(self.values, self.winner)
+
+
 cdef object c_merge_sorted(object seqs, object key=None):
     if len(seqs) == 0:
         return iter([])
@@ -307,6 +477,8 @@ cdef object c_merge_sorted(object seqs, object key=None):
         return iter(seqs[0])
     elif key is None:
         return _merge_sorted_binary(seqs)
+    elif len(seqs) >= LOSER_TREE_FAN_IN:
+        return _merge_sorted_loser_tree(seqs, key)
     return _merge_sorted_binary_key(seqs, key)
 
 
@@ -325,10 +497,26 @@ def merge_sorted(*seqs, **kwargs):
 
 	>>> list(merge_sorted([2, 3], [1, 3], key=lambda x: x // 3))
 	[2, 1, 3, 3]
+
+	Items that compare equal come out in the order of the collections that
+	hold them.  If ``prefetch`` is a number of items, a pool of background
+	threads reads every collection ahead in batches of ``prefetch`` items,
+	so that slow inputs, such as sorted runs in files, are read while the
+	merge runs; up to two batches of each collection are then in memory.
+
+	>>> list(merge_sorted([1, 4], [2, 3], prefetch=64))
+	[1, 2, 3, 4]
+
+	Many collections with a "key" function are merged with a tree of
+	losers, which calls "key" once per item instead of once per level of
+	binary merges.
 	"""
-    if 'key' in kwargs:
-        return c_merge_sorted(seqs, kwargs['key'])
-    return c_merge_sorted(seqs)
+    key = kwargs.get('key')
+    prefetch = kwargs.get('prefetch')
+    if prefetch is not None:
+        check_batchsize(prefetch)
+        return prefetched_merge(lambda runs: c_merge_sorted(runs, key), seqs, prefetch)
+    return c_merge_sorted(seqs, key)
 
 
 cdef class interleave:
@@ -399,10 +587,10 @@ cdef class interleave:
 
 
 cdef class _unique_key:
-    def __cinit__(self, object seq, object key):
+    def __cinit__(self, object seq, object key, set seen):
         self.iter_seq = iter(seq)
         self.key = key
-        self.seen = set()
+        self.seen = seen
 
     def __iter__(self):
         return self
@@ -419,9 +607,9 @@ cdef class _unique_key:
 
 
 cdef class _unique_identity:
-    def __cinit__(self, object seq):
+    def __cinit__(self, object seq, set seen):
         self.iter_seq = iter(seq)
-        self.seen = set()
+        self.seen = seen
 
     def __iter__(self):
         return self
@@ -435,7 +623,46 @@ cdef class _unique_identity:
         return item
 
 
-cpdef object unique(object seq, object key=None):
+cdef class _unique_seen_key:
+    def __cinit__(self, object seq, object key, object seen):
+        self.iter_seq = iter(seq)
+        self.key = key
+        self.contains = seen.__contains__
+        self.add = seen.add
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef object item, tag
+        item = next(self.iter_seq)
+        tag = self.key(item)
+        while self.contains(tag):
+            item = next(self.iter_seq)
+            tag = self.key(item)
+        self.add(tag)
+        return item
+
+
+cdef class _unique_seen_identity:
+    def __cinit__(self, object seq, object seen):
+        self.iter_seq = iter(seq)
+        self.contains = seen.__contains__
+        self.add = seen.add
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef object item
+        item = next(self.iter_seq)
+        while self.contains(item):
+            item = next(self.iter_seq)
+        self.add(item)
+        return item
+
+
+cpdef object unique(object seq, object key=None, object seen=None):
     """Return only unique elements of a sequence
 
 	>>> tuple(unique((1, 2, 3)))
@@ -447,11 +674,28 @@ cpdef object unique(object seq, object key=None):
 
 	>>> tuple(unique(['cat', 'mouse', 'dog', 'hen'], key=len))
 	('cat', 'mouse')
+
+	By default ``unique`` remembers every key in a new ``set``. ``seen`` may
+	be any object with ``__contains__`` and ``add``, e.g. a ``set`` shared
+	between calls or one of the bounded sets ``LRUSet``, ``WindowSet``, and
+	``BloomFilter`` of the ``sandbox`` package.
+
+	>>> seen = {1}
+	>>> tuple(unique((1, 2, 3), seen=seen))
+	(2, 3)
+	>>> sorted(seen)
+	[1, 2, 3]
 	"""
+    if seen is not None and type(seen) is not set:
+        if key is None:
+            return _unique_seen_identity(seq, seen)
+        return _unique_seen_key(seq, key, seen)
+    if seen is None:
+        seen = set()
     if key is None:
-        return _unique_identity(seq)
+        return _unique_identity(seq, seen)
     else:
-        return _unique_key(seq, key)
+        return _unique_key(seq, key, seen)
 
 
 cpdef object isiterable(object x):
@@ -786,11 +1030,18 @@ cpdef dict frequencies(object seq):
 	>>> frequencies(['cat', 'cat', 'ox', 'pig', 'pig', 'cat'])  # doctest: +SKIP
 	{'cat': 3, 'ox': 1, 'pig': 2}
 
+	If ``seq`` is a one-dimensional NumPy array of booleans, numbers,
+	strings, or bytes, NumPy counts the values, and the keys are Python
+	scalars.
+
 	See Also
 	--------
 		countby
 		groupby
 	"""
+    cdef object vectorized = vectorized_frequencies(seq)
+    if vectorized is not None:
+        return vectorized
     cdef dict d = {}
     cdef PyObject *obj
     cdef Py_ssize_t val
@@ -840,6 +1091,12 @@ cpdef dict reduceby(object key, object binop, object seq, object init='__no__def
 	reduction.  This can be either a constant value like ``0`` or a callable
 	like ``lambda : 0`` as might be used in ``defaultdict``.
 
+	If ``seq`` is a one-dimensional NumPy array of numbers, ``key`` is a
+	unary ufunc, and ``binop`` is ``operator.add``, ``operator.mul``,
+	``max``, or ``min``, NumPy groups the values and reduces each group with
+	the matching ufunc. The keys and totals are then Python scalars, and sums
+	of floats may differ in the last digits.
+
 	Simple Examples
 	---------------
 
@@ -883,6 +1140,9 @@ cpdef dict reduceby(object key, object binop, object seq, object init='__no__def
 	{True:  set([2, 4]),
 	 False: set([1, 3])}
 	"""
+    cdef object vectorized = vectorized_reduceby(key, binop, seq, init)
+    if vectorized is not None:
+        return vectorized
     cdef dict d = {}
     cdef object item, keyval
     cdef Py_ssize_t i, N
@@ -963,9 +1223,21 @@ cdef class sliding_window:
 	>>> mean = lambda seq: float(sum(seq)) / len(seq)
 	>>> list(map(mean, sliding_window(2, [1, 2, 3, 4])))
 	[1.5, 2.5, 3.5]
+
+	With ``view=True``, ``seq`` must be a buffer, such as ``bytes``,
+	``bytearray``, ``array.array``, or ``memoryview``, or a NumPy array, and
+	the windows are ``memoryview`` slices or strided NumPy views that share
+	the memory of ``seq`` instead of new tuples.
+
+	>>> [bytes(window) for window in sliding_window(2, b'abc', view=True)]
+	[b'ab', b'bc']
 	"""
-    def __cinit__(self, Py_ssize_t n, object seq):
+    def __cinit__(self, Py_ssize_t n, object seq, bint view=False):
         cdef Py_ssize_t i
+        if view:
+            self.views = sliding_window_views(n, seq)
+            return
+        self.views = None
         self.iterseq = iter(seq)
         self.prev = PyTuple_New(n)
         Py_INCREF(None)
@@ -983,6 +1255,8 @@ cdef class sliding_window:
         cdef object item
         cdef Py_ssize_t i
 
+        if self.views is not None:
+            return next(self.views)
         item = next(self.iterseq)
         current = PyTuple_New(self.n)
         Py_INCREF(item)
@@ -998,7 +1272,7 @@ cdef class sliding_window:
 no_pad = '__no__pad__'
 
 
-cpdef object partition(Py_ssize_t n, object seq, object pad='__no__pad__'):
+cpdef object partition(Py_ssize_t n, object seq, object pad='__no__pad__', bint view=False):
     """Partition sequence into tuples of length n
 
 	>>> list(partition(2, [1, 2, 3, 4]))
@@ -1013,10 +1287,21 @@ cpdef object partition(Py_ssize_t n, object seq, object pad='__no__pad__'):
 	>>> list(partition(2, [1, 2, 3, 4, 5], pad=None))
 	[(1, 2), (3, 4), (5, None)]
 
+	With ``view=True``, ``seq`` must be a buffer or a NumPy array, as in
+	``sliding_window``, and the partitions are views of ``seq`` instead of
+	new tuples. A view cannot be padded, so ``pad`` must not be specified.
+
+	>>> [bytes(part) for part in partition(2, b'abcde', view=True)]
+	[b'ab', b'cd']
+
 	See Also
 	--------
 		partition_all
 	"""
+    if view:
+        if pad != '__no__pad__':
+            raise ValueError('Partitions that are views cannot be padded; omit `pad` or `view`.')
+        return partition_views(n, seq)
     args = [iter(seq)] * n
     if pad == '__no__pad__':
         return zip(*args)
@@ -1035,14 +1320,41 @@ cdef class partition_all:
 	>>> list(partition_all(2, [1, 2, 3, 4, 5]))
 	[(1, 2), (3, 4), (5,)]
 
+	With ``view=True``, ``seq`` must be a buffer or a NumPy array, as in
+	``partition``, and the partitions, including the shorter final one, are
+	views of ``seq`` instead of new tuples.
+
+	>>> [bytes(part) for part in partition_all(2, b'abcde', view=True)]
+	[b'ab', b'cd', b'e']
+
+	With ``reuse=True``, every partition is the same list, refilled in place,
+	so no container is allocated per partition. Consume each partition, or
+	copy it, before advancing the iterator.
+
+	>>> [sum(part) for part in partition_all(2, [1, 2, 3, 4, 5], reuse=True)]
+	[3, 7, 5]
+
 	See Also
 	--------
 		partition
 	"""
-    def __cinit__(self, Py_ssize_t n, object seq):
+    def __cinit__(self, Py_ssize_t n, object seq, bint view=False, bint reuse=False):
         self.n = n
-        self.iterseq = iter(seq)
         self.seq = seq
+        self.views = None
+        self.buffer = None
+        self.start = 0
+        if view:
+            if reuse:
+                raise ValueError('Partitions that are views cannot be reused lists; omit `view` or `reuse`.')
+            self.views = partition_all_views(n, seq)
+            return
+        if reuse:
+            self.buffer = []
+        elif type(seq) is tuple:
+            # Partitions of an exact tuple are its slices, which copy the items with one `memcpy` each.
+            return
+        self.iterseq = iter(seq)
 
     def __iter__(self):
         return self
@@ -1051,6 +1363,12 @@ cdef class partition_all:
         cdef tuple result
         cdef object item
         cdef Py_ssize_t i = 0, end
+        if self.views is not None:
+            return next(self.views)
+        if self.buffer is not None:
+            return self._refill()
+        if self.iterseq is None:
+            return self._slice()
         result = PyTuple_New(self.n)
         for item in self.iterseq:
             Py_INCREF(item)
@@ -1079,6 +1397,30 @@ cdef class partition_all:
 
         return PyTuple_GetSlice(result, 0, i)
 
+    cdef tuple _slice(self):
+        cdef Py_ssize_t size = len(self.seq), start = self.start
+        if start >= size:
+            raise StopIteration
+        self.start = min(start + self.n, size)
+        return PyTuple_GetSlice(self.seq, start, self.start)
+
+    cdef list _refill(self):
+        cdef list buffer = self.buffer
+        cdef object item
+        cdef Py_ssize_t i = 0
+        for item in self.iterseq:
+            if i < PyList_GET_SIZE(buffer):
+                buffer[i] = item
+            else:
+                buffer.append(item)
+            i += 1
+            if i == self.n:
+                return buffer
+        if i == 0:
+            raise StopIteration
+        del buffer[i:]
+        return buffer
+
 
 cpdef object count(object seq):
     """Count the number of items in seq
@@ -1269,7 +1611,9 @@ cpdef object getter(object index):
 cpdef object join(object leftkey, object leftseq,
                   object rightkey, object rightseq,
                   object left_default='__no__default__',
-                  object right_default='__no__default__'):
+                  object right_default='__no__default__',
+                  object strategy='auto',
+                  object max_memory=None):
     """Join two sequences on common attributes
 
 	This is a semi-streaming operation.  The LEFT sequence is fully evaluated
@@ -1315,7 +1659,39 @@ cpdef object join(object leftkey, object leftseq,
 
 	>>> # result = join(second, friends, first, cities)
 	>>> result = join(1, friends, 0, cities)  # doctest: +SKIP
+
+	The keyword argument ``strategy`` selects another algorithm.
+
+	``'hash'``
+		The hash join described above.
+	``'sort-merge'``
+		Both sequences must be sorted by their keys. Both sequences are
+		evaluated lazily, only the LEFT elements that share one key are held
+		in memory, and the pairs are yielded in order of the keys. A key that
+		is smaller than the key before it raises ``ValueError``.
+	``'grace'``
+		A Grace hash join that needs ``max_memory``, a number of bytes. While
+		the LEFT sequence fits in ``max_memory``, this is the hash join. Once
+		it does not, both sequences are partitioned into hash buckets in
+		temporary files, and the pairs are yielded bucket by bucket. Keys and
+		elements must be picklable.
+	``'auto'``
+		The default: ``'grace'`` if ``max_memory`` is given, else ``'hash'``.
+
+	>>> list(join(first, [(1, 'a'), (2, 'b')], first, [(2, 'x'), (3, 'y')], strategy='sort-merge'))
+	[((2, 'b'), (2, 'x'))]
 	"""
+    strategy = _join_strategy(strategy, max_memory)
+    if strategy != 'hash':
+        if not callable(leftkey):
+            leftkey = getter(leftkey)
+        if not callable(rightkey):
+            rightkey = getter(rightkey)
+        if strategy == 'sort-merge':
+            return _sort_merge_join(leftkey, leftseq, rightkey, rightseq,
+                                    left_default, right_default)
+        return grace_join(leftkey, leftseq, rightkey, rightseq,
+                          left_default, right_default, max_memory)
     if left_default == no_default and right_default == no_default:
         if callable(rightkey):
             return _inner_join_key(leftkey, leftseq, rightkey, rightseq,
@@ -1357,6 +1733,67 @@ cpdef object join(object leftkey, object leftseq,
             return _outer_join_index(leftkey, leftseq, rightkey, rightseq,
                                      left_default, right_default)
 
+cdef object _join_strategy(object strategy, object max_memory):
+    if strategy == 'auto':
+        return 'hash' if max_memory is None else 'grace'
+    if strategy not in {'grace', 'hash', 'sort-merge'}:
+        raise ValueError(f"`strategy` must be 'auto', 'grace', 'hash', or 'sort-merge', not {strategy!r}.")
+    if (strategy == 'grace') != (max_memory is not None):
+        raise ValueError(f"`max_memory` is required by, and only used by, strategy='grace', but {strategy=} and {max_memory=}.")
+    return strategy
+
+
+def _sorted_groups(object key, object seq):
+    cdef bint started = False
+    cdef object previous = None
+    for value, group in itertools_groupby(seq, key):
+        if started and value < previous:
+            raise ValueError(f"join with strategy='sort-merge' requires sequences sorted by their keys, but {value!r} follows {previous!r}.")
+        started = True
+        previous = value
+        yield (value, group)
+
+
+def _sort_merge_join(object leftkey, object leftseq,
+                     object rightkey, object rightseq,
+                     object left_default, object right_default):
+    cdef bint is_right_outer = right_default != no_default
+    cdef bint is_left_outer = left_default != no_default
+    cdef list matches
+    cdef object lefts = _sorted_groups(leftkey, leftseq)
+    cdef object rights = _sorted_groups(rightkey, rightseq)
+    cdef object left = next(lefts, None)
+    cdef object right = next(rights, None)
+    while left is not None and right is not None:
+        if left[0] < right[0]:
+            if is_right_outer:
+                for match in left[1]:
+                    yield (match, right_default)
+            left = next(lefts, None)
+        elif right[0] < left[0]:
+            if is_left_outer:
+                for item in right[1]:
+                    yield (left_default, item)
+            right = next(rights, None)
+        else:
+            matches = list(left[1])
+            for item in right[1]:
+                for match in matches:
+                    yield (match, item)
+            left = next(lefts, None)
+            right = next(rights, None)
+    if is_right_outer:
+        while left is not None:
+            for match in left[1]:
+                yield (match, right_default)
+            left = next(lefts, None)
+    if is_left_outer:
+        while right is not None:
+            for item in right[1]:
+                yield (left_default, item)
+            right = next(rights, None)
+
+
 cdef class _join:
     def __cinit__(self,
                   object leftkey, object leftseq,
@@ -1371,7 +1808,7 @@ cdef class _join:
         if isinstance(rightkey, list):
             self.N = len(rightkey)
 
-        self.d = groupby(leftkey, leftseq)
+        self.d = _groupby(leftkey, leftseq)
         self.seen_keys = set()
         self.matches = []
         self.right = None
@@ -1760,6 +2197,54 @@ cpdef object peekn(Py_ssize_t n, object seq):
     return peeked, chain(iter(peeked), iterator)
 
 
+def pmap(func, seq, *, ordered=True, max_inflight=None, workers=None):
+    """Map a function over a sequence on a pool of threads
+
+	Like ``map``, ``pmap`` is lazy and the results come in the order of
+	``seq``, but up to ``max_inflight`` calls of ``func`` run at once on
+	``workers`` threads. This helps when ``func`` waits on I/O, such as
+	reading files or making requests. With ``ordered=False``, every result is
+	returned as soon as it is ready.
+
+	>>> inc = lambda x: x + 1
+	>>> list(pmap(inc, [1, 2, 3]))
+	[2, 3, 4]
+	>>> sorted(pmap(inc, [1, 2, 3], ordered=False))
+	[2, 3, 4]
+
+	``seq`` is read as calls are submitted, so at most ``max_inflight`` items
+	and results are held at once. By default, ``max_inflight`` is twice the
+	number of threads. An exception raised by ``func`` is raised when its
+	result is reached.
+
+	See Also
+	--------
+		prefetch
+	"""
+    return parallel_map(func, seq, ordered, max_inflight, workers)
+
+
+def prefetch(n, seq):
+    """Read up to n items of a sequence ahead on a background thread
+
+	The items come in the order of ``seq``. While the consumer works on one
+	item, a thread keeps reading from ``seq``, so a slow source, such as a
+	file on a network file system, does not stall every step of a pipeline.
+
+	>>> list(prefetch(2, range(5)))
+	[0, 1, 2, 3, 4]
+
+	An exception raised by ``seq`` is raised when its position is reached.
+	When the iterator is closed early, the thread stops after its current
+	read of ``seq``.
+
+	See Also
+	--------
+		pmap
+	"""
+    return read_ahead(n, seq)
+
+
 cdef class random_sample:
     """Return elements from a sequence with probability of prob
 
@@ -1791,21 +2276,36 @@ cdef class random_sample:
 	>>> randobj = Random(2016)
 	>>> list(random_sample(0.1, seq, random_state=randobj))
 	[7, 9, 19, 25, 30, 32, 34, 48, 59, 60, 81, 98]
+
+	With ``skip=True``, the number of items between two chosen items is
+	drawn from the geometric distribution, so ``random`` is called once per
+	chosen item instead of once per item. The sample has the same
+	distribution, but not the same items for a given seed. The rows of a
+	NumPy array are then chosen with a NumPy generator in batches.
+
+	>>> list(random_sample(0.1, seq, random_state=2016, skip=True))
+	[2, 10, 12, 14, 27, 31, 32, 56, 68, 94]
 	"""
-    def __cinit__(self, object prob, object seq, random_state=None):
+    def __cinit__(self, object prob, object seq, random_state=None, bint skip=False):
         float(prob)
         self.prob = prob
-        self.iter_seq = iter(seq)
         if not hasattr(random_state, 'random'):
             from random import Random
 
             random_state = Random(random_state)
         self.random_func = random_state.random
+        self.skip = skip
+        if skip:
+            self.iter_seq = skip_sample(prob, seq, random_state)
+        else:
+            self.iter_seq = iter(seq)
 
     def __iter__(self):
         return self
 
     def __next__(self):
+        if self.skip:
+            return next(self.iter_seq)
         while True:
             if self.random_func() < self.prob:
                 return next(self.iter_seq)
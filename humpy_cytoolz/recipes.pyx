@@ -5,11 +5,15 @@ from cpython.sequence cimport PySequence_Tuple
 from humpy_cytoolz.itertoolz cimport frequencies, pluck
 
 import itertools
+from humpy_toolz import _vectorized
 
 # cdef alias to eliminate global lookups
 cdef object groupby = itertools.groupby
 del itertools
 
+cdef object vectorized_countby = _vectorized.vectorized_countby
+del _vectorized
+
 
 __all__ = ['countby', 'partitionby']
 
@@ -30,10 +34,17 @@ cpdef object countby(object key, object seq):
 	>>> countby(iseven, [1, 2, 3])  # doctest:+SKIP
 	{True: 1, False: 2}
 
+	If ``seq`` is a one-dimensional NumPy array and ``key`` is a unary ufunc,
+	or ``seq`` is a structured array and ``key`` names fields of it, NumPy
+	computes and counts the keys, and the keys are Python scalars or tuples.
+
 	See Also
 	--------
 		groupby
 	"""
+    cdef object vectorized = vectorized_countby(key, seq)
+    if vectorized is not None:
+        return vectorized
     if not callable(key):
         return frequencies(pluck(key, seq))
     return frequencies(map(key, seq))
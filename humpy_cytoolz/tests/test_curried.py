@@ -87,3 +87,8 @@ def test_curried_namespace():
             else:
                 messages.append('%s should come from humpy_cytoolz and NOT be curried' % name)
         raise AssertionError('\n'.join(messages))
+
+def test_curried_keyword_options():
+    assert [bytes(window) for window in humpy_cytoolz.curried.sliding_window(2, view=True)(b'abc')] == [b'ab', b'bc']
+    assert [list(part) for part in humpy_cytoolz.curried.partition_all(2, reuse=True)([1, 2, 3])] == [[1, 2], [3]]
+    assert list(humpy_cytoolz.curried.random_sample(1, skip=True)(range(3))) == [0, 1, 2]
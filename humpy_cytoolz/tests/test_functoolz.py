@@ -1,11 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from humpy_cytoolz.functoolz import (
-	apply, complement, compose, compose_left, curry, do, excepts, flip, juxt, memoize, pipe, thread_first, thread_last)
+	apply, checked_curry, complement, compose, compose_left, curry, do, excepts, flip, juxt, memoize, pipe, thread_first, thread_last)
 from humpy_cytoolz.utils import raises
 from operator import add, itemgetter, mul
+import asyncio
 import humpy_cytoolz
 import inspect
 import sys
+import threading
+import time
 
 IS_PYPY_GE_39 = sys.implementation.name == 'pypy' and sys.version_info.major == 3 and (sys.version_info.minor >= 9)
 
@@ -152,6 +156,69 @@ def test_memoize_wrapped():
     memoized_foo = memoize(foo)
     assert memoized_foo.__wrapped__ is foo
 
+
+def test_memoize_maxsize():
+    calls = []
+
+    @memoize(maxsize=2)
+    def f(x):
+        calls.append(x)
+        return x * 2
+
+    assert [f(x) for x in [1, 2, 1, 3, 1, 2]] == [2, 4, 2, 6, 2, 4]
+    assert calls == [1, 2, 3, 2]
+    assert f.cache_info() == (2, 4, 2, 2, 2)
+
+    g = memoize(lambda x: x, maxsize=2, policy='lfu')
+    assert [g(x) for x in [1, 1, 2, 3, 2, 1]] == [1, 1, 2, 3, 2, 1]
+    assert g.cache_info() == (2, 4, 2, 2, 2)
+
+    h = memoize(lambda n: 'x' * n, maxsize=10, getsizeof=len)
+    h(4), h(5), h(3)
+    assert h.cache_info() == (0, 3, 1, 10, 8)
+
+    plain = memoize(lambda x: x + 1, cache={1: 5})
+    assert plain(1) == 5
+    assert plain(2) == 3
+    assert plain.cache_info() == (None, None, None, None, 2)
+    assert raises(ValueError, lambda: memoize(len, cache={}, maxsize=1))
+
+
+def test_memoize_single_flight():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    @memoize(concurrency='single_flight')
+    def slow(x):
+        calls.append(x)
+        started.set()
+        release.wait()
+        return x * 2
+
+    with ThreadPoolExecutor(8) as executor:
+        futures = [executor.submit(slow, 1)]
+        started.wait()
+        futures += [executor.submit(slow, 1) for _ in range(7)]
+        time.sleep(0.05)
+        release.set()
+        assert [future.result() for future in futures] == [2] * 8
+    assert calls == [1]
+
+    @memoize(key=lambda args, kwargs: args[0], concurrency='single_flight')
+    async def aslow(x, y):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return x + y
+
+    async def main():
+        return await asyncio.gather(aslow(1, 1), aslow(1, 2), aslow(2, 0))
+
+    assert asyncio.run(main()) == [2, 2, 2]
+    assert calls == [1, 1, 2]
+    assert raises(ValueError, lambda: memoize(len, concurrency='threads'))
+
+
 def test_curry_simple():
     cmul = curry(mul)
     double = cmul(2)
@@ -441,6 +508,40 @@ def test_curry_subclassable():
     assert add(1)(2) == 3
     '\n    class curry2(curry):\n        def _should_curry(self, args, kwargs, exc=None):\n            return len(self.args) + len(args) < 2\n\n    add = curry2(lambda x, y: x+y)\n    assert isinstance(add(1), curry2)\n    assert add(1)(2) == 3\n    assert isinstance(add(1)(x=2), curry2)\n    assert raises(TypeError, lambda: add(1)(x=2)(3))\n    '
 
+
+def test_checked_curry():
+
+    def f(x, y, *, z=0, w):
+        if x < 0:
+            raise TypeError('negative')
+        return x + y + z + w
+
+    g = checked_curry(f)
+    assert g(1)(2)(w=3) == g(1, w=3)(2) == g(w=3)(1, 2) == 6
+    assert g(1, 2, z=4)(w=3) == 10
+    assert isinstance(g(1), checked_curry)
+    assert g(1, z=10)(2, w=0) == 13
+    assert raises(TypeError, lambda: g(-1, 2, w=0))
+    assert raises(TypeError, lambda: g(1, 2, 3))
+    assert raises(TypeError, lambda: g(1, v=2))
+    assert raises(TypeError, lambda: g(1)(x=2))
+
+    @checked_curry
+    def h(*args):
+        return f(*args, w=0)
+
+    assert h(1)(2) == h(1, 2) == 3
+    assert list(checked_curry(map)(str)([1])) == ['1']
+
+    class A:
+        @checked_curry
+        def add(self, x, y):
+            return x + y
+
+    assert isinstance(A().add(1), checked_curry)
+    assert A().add(1)(2) == 3
+
+
 def generate_compose_test_cases():
     """
     Generate test cases for parametrized tests of the compose function.
@@ -454,6 +555,12 @@ def test_compose():
     for compose_args, args, kw, expected in generate_compose_test_cases():
         assert compose(*compose_args)(*args, **kw) == expected
 
+def test_compose_compile():
+    for compose_args, args, kw, expected in generate_compose_test_cases():
+        assert compose(*compose_args, compile=True)(*args, **kw) == expected
+    assert compose(str, abs, compile=True) == compose(str, abs)
+    assert compose_left(abs, str, compile=True)(-3) == '3'
+
 def test_compose_metadata():
 
     def f(a):
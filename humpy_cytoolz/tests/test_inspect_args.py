@@ -437,3 +437,26 @@ def test_inspect_wrapped_property():
         assert num_required_args(Wrapped) is None
         _sigs.signatures[Wrapped] = (_sigs.expand_sig((0, lambda func: None)),)
     assert num_required_args(Wrapped) == 1
+
+
+def test_signature_cache(monkeypatch):
+    calls = []
+    signature = inspect.signature
+
+    def counting(func, *args, **kwargs):
+        calls.append(func)
+        return signature(func, *args, **kwargs)
+
+    monkeypatch.setattr(inspect, 'signature', counting)
+
+    def f(a, b, c):
+        return a + b + c
+
+    g = curry(f)
+    assert g(1)(2)(3) == g(1, 2)(3) == g(1)(2, 3) == 6
+    assert humpy_cytoolz.memoize(f)(1, 2, 3) == 6
+    assert calls == [f]
+    f.__defaults__ = (0,)
+    assert g(1)(2) == 3
+    assert is_arity(2, f) is False
+    assert calls == [f, f]
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
+from array import array
 from functools import partial
 from humpy_cytoolz.itertoolz import (
 	accumulate, concat, concatv, cons, count, diff, drop, first, frequencies, get, getter, groupby, interleave, interpose, isdistinct,
-	isiterable, iterate, join, last, mapcat, merge_sorted, nth, partition, partition_all, peek, peekn, pluck, random_sample, reduceby, remove,
-	rest, second, sliding_window, tail, take, take_nth, topk, unique)
+	isiterable, iterate, join, last, mapcat, merge_sorted, nth, partition, partition_all, peek, peekn, pluck, pmap, prefetch,
+	random_sample, reduceby, remove, rest, second, sliding_window, tail, take, take_nth, topk, unique)
 from humpy_cytoolz.utils import raises
 from itertools import starmap
-from operator import add, mul
+from operator import add, itemgetter, mul
 from pickle import dumps, loads
 from random import Random
 from typing import TYPE_CHECKING
 import itertools
 import pytest
+import threading
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable, Iterator
@@ -47,6 +49,17 @@ def test_groupby_non_callable() -> None:
     assert groupby([0], [(1, 2), (1, 3), (2, 2), (2, 4)]) == {(1,): [(1, 2), (1, 3)], (2,): [(2, 2), (2, 4)]}
     assert groupby([0, 0], [(1, 2), (1, 3), (2, 2), (2, 4)]) == {(1, 1): [(1, 2), (1, 3)], (2, 2): [(2, 2), (2, 4)]}
 
+def test_groupby_max_memory() -> None:
+    assert sorted(groupby(iseven, [1, 2, 3, 4], max_memory=2**20)) == [(False, [1, 3]), (True, [2, 4])]
+    assert sorted(groupby(0, [(1, 2), (1, 3), (2, 2)], max_memory=2**20)) == [(1, [(1, 2), (1, 3)]), (2, [(2, 2)])]
+    data: list[tuple[int, int]] = [(index % 97, index) for index in range(5000)]
+    spilled: dict[int, list[tuple[int, int]]] = dict(groupby(0, data, max_memory=4096))
+    assert spilled == groupby(0, data)
+    skewed: list[int] = [0] * 3000 + list(range(500))
+    assert dict(groupby(identity, skewed, max_memory=1024)) == groupby(identity, skewed)
+    assert list(groupby(identity, [], max_memory=1024)) == []
+    assert raises(ValueError, lambda: groupby(identity, [1], max_memory=0))
+
 def test_merge_sorted() -> None:
     assert list(merge_sorted([1, 2, 3], [1, 2, 3])) == [1, 1, 2, 2, 3, 3]
     assert list(merge_sorted([1, 3, 5], [2, 4, 6])) == [1, 2, 3, 4, 5, 6]
@@ -66,6 +79,26 @@ def test_merge_sorted() -> None:
     assert list(merge_sorted([1, 4, 5], [2, 3], key=identity)) == [1, 2, 3, 4, 5]
     assert list(merge_sorted([1, 5], [2], [4, 7], [3, 6], key=identity)) == [1, 2, 3, 4, 5, 6, 7]
 
+def test_merge_sorted_many():
+    runs = [[(value, index) for value in range(index % 7, 300, 7 + index % 5)] for index in range(40)]
+    runs.append([])
+    expected = sorted((item for run in runs for item in run), key=itemgetter(0))
+    assert list(merge_sorted(*runs, key=itemgetter(0))) == expected
+    assert list(merge_sorted(*runs)) == sorted(expected)
+    assert list(merge_sorted(*[[index % 3] for index in range(20)])) == [0] * 7 + [1] * 7 + [2] * 6
+
+def test_merge_sorted_prefetch():
+    runs = [range(index, 1000, 9) for index in range(9)]
+    assert list(merge_sorted(*runs, prefetch=16)) == list(range(1000))
+    assert list(merge_sorted([3, 2, 1], [4, 0], key=lambda x: -x, prefetch=2)) == [4, 3, 2, 1, 0]
+    assert list(merge_sorted([1, 2], prefetch=1)) == [1, 2]
+    assert list(merge_sorted(prefetch=1)) == []
+    merged = merge_sorted(iter(range(0, 100, 2)), iter(range(1, 100, 2)), prefetch=4)
+    assert list(itertools.islice(merged, 5)) == [0, 1, 2, 3, 4]
+    merged.close()
+    with pytest.raises(ValueError, match='prefetch'):
+        merge_sorted([1], [2], prefetch=0)
+
 def test_interleave() -> None:
     assert ''.join(interleave(('ABC', '123'))) == 'A1B2C3'
     assert ''.join(interleave(('ABC', '1'))) == 'A1BC'
@@ -75,6 +108,25 @@ def test_unique() -> None:
     assert tuple(unique((1, 2, 1, 3))) == (1, 2, 3)
     assert tuple(unique((1, 2, 3), key=iseven)) == (1, 2)
 
+def test_unique_seen() -> None:
+    seen: set[int] = {1}
+    assert tuple(unique((1, 2, 1, 3), seen=seen)) == (2, 3)
+    assert seen == {1, 2, 3}
+    assert tuple(unique((1, 2, 3, 4), key=iseven, seen={True})) == (1,)
+
+    class RecentSet:
+        def __init__(self) -> None:
+            self.items: list[int] = []
+
+        def __contains__(self, item: object) -> bool:
+            return item in self.items[-2:]
+
+        def add(self, item: int) -> None:
+            self.items.append(item)
+
+    assert tuple(unique((1, 2, 1, 3, 4, 1), seen=RecentSet())) == (1, 2, 3, 4, 1)
+    assert tuple(unique((1, 2, 3, 5, 7, 8), key=iseven, seen=RecentSet())) == (1, 2)
+
 def test_isiterable() -> None:
 
     class IterIterable:
@@ -205,6 +257,42 @@ def test_frequencies() -> None:
     assert frequencies([]) == {}
     assert frequencies('onomatopoeia') == {'a': 2, 'e': 1, 'i': 1, 'm': 1, 'o': 4, 'n': 1, 'p': 1, 't': 1}
 
+def test_numpy_fast_path() -> None:
+    numpy = pytest.importorskip('numpy')
+    values = numpy.array([3, 1, 3, -2, 1, 3, 7])
+    assert frequencies(values) == frequencies(values.tolist())
+    assert list(frequencies(values)) == [3, 1, -2, 7]
+    assert frequencies(numpy.array(['b', 'a', 'b'])) == {'b': 2, 'a': 1}
+    nans = numpy.array([1.0, numpy.nan, numpy.nan])
+    assert len(frequencies(nans)) == 3
+    assert frequencies(numpy.array([], dtype=int)) == {}
+
+    grouped = groupby(numpy.sign, values)
+    assert grouped == groupby(lambda x: int(numpy.sign(x)), values.tolist())
+    assert list(grouped) == [1, -1]
+    assert groupby(numpy.sign, numpy.array([], dtype=int)) == {}
+
+    records = numpy.array(
+        [('CA', 'roads', 100), ('IL', 'crime', 10), ('IL', 'farms', 200), ('CA', 'farms', 20)],
+        dtype=[('state', 'U2'), ('name', 'U8'), ('cost', 'i8')],
+    )
+    by_state = groupby('state', records)
+    assert list(by_state) == ['CA', 'IL']
+    assert [record['cost'] for record in by_state['IL']] == [10, 200]
+    assert list(groupby(['state', 'name'], records)) == [('CA', 'roads'), ('IL', 'crime'), ('IL', 'farms'), ('CA', 'farms')]
+    assert list(groupby(getter('name'), records)) == ['roads', 'crime', 'farms']
+    assert groupby(lambda record: str(record['state']), records).keys() == by_state.keys()
+
+    assert reduceby(numpy.sign, add, values) == reduceby(lambda x: int(numpy.sign(x)), add, values.tolist())
+    assert reduceby(numpy.sign, max, values, 0) == {1: 7, -1: 0}
+    assert reduceby(numpy.sign, min, values, lambda: 100) == {1: 1, -1: -2}
+    assert reduceby(numpy.sign, mul, values) == {1: 189, -1: -2}
+    assert reduceby(numpy.sign, lambda acc, x: acc + x, values) == {1: 18, -1: -2}
+    assert reduceby(numpy.sign, add, numpy.array([0.5, -0.25, 1.5])) == {1.0: 2.0, -1.0: -0.25}
+    small = numpy.array([100, 100, 5], dtype=numpy.int8)
+    with numpy.errstate(over='ignore'):
+        assert reduceby(numpy.sign, add, small) == reduceby(lambda x: int(numpy.sign(x)), add, list(small)) == {1: -51}
+
 def test_reduceby() -> None:
     data: list[int] = [1, 2, 3, 4, 5]
     iseven = lambda x: x % 2 == 0
@@ -252,6 +340,36 @@ def test_sliding_window_of_short_iterator() -> None:
     assert list(sliding_window(3, [1, 2])) == []
     assert list(sliding_window(7, [1, 2])) == []
 
+def test_buffer_views():
+    assert [bytes(window) for window in sliding_window(3, b'abcde', view=True)] == [b'abc', b'bcd', b'cde']
+    assert list(sliding_window(6, b'abcde', view=True)) == []
+    assert [window.tolist() for window in sliding_window(2, array('d', [1, 2, 3]), view=True)] == [[1.0, 2.0], [2.0, 3.0]]
+    buffer = bytearray(b'abcdefg')
+    parts = list(partition(3, memoryview(buffer), view=True))
+    assert [bytes(part) for part in parts] == [b'abc', b'def']
+    buffer[0] = ord('z')
+    assert bytes(parts[0]) == b'zbc'
+    with pytest.raises(TypeError, match='view'):
+        list(sliding_window(2, [1, 2, 3], view=True))
+    with pytest.raises(ValueError, match='padded'):
+        partition(2, b'abc', None, view=True)
+    for n in (0, -1):
+        with pytest.raises(ValueError, match='positive'):
+            sliding_window(n, b'abc', view=True)
+        with pytest.raises(ValueError, match='positive'):
+            partition(n, b'abc', view=True)
+
+def test_numpy_views():
+    numpy = pytest.importorskip('numpy')
+    signal = numpy.arange(10.0)
+    windows = list(sliding_window(4, signal, view=True))
+    assert [window.tolist() for window in windows] == [list(window) for window in sliding_window(4, signal.tolist())]
+    assert all(numpy.shares_memory(window, signal) for window in windows)
+    frames = numpy.arange(12).reshape(6, 2)
+    assert [part.tolist() for part in partition(4, frames, view=True)] == [[[0, 1], [2, 3], [4, 5], [6, 7]]]
+    assert [window.shape for window in sliding_window(5, frames, view=True)] == [(5, 2), (5, 2)]
+    assert list(sliding_window(11, signal, view=True)) == []
+
 def test_partition() -> None:
     assert list(partition(2, [1, 2, 3, 4])) == [(1, 2), (3, 4)]
     assert list(partition(3, range(7))) == [(0, 1, 2), (3, 4, 5)]
@@ -287,6 +405,34 @@ def test_partition_all() -> None:
     too_short_list: ListWithBadLength = ListWithBadLength([1, 2], off_by=-1)
     assert raises(LookupError, lambda: list(partition_all(5, too_short_list)))
 
+def test_partition_all_sequences() -> None:
+    for seq in ([1, 2, 3, 4, 5], (1, 2, 3, 4, 5), range(1, 6), iter([1, 2, 3, 4, 5])):
+        assert list(partition_all(2, seq)) == [(1, 2), (3, 4), (5,)]
+    assert list(partition_all(5, (1, 2))) == [(1, 2)]
+    assert list(partition_all(2, ())) == []
+
+def test_partition_all_reuse() -> None:
+    parts: list[list[int]] = list(partition_all(2, [1, 2, 3, 4, 5], reuse=True))
+    assert parts[0] is parts[-1]
+    assert parts[0] == [5]
+    assert [list(part) for part in partition_all(3, iter(range(7)), reuse=True)] == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(partition_all(3, [], reuse=True)) == []
+    assert raises(ValueError, lambda: partition_all(2, b'ab', view=True, reuse=True))
+
+def test_partition_all_views() -> None:
+    assert [bytes(part) for part in partition_all(2, b'abcde', view=True)] == [b'ab', b'cd', b'e']
+    assert [part.tolist() for part in partition_all(2, array('i', [1, 2, 3]), view=True)] == [[1, 2], [3]]
+    assert list(partition_all(2, b'', view=True)) == []
+    assert raises(TypeError, lambda: partition_all(2, [1, 2], view=True))
+    assert raises(ValueError, lambda: partition_all(0, b'ab', view=True))
+
+def test_partition_all_numpy_views() -> None:
+    numpy = pytest.importorskip('numpy')
+    values = numpy.arange(10).reshape(5, 2)
+    parts = list(partition_all(2, values, view=True))
+    assert [part.tolist() for part in parts] == [[[0, 1], [2, 3]], [[4, 5], [6, 7]], [[8, 9]]]
+    assert all(numpy.shares_memory(part, values) for part in parts)
+
 def test_count() -> None:
     assert count((1, 2, 3)) == 3
     assert count([]) == 0
@@ -364,6 +510,35 @@ def test_outer_join() -> None:
     expected: set[tuple[int | None, int | None]] = {(2, 2), (1, None), (None, 3)}
     assert result == expected
 
+def test_join_sort_merge() -> None:
+    names: list[tuple[int, str]] = [(1, 'one'), (1, 'uno'), (2, 'two'), (2, 'dos'), (3, 'three')]
+    fruit: list[tuple[str, int]] = [('apple', 1), ('orange', 1), ('banana', 2), ('coconut', 2), ('kiwi', 4)]
+    assert list(join(first, names, second, fruit, strategy='sort-merge')) == list(join(first, names, second, fruit))
+    assert list(join(0, names, 1, fruit, strategy='sort-merge')) == list(join(0, names, 1, fruit))
+    result: list[tuple[int | None, int | None]] = list(join(identity, [1, 2, 2, 5], identity, [2, 3, 5, 5], None, None, strategy='sort-merge'))
+    assert result == [(1, None), (2, 2), (2, 2), (None, 3), (5, 5), (5, 5)]
+    assert list(join(identity, [1, 2], identity, [2, 3], left_default=None, strategy='sort-merge')) == [(2, 2), (None, 3)]
+    assert list(join(identity, [1, 2], identity, [2, 3], right_default=None, strategy='sort-merge')) == [(1, None), (2, 2)]
+    assert list(join(identity, iter(range(10**6)), identity, [3, 4], strategy='sort-merge')) == [(3, 3), (4, 4)]
+    assert raises(ValueError, lambda: list(join(identity, [2, 1], identity, [1, 2], strategy='sort-merge')))
+
+def test_join_grace() -> None:
+    left: list[tuple[int, int]] = [(index % 101, index) for index in range(3000)]
+    right: list[tuple[int, int]] = [(index % 150, index) for index in range(300)]
+    for kwargs in ({}, {'left_default': None}, {'right_default': None}, {'left_default': None, 'right_default': None}):
+        expected: list[Any] = sorted(join(0, left, 0, right, **kwargs), key=repr)
+        assert sorted(join(0, left, 0, right, max_memory=4096, **kwargs), key=repr) == expected
+        assert sorted(join(first, left, first, right, strategy='grace', max_memory=2**30, **kwargs), key=repr) == expected
+    skewed: list[int] = [0] * 2000 + list(range(300))
+    assert sorted(join(identity, skewed, identity, [0, 7, 400], None, None, max_memory=1024), key=repr) == sorted(
+        join(identity, skewed, identity, [0, 7, 400], None, None), key=repr)
+
+def test_join_strategy_errors() -> None:
+    assert raises(ValueError, lambda: list(join(identity, [1], identity, [1], strategy='nested-loop')))
+    assert raises(ValueError, lambda: list(join(identity, [1], identity, [1], strategy='grace')))
+    assert raises(ValueError, lambda: list(join(identity, [1], identity, [1], strategy='hash', max_memory=1024)))
+    assert raises(ValueError, lambda: list(join(identity, [1], identity, [1], max_memory=0)))
+
 def test_diff() -> None:
     assert raises(TypeError, lambda: list(diff()))
     assert raises(TypeError, lambda: list(diff([1, 2])))
@@ -412,6 +587,51 @@ def test_peekn() -> None:
     assert elements == alist
     assert tuple(blist) == alist
 
+def test_prefetch() -> None:
+    assert list(prefetch(2, range(10))) == list(range(10))
+    assert list(prefetch(1, [])) == []
+    assert raises(ValueError, lambda: prefetch(0, [1]))
+    read_ahead = threading.Event()
+
+    def source() -> Iterator[int]:
+        yield from range(3)
+        read_ahead.set()
+        yield 3
+
+    iterator: Iterator[int] = prefetch(4, source())
+    assert next(iterator) == 0
+    assert read_ahead.wait(5)
+    assert list(iterator) == [1, 2, 3]
+
+    def failing() -> Iterator[int]:
+        yield 1
+        raise ZeroDivisionError
+
+    iterator = prefetch(2, failing())
+    assert next(iterator) == 1
+    assert raises(ZeroDivisionError, lambda: next(iterator))
+    endless: Iterator[int] = prefetch(2, itertools.count())
+    assert next(endless) == 0
+    endless.close()
+
+def test_pmap() -> None:
+    assert list(pmap(inc, range(20), max_inflight=3)) == list(range(1, 21))
+    assert sorted(pmap(inc, range(20), ordered=False, workers=4)) == list(range(1, 21))
+    assert list(pmap(inc, [])) == []
+    together = threading.Barrier(2)
+
+    def meet(x: int) -> int:
+        together.wait(5)
+        return x
+
+    assert list(pmap(meet, [1, 2], workers=2)) == [1, 2]
+    assert raises(ZeroDivisionError, lambda: list(pmap(lambda x: 1 / x, [1, 0, 2])))
+    assert raises(ValueError, lambda: pmap(inc, [1], workers=0))
+    assert raises(ValueError, lambda: pmap(inc, [1], max_inflight=0))
+    mapped: Iterator[int] = pmap(inc, itertools.count())
+    assert next(mapped) == 1
+    mapped.close()
+
 def test_random_sample() -> None:
     alist: list[int] = list(range(100))
     assert list(random_sample(prob=1, seq=alist, random_state=2016)) == alist
@@ -426,3 +646,28 @@ def test_random_sample() -> None:
     assert mk_rsample(hash(object)) != mk_rsample(hash(object()))
     assert mk_rsample(b'a') == mk_rsample('a')
     assert raises(TypeError, lambda: mk_rsample([]))
+
+def test_random_sample_skip() -> None:
+    alist: list[int] = list(range(1000))
+    assert list(random_sample(1, alist, random_state=2016, skip=True)) == alist
+    assert list(random_sample(0, alist, random_state=2016, skip=True)) == []
+    rsample: list[int] = list(random_sample(0.1, alist, random_state=2016, skip=True))
+    assert rsample == list(random_sample(0.1, iter(alist), random_state=Random(2016), skip=True))
+    assert rsample != list(random_sample(0.1, alist, random_state=1984, skip=True))
+    assert rsample == sorted(set(rsample))
+    assert set(rsample) <= set(alist)
+    assert 50 < len(rsample) < 150
+    counts: list[int] = [0] * 10
+    for seed in range(2000):
+        for item in random_sample(0.3, range(10), random_state=seed, skip=True):
+            counts[item] += 1
+    assert all(500 < count < 700 for count in counts)
+
+def test_random_sample_skip_numpy() -> None:
+    numpy = pytest.importorskip('numpy')
+    values = numpy.arange(100_000)
+    rsample: list[int] = list(random_sample(0.01, values, random_state=2016, skip=True))
+    assert rsample == list(random_sample(0.01, values, random_state=2016, skip=True))
+    assert rsample == sorted(set(rsample))
+    assert 800 < len(rsample) < 1200
+    assert len(list(random_sample(0.5, numpy.arange(10), random_state=1, skip=True))) <= 10
@@ -95,6 +95,8 @@ def test_functoolz():
     tested.append('compose_left')
     assert raises(TypeError, lambda: curry(None))
     tested.append('curry')
+    assert raises(TypeError, lambda: checked_curry(None))
+    tested.append('checked_curry')
     assert raises(TypeError, lambda: do(None, 1))
     tested.append('do')
     assert identity(None) is None
@@ -226,6 +228,12 @@ def test_itertoolz():
     assert raises(TypeError, lambda: list(random_sample(None, [1])))
     assert raises(TypeError, lambda: list(random_sample(0.1, None)))
     tested.append('random_sample')
+    assert raises(TypeError, lambda: list(pmap(None, [1])))
+    assert raises(TypeError, lambda: list(pmap(identity, None)))
+    tested.append('pmap')
+    assert raises(TypeError, lambda: prefetch(None, [1]))
+    assert raises(TypeError, lambda: list(prefetch(1, None)))
+    tested.append('prefetch')
     s1 = set(tested)
     s2 = set(humpy_cytoolz.itertoolz.__all__)
     assert s1 == s2, '%s not tested for being None-safe' % ', '.join(s2 - s1)
@@ -0,0 +1,67 @@
+# ruff:file-ignore[undocumented-public-module]
+"""Slice windows and partitions of buffers and NumPy arrays without copying.
+
+The functions in this module back the ``view`` modes of ``sliding_window``, ``partition``, and ``partition_all`` in
+``humpy_toolz`` and ``humpy_cytoolz``. NumPy is never imported here: if the ``numpy`` module has not been imported, ``seq`` cannot be an
+array. Every other input must support the buffer protocol, such as ``bytes``, ``bytearray``, ``array.array``, and
+``memoryview``, and is sliced along its first dimension through a ``memoryview``.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+import sys
+
+if TYPE_CHECKING:
+	from collections.abc import Iterator
+	from types import ModuleType
+	from typing import Any
+
+def _numpy_array(seq: object) -> ModuleType | None:
+	numpy: ModuleType | None = sys.modules.get('numpy')
+	if numpy is not None and isinstance(seq, numpy.ndarray) and seq.ndim >= 1:
+		return numpy
+	return None
+
+def _memoryview(seq: object) -> memoryview:
+	try:
+		return memoryview(seq)
+	except TypeError:
+		message: str = f'`view=True` needs a buffer, such as bytes or array.array, or a NumPy array, not {type(seq).__name__!r}.'
+		raise TypeError(message) from None
+
+def _check_size(n: int) -> None:
+	if n < 1:
+		message: str = f'`view=True` needs a positive `n`, not {n!r}.'
+		raise ValueError(message)
+
+def _strided_windows(numpy: ModuleType, n: int, seq: Any) -> Any:
+	"""Return the array of all windows of ``n`` elements of ``seq``, which shares the memory of ``seq``."""
+	if len(seq) < n:
+		return seq[:0].reshape(0, n, *seq.shape[1:])
+	# `sliding_window_view` appends the axis of the window; move it to follow the axis that counts the windows.
+	return numpy.moveaxis(numpy.lib.stride_tricks.sliding_window_view(seq, n, axis=0), -1, 1)
+
+def sliding_window_views(n: int, seq: Any) -> Iterator[Any]:
+	"""Yield the windows of ``n`` consecutive elements of ``seq`` as ``memoryview`` slices or NumPy views."""
+	_check_size(n)
+	numpy: ModuleType | None = _numpy_array(seq)
+	if numpy is not None:
+		return iter(_strided_windows(numpy, n, seq))
+	memory: memoryview = _memoryview(seq)
+	return (memory[start:start + n] for start in range(len(memory) - n + 1))
+
+def partition_views(n: int, seq: Any) -> Iterator[Any]:
+	"""Yield the partitions of ``n`` consecutive elements of ``seq``, without the incomplete last one, as views."""
+	_check_size(n)
+	numpy: ModuleType | None = _numpy_array(seq)
+	if numpy is not None:
+		return iter(_strided_windows(numpy, n, seq)[::n])
+	memory: memoryview = _memoryview(seq)
+	return (memory[start:start + n] for start in range(0, len(memory) - n + 1, n))
+
+def partition_all_views(n: int, seq: Any) -> Iterator[Any]:
+	"""Yield the partitions of ``n`` consecutive elements of ``seq``, with the shorter last one, as views."""
+	_check_size(n)
+	if _numpy_array(seq) is None:
+		seq = _memoryview(seq)
+	return (seq[start:start + n] for start in range(0, len(seq), n))
@@ -0,0 +1,372 @@
+# ruff:file-ignore[docstring-missing-returns, docstring-missing-exception]
+"""Bounded caches with eviction for ``memoize`` in ``humpy_toolz`` and ``humpy_cytoolz``.
+
+A cache here is a mutable mapping that ``memoize`` reads with ``cache[key]`` and writes with ``cache[key] = value``. A
+read of a missing or expired key raises ``KeyError``, a read of a live key counts as a use, and a write evicts entries
+until the cache fits in ``maxsize`` again. ``maxsize`` counts entries, or, with ``getsizeof``, the total weight
+``getsizeof(value)`` of the values, such as their size in bytes from ``sys.getsizeof``. With ``ttl``, an entry expires
+``ttl`` seconds after it was written.
+
+``single_flight`` memoizes a function so that concurrent calls with the same missing key compute it once.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import NamedTuple, TYPE_CHECKING
+import asyncio
+import contextlib
+import inspect
+import threading
+import time
+
+if TYPE_CHECKING:
+	from collections.abc import Awaitable, Callable, Hashable, Iterator, Mapping
+	from typing import Any
+
+class CacheInfo(NamedTuple):
+	"""The counters of a memoized function, returned by its ``cache_info`` method.
+
+	``evictions`` counts the entries that were evicted to make room and the entries that expired. ``currsize`` is in the
+	unit of ``maxsize``. Only a bounded cache counts, so the counters of any other cache are ``None``: counting in the
+	memoized function would slow down every call of an unbounded ``memoize``.
+	"""
+
+	hits: int | None
+	misses: int | None
+	evictions: int | None
+	maxsize: int | None
+	currsize: int
+
+class _BoundedCache[K: Hashable, V](MutableMapping[K, V], ABC):
+	"""The storage, weights, and expiry of a bounded cache; a subclass chooses the entry to evict."""
+
+	def __init__(self, maxsize: int | None = None, ttl: float | None = None, getsizeof: Callable[[V], int] | None = None) -> None:
+		self.maxsize: int | None = maxsize
+		self.ttl: float | None = ttl
+		self.getsizeof: Callable[[V], int] | None = getsizeof
+		self.currsize: int = 0
+		self.hits: int = 0
+		self.misses: int = 0
+		self.evictions: int = 0
+		self._data: dict[K, V] = {}
+		self._weights: dict[K, int] = {}
+		# The deadline of every key in the order of writing, which is the order of expiry because `ttl` is constant. An
+		# evicted key leaves it at once, so it never holds more keys than the cache.
+		self._deadlines: OrderedDict[K, float] = OrderedDict()
+
+	def _used(self, key: K) -> None:
+		"""Record a read of ``key``."""
+
+	def _added(self, key: K) -> None:
+		"""Record a write of the new key ``key``."""
+
+	def _removed(self, key: K) -> None:
+		"""Forget ``key``, which is no longer in the cache."""
+
+	@abstractmethod
+	def _victim(self) -> K:
+		"""Return the key to evict next."""
+
+	def __getitem__(self, key: K) -> V:
+		try:
+			value: V = self._data[key]
+		except KeyError:
+			self.misses += 1
+			raise
+		if self.ttl is not None and self._deadlines[key] <= time.monotonic():
+			self._remove(key)
+			self.evictions += 1
+			self.misses += 1
+			raise KeyError(key)
+		self.hits += 1
+		self._used(key)
+		return value
+
+	def __setitem__(self, key: K, value: V) -> None:
+		if key in self._data:
+			self._remove(key)
+		weight: int = 1 if self.getsizeof is None else self.getsizeof(value)
+		if self.maxsize is not None and weight > self.maxsize:
+			return
+		if self.ttl is not None:
+			now: float = time.monotonic()
+			self._expire(now)
+			self._deadlines[key] = now + self.ttl
+		if self.maxsize is not None:
+			while self.currsize + weight > self.maxsize:
+				self._remove(self._victim())
+				self.evictions += 1
+		self._data[key] = value
+		if self.getsizeof is not None:
+			self._weights[key] = weight
+		self.currsize += weight
+		self._added(key)
+
+	def __delitem__(self, key: K) -> None:
+		if key not in self._data:
+			raise KeyError(key)
+		self._remove(key)
+
+	def __contains__(self, key: object) -> bool:
+		return key in self._data and (self.ttl is None or self._deadlines[key] > time.monotonic())  # pyright: ignore[reportArgumentType]
+
+	def __iter__(self) -> Iterator[K]:
+		return iter(self._data)
+
+	def __len__(self) -> int:
+		return len(self._data)
+
+	def _remove(self, key: K) -> None:
+		del self._data[key]
+		self.currsize -= self._weights.pop(key) if self.getsizeof is not None else 1
+		if self.ttl is not None:
+			del self._deadlines[key]
+		self._removed(key)
+
+	def _expire(self, now: float) -> None:
+		deadlines: OrderedDict[K, float] = self._deadlines
+		while deadlines:
+			key: K = next(iter(deadlines))
+			if deadlines[key] > now:
+				break
+			self._remove(key)
+			self.evictions += 1
+
+	def clear(self) -> None:
+		self._data.clear()
+		self._weights.clear()
+		self._deadlines.clear()
+		self.currsize = 0
+
+	def __repr__(self) -> str:
+		return f'{type(self).__name__}(maxsize={self.maxsize!r}, ttl={self.ttl!r}, getsizeof={self.getsizeof!r})'
+
+class LRUCache[K: Hashable, V](_BoundedCache[K, V]):
+	"""A cache that evicts the least recently used entry first."""
+
+	def __init__(self, maxsize: int | None = None, ttl: float | None = None, getsizeof: Callable[[V], int] | None = None) -> None:
+		super().__init__(maxsize, ttl, getsizeof)
+		# `_data` and `_ordered` are the same `OrderedDict`; `_ordered` has the type that has `move_to_end`.
+		self._ordered: OrderedDict[K, V] = OrderedDict()
+		self._data = self._ordered
+
+	def _used(self, key: K) -> None:
+		self._ordered.move_to_end(key)
+
+	def _victim(self) -> K:
+		return next(iter(self._ordered))
+
+class LFUCache[K: Hashable, V](_BoundedCache[K, V]):
+	"""A cache that evicts the least frequently used entry first, and of those, the one that reached its count first.
+
+	The keys of every use count are kept in a bucket of their own, so a read, a write, and an eviction each take ``O(1)``.
+	"""
+
+	def __init__(self, maxsize: int | None = None, ttl: float | None = None, getsizeof: Callable[[V], int] | None = None) -> None:
+		super().__init__(maxsize, ttl, getsizeof)
+		self._counts: dict[K, int] = {}
+		self._buckets: dict[int, dict[K, None]] = {}
+		self._least: int = 0
+
+	def _used(self, key: K) -> None:
+		count: int = self._counts[key]
+		self._leave(key, count)
+		self._counts[key] = count + 1
+		following: dict[K, None] | None = self._buckets.get(count + 1)
+		if following is None:
+			self._buckets[count + 1] = {key: None}
+		else:
+			following[key] = None
+
+	def _added(self, key: K) -> None:
+		self._counts[key] = 1
+		self._buckets.setdefault(1, {})[key] = None
+		self._least = 1
+
+	def _removed(self, key: K) -> None:
+		self._leave(key, self._counts.pop(key))
+
+	def _leave(self, key: K, count: int) -> None:
+		bucket: dict[K, None] = self._buckets[count]
+		del bucket[key]
+		if not bucket:
+			del self._buckets[count]
+			if self._least == count:
+				self._least = count + 1
+
+	def _victim(self) -> K:
+		# After an eviction or an expiry, `_least` may name an emptied bucket; the smallest count is then the next one.
+		if self._least not in self._buckets:
+			self._least = min(self._buckets)
+		return next(iter(self._buckets[self._least]))
+
+	def clear(self) -> None:
+		super().clear()
+		self._counts.clear()
+		self._buckets.clear()
+
+_POLICIES: dict[str, type[_BoundedCache[Any, Any]]] = {'lru': LRUCache, 'lfu': LFUCache}
+
+def memoize_cache(
+	cache: Any, maxsize: int | None, policy: str, ttl: float | None, getsizeof: Callable[[Any], int] | None,
+) -> Any:
+	"""Return the cache of ``memoize``: ``cache``, a new ``dict``, or a new bounded cache of ``policy``."""
+	if policy not in _POLICIES:
+		message: str = f'`policy` must be one of {sorted(_POLICIES)!r}, not {policy!r}.'
+		raise ValueError(message)
+	if maxsize is None and ttl is None and getsizeof is None:
+		return {} if cache is None else cache
+	if cache is not None:
+		message = 'Pass `cache` or bound a new cache with `maxsize`, `ttl`, or `getsizeof`, not both.'
+		raise ValueError(message)
+	if maxsize is not None and maxsize < 0:
+		message = f'`maxsize` must be zero or more, not {maxsize!r}.'
+		raise ValueError(message)
+	if ttl is not None and ttl <= 0:
+		message = f'`ttl` must be a positive number of seconds, not {ttl!r}.'
+		raise ValueError(message)
+	return _POLICIES[policy](maxsize, ttl, getsizeof)
+
+def cache_info(cache: Any) -> CacheInfo:
+	"""Return the ``CacheInfo`` of a memoized function with ``cache``, which need not be a bounded cache."""
+	if isinstance(cache, _BoundedCache):
+		return CacheInfo(cache.hits, cache.misses, cache.evictions, cache.maxsize, cache.currsize)
+	return CacheInfo(None, None, None, None, len(cache))
+
+class _Flight:
+	"""The computation of one key by the first caller, which the other callers of the key wait for."""
+
+	__slots__ = ('done', 'error', 'result')
+
+	def __init__(self) -> None:
+		self.done: threading.Event = threading.Event()
+		self.error: BaseException | None = None
+		self.result: Any = None
+
+def _unhashable() -> TypeError:
+	message: str = 'Arguments to memoized function must be hashable'
+	return TypeError(message)
+
+def _single_flight_threads(func: Callable[..., Any], cache: Any, key: Callable[[tuple[Any, ...], Mapping[str, Any]], Any]) -> Callable[..., Any]:
+	# `lock` guards `cache` and `flights`; it is never held while `func` runs. A `_Flight` lives only while its key is
+	# computed, so the per-key state is removed as soon as the waiting callers can read the result.
+	lock: threading.Lock = threading.Lock()
+	flights: dict[Any, _Flight] = {}
+	# A read of a `dict` is atomic, so a hit in a `dict` needs no lock; a bounded cache reorders itself on every read.
+	lock_free_reads: bool = type(cache) is dict
+
+	def memof(*args: Any, **kwargs: Any) -> Any:
+		k: Any = key(args, kwargs)
+		if lock_free_reads:
+			try:
+				return cache[k]
+			except TypeError as error:
+				raise _unhashable() from error
+			except KeyError:
+				pass
+		with lock:
+			try:
+				return cache[k]
+			except TypeError as error:
+				raise _unhashable() from error
+			except KeyError:
+				pass
+			flight: _Flight | None = flights.get(k)
+			leader: bool = flight is None
+			if flight is None:
+				flight = flights[k] = _Flight()
+		if not leader:
+			flight.done.wait()
+			if flight.error is not None:
+				raise flight.error
+			return flight.result
+		try:
+			flight.result = func(*args, **kwargs)
+		except BaseException as error:
+			flight.error = error
+			raise
+		finally:
+			with lock:
+				try:
+					if flight.error is None:
+						cache[k] = flight.result
+				finally:
+					del flights[k]
+					flight.done.set()
+		return flight.result
+
+	return memof
+
+def _single_flight_asyncio(
+	func: Callable[..., Awaitable[Any]], cache: Any, key: Callable[[tuple[Any, ...], Mapping[str, Any]], Any],
+) -> Callable[..., Awaitable[Any]]:
+	# Tasks of one event loop switch only at `await`, so `cache` and `flights` need no lock.
+	flights: dict[Any, asyncio.Future[Any]] = {}
+
+	async def memof(*args: Any, **kwargs: Any) -> Any:
+		k: Any = key(args, kwargs)
+		while True:
+			try:
+				return cache[k]
+			except TypeError as error:
+				raise _unhashable() from error
+			except KeyError:
+				pass
+			flight: asyncio.Future[Any] | None = flights.get(k)
+			if flight is None:
+				break
+			try:
+				# `shield` keeps the cancellation of one waiting task from cancelling the computation of the others.
+				return await asyncio.shield(flight)
+			except asyncio.CancelledError:
+				task: asyncio.Task[Any] | None = asyncio.current_task()
+				if not flight.cancelled() or (task is not None and task.cancelling()):
+					raise
+				# The task that computed the key was cancelled; compute it again.
+		flight = flights[k] = asyncio.get_running_loop().create_future()
+		try:
+			result: Any = await func(*args, **kwargs)
+		except asyncio.CancelledError:
+			flight.cancel()
+			raise
+		except BaseException as error:
+			flight.set_exception(error)
+			# Mark the exception as retrieved, so an error that no other task waited for is not logged.
+			flight.exception()
+			raise
+		else:
+			cache[k] = result
+			flight.set_result(result)
+			return result
+		finally:
+			del flights[k]
+
+	return memof
+
+_CONCURRENCY: tuple[str, ...] = ('single_flight',)
+
+def single_flight(
+	func: Callable[..., Any], cache: Any, key: Callable[[tuple[Any, ...], Mapping[str, Any]], Any], concurrency: str,
+) -> Callable[..., Any]:
+	"""Return ``func`` memoized in ``cache`` so that one caller computes a missing key while the others wait for it.
+
+	A coroutine function gets a coroutine function that makes the tasks of an event loop wait for one another, and any
+	other function gets a function that is safe to call from many threads. An exception is raised to every caller that
+	waited for it and is not cached.
+	"""
+	if concurrency not in _CONCURRENCY:
+		message: str = f'`concurrency` must be None or one of {list(_CONCURRENCY)!r}, not {concurrency!r}.'
+		raise ValueError(message)
+	memof: Callable[..., Any]
+	if inspect.iscoroutinefunction(func):
+		memof = _single_flight_asyncio(func, cache, key)
+	else:
+		memof = _single_flight_threads(func, cache, key)
+	with contextlib.suppress(AttributeError):
+		memof.__name__ = func.__name__
+	memof.__doc__ = func.__doc__
+	memof.__wrapped__ = func  # pyright: ignore[reportFunctionMemberAccess]
+	memof.cache_info = lambda: cache_info(cache)  # pyright: ignore[reportFunctionMemberAccess]
+	return memof
@@ -0,0 +1,62 @@
+# ruff:file-ignore[undocumented-public-module]
+"""Hash values the same way in every process.
+
+The built-in ``hash`` of ``str`` and ``bytes`` is salted per process, so it cannot place items of different shards or
+sessions in the same bucket. ``stable_hash`` digests a canonical encoding of a value with BLAKE2b instead. Values that
+compare equal, such as ``1``, ``1.0``, and ``True``, have the same encoding, and the encoding of a ``frozenset`` does
+not depend on iteration order.
+"""
+from __future__ import annotations
+
+from hashlib import blake2b
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from collections.abc import Hashable
+
+def _encode(value: Hashable, parts: list[bytes]) -> None:
+	if value is None:
+		parts.append(b'N')
+	elif isinstance(value, (bool, int)):
+		parts.append(b'i%d;' % value)
+	elif isinstance(value, float):
+		if value.is_integer():
+			parts.append(b'i%d;' % value)
+		else:
+			parts.append(b'f' + value.hex().encode('ascii') + b';')
+	elif isinstance(value, str):
+		data: bytes = value.encode('utf-8', 'surrogatepass')
+		parts.append(b's%d:' % len(data))
+		parts.append(data)
+	elif isinstance(value, bytes):
+		parts.append(b'b%d:' % len(value))
+		parts.append(value)
+	elif isinstance(value, tuple):
+		parts.append(b'(')
+		for item in value:
+			_encode(item, parts)
+		parts.append(b')')
+	elif isinstance(value, frozenset):
+		parts.append(b'{')
+		parts.extend(sorted(encode(item) for item in value))
+		parts.append(b'}')
+	else:
+		message: str = (
+			f'Cannot compute a stable hash of {type(value).__name__!r}; use None, bool, int, float, str, bytes, '
+			'or tuples and frozensets of them.'
+		)
+		raise TypeError(message)
+
+def encode(value: Hashable) -> bytes:
+	"""Return the canonical encoding of ``value`` from which ``stable_hash`` is computed."""
+	parts: list[bytes] = []
+	_encode(value, parts)
+	return b''.join(parts)
+
+def stable_digest(value: Hashable, digest_size: int = 16) -> bytes:
+	"""Return a BLAKE2b digest of ``digest_size`` bytes of ``value`` that is the same in every process and every session."""
+	return blake2b(encode(value), digest_size=digest_size).digest()
+
+def stable_hash(value: Hashable) -> int:
+	"""Return an unsigned 64-bit hash of ``value`` that is the same in every process and every session."""
+	return int.from_bytes(stable_digest(value, 8), 'little')
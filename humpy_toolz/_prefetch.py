@@ -0,0 +1,153 @@
+# ruff:file-ignore[undocumented-public-module]
+"""Read iterables ahead and map functions over them on background threads.
+
+The functions in this module back ``prefetch``, ``pmap``, and the ``prefetch`` mode of ``merge_sorted`` in
+``humpy_toolz`` and ``humpy_cytoolz``.
+"""
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from queue import Empty, Queue
+from typing import TYPE_CHECKING
+import functools
+import itertools
+import os
+import threading
+
+if TYPE_CHECKING:
+	from collections.abc import Callable, Iterable, Iterator, Sequence
+	from concurrent.futures import Future
+	from typing import Any
+
+def check_batchsize(batchsize: int) -> None:
+	if batchsize < 1:
+		message: str = f'`prefetch` must be a positive number of items per batch, not {batchsize!r}.'
+		raise ValueError(message)
+
+def _read_batch[T](iterator: Iterator[T], batchsize: int) -> list[T]:
+	return list(itertools.islice(iterator, batchsize))
+
+def _batches[T](read: Callable[[], list[T]], future: Future[list[T]], executor: ThreadPoolExecutor, batchsize: int) -> Iterator[list[T]]:
+	# Only one read of an iterator is ever in flight, so the iterator is never advanced by two threads at once.
+	while True:
+		batch: list[T] = future.result()
+		if len(batch) < batchsize:
+			if batch:
+				yield batch
+			return
+		future = executor.submit(read)
+		yield batch
+
+def prefetched[T](seqs: Sequence[Iterable[T]], batchsize: int, executor: ThreadPoolExecutor) -> list[Iterator[T]]:
+	"""Return one iterator per iterable of ``seqs`` whose next batch of ``batchsize`` items is read by ``executor``.
+
+	The first batch of every iterable is requested immediately, so the reads of all iterables overlap. Each later batch is
+	requested when the consumer starts on the batch before it.
+	"""
+	iterators: list[Iterator[T]] = []
+	for seq in seqs:
+		read: Callable[[], list[T]] = functools.partial(_read_batch, iter(seq), batchsize)
+		iterators.append(itertools.chain.from_iterable(_batches(read, executor.submit(read), executor, batchsize)))
+	return iterators
+
+def prefetched_merge[T](merge: Callable[[Sequence[Iterable[T]]], Iterator[T]], seqs: Sequence[Iterable[T]], batchsize: int) -> Iterator[T]:
+	"""Merge ``seqs`` with ``merge`` while a thread pool reads every iterable ahead in batches of ``batchsize`` items."""
+	executor: ThreadPoolExecutor = ThreadPoolExecutor(thread_name_prefix='humpy_toolz-prefetch')
+	try:
+		yield from merge(prefetched(seqs, batchsize, executor))
+	finally:
+		executor.shutdown(wait=True, cancel_futures=True)
+
+class _Failure:
+	"""The exception that ended the source of a ``prefetch``, passed to the consumer through the queue."""
+
+	def __init__(self, error: BaseException) -> None:
+		self.error: BaseException = error
+
+_exhausted: object = object()
+
+def _read_ahead(iterator: Iterator[Any], buffer: Queue[Any], stopped: threading.Event) -> None:
+	# `stopped` is checked after every `put`: when the consumer stops, it empties `buffer`, so a blocked `put` returns.
+	try:
+		for item in iterator:
+			buffer.put(item)
+			if stopped.is_set():
+				return
+	except BaseException as error:
+		buffer.put(_Failure(error))
+	else:
+		buffer.put(_exhausted)
+
+def _prefetched[T](n: int, seq: Iterable[T]) -> Iterator[T]:
+	buffer: Queue[Any] = Queue(n)
+	stopped: threading.Event = threading.Event()
+	threading.Thread(target=_read_ahead, args=(iter(seq), buffer, stopped), name='humpy_toolz-prefetch', daemon=True).start()
+	try:
+		while True:
+			item: Any = buffer.get()
+			if item is _exhausted:
+				return
+			if isinstance(item, _Failure):
+				raise item.error
+			yield item
+	finally:
+		stopped.set()
+		try:
+			while True:
+				buffer.get_nowait()
+		except Empty:
+			pass
+
+def read_ahead[T](n: int, seq: Iterable[T]) -> Iterator[T]:
+	"""Iterate over ``seq`` while a background thread reads up to ``n`` items ahead, in order."""
+	if n < 1:
+		message: str = f'`prefetch` must read ahead a positive number of items, not {n!r}.'
+		raise ValueError(message)
+	return _prefetched(n, seq)
+
+def _mapped_in_order[T, R](func: Callable[[T], R], seq: Iterable[T], max_inflight: int, executor: ThreadPoolExecutor) -> Iterator[R]:
+	pending: deque[Future[R]] = deque()
+	for item in seq:
+		pending.append(executor.submit(func, item))
+		if len(pending) >= max_inflight:
+			yield pending.popleft().result()
+	while pending:
+		yield pending.popleft().result()
+
+def _mapped_as_completed[T, R](func: Callable[[T], R], seq: Iterable[T], max_inflight: int, executor: ThreadPoolExecutor) -> Iterator[R]:
+	pending: set[Future[R]] = set()
+	for item in seq:
+		pending.add(executor.submit(func, item))
+		if len(pending) >= max_inflight:
+			done, pending = wait(pending, return_when=FIRST_COMPLETED)
+			for future in done:
+				yield future.result()
+	while pending:
+		done, pending = wait(pending, return_when=FIRST_COMPLETED)
+		for future in done:
+			yield future.result()
+
+def _pmapped[T, R](func: Callable[[T], R], seq: Iterable[T], ordered: bool, max_inflight: int, workers: int | None) -> Iterator[R]:
+	executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='humpy_toolz-pmap')
+	try:
+		if ordered:
+			yield from _mapped_in_order(func, seq, max_inflight, executor)
+		else:
+			yield from _mapped_as_completed(func, seq, max_inflight, executor)
+	finally:
+		executor.shutdown(wait=True, cancel_futures=True)
+
+def parallel_map[T, R](
+	func: Callable[[T], R], seq: Iterable[T], ordered: bool, max_inflight: int | None, workers: int | None,
+) -> Iterator[R]:
+	"""Map ``func`` over ``seq`` on a pool of ``workers`` threads with at most ``max_inflight`` calls submitted at once."""
+	if workers is not None and workers < 1:
+		message: str = f'`workers` must be a positive number of threads, not {workers!r}.'
+		raise ValueError(message)
+	if max_inflight is None:
+		max_inflight = 2 * (workers or min(32, (os.cpu_count() or 1) + 4))
+	elif max_inflight < 1:
+		message = f'`max_inflight` must be a positive number of calls, not {max_inflight!r}.'
+		raise ValueError(message)
+	return _pmapped(func, seq, ordered, max_inflight, workers)
@@ -0,0 +1,94 @@
+# ruff:file-ignore[undocumented-public-module]
+"""Sample iterables by drawing the gaps between chosen items instead of one coin per item.
+
+The functions in this module back the ``skip`` mode of ``random_sample`` in ``humpy_toolz`` and ``humpy_cytoolz`` and
+``reservoir_sample`` in ``humpy_toolz.sandbox``. NumPy is never imported here: if the ``numpy`` module has not been
+imported, ``seq`` cannot be an array. The generator of an array path is seeded from one number of the Python
+``random_state``, so an integer seed reproduces the sample.
+"""
+from __future__ import annotations
+
+from humpy_toolz._buffers import _numpy_array
+from itertools import islice
+from typing import TYPE_CHECKING
+import math
+
+if TYPE_CHECKING:
+	from collections.abc import Iterable, Iterator
+	from humpy_toolz._theTypes import Randomable
+	from types import ModuleType
+	from typing import Any
+
+def _open_uniform(getNumber: Randomable) -> float:
+	"""Return a float between 0.0 and 1.0, both exclusive, so that its logarithm and the logarithm of its complement exist."""
+	number: float = getNumber.random()
+	while number == 0.0:
+		number = getNumber.random()
+	return number
+
+def _generator(numpy: ModuleType, getNumber: Randomable) -> Any:
+	return numpy.random.default_rng(int(getNumber.random() * 2**53))
+
+def _skip_sample_array(numpy: ModuleType, prob: float, seq: Any, getNumber: Randomable) -> Any:
+	size: int = len(seq)
+	generator: Any = _generator(numpy, getNumber)
+	# Draw the gaps in batches that cover the expected number of samples, so one or two batches usually suffice.
+	batch: int = int(size * prob * 1.05) + 64
+	chunks: list[Any] = []
+	position: int = -1
+	while position < size:
+		positions: Any = position + numpy.cumsum(generator.geometric(prob, batch))
+		chunks.append(positions[positions < size])
+		position = int(positions[-1])
+	return seq[numpy.concatenate(chunks)]
+
+def _skip_sample[T](prob: float, seq: Iterable[T], getNumber: Randomable) -> Iterator[T]:
+	iterator: Iterator[T] = iter(seq)
+	scale: float = 1.0 / math.log1p(-prob)
+	while True:
+		# The number of items before the next chosen item follows the geometric distribution of the coins of `prob`.
+		gap: int = int(math.log(_open_uniform(getNumber)) * scale)
+		for item in islice(iterator, gap, gap + 1):
+			yield item
+			break
+		else:
+			return
+
+def skip_sample[T](prob: float, seq: Iterable[T], getNumber: Randomable) -> Iterator[T]:
+	"""Yield every item of ``seq`` with probability ``prob`` with one call of ``getNumber.random`` per chosen item."""
+	if prob >= 1:
+		return iter(seq)
+	if prob <= 0:
+		return iter(())
+	numpy: ModuleType | None = _numpy_array(seq)
+	if numpy is not None:
+		return iter(_skip_sample_array(numpy, prob, seq, getNumber))
+	return _skip_sample(prob, seq, getNumber)
+
+def reservoir(k: int, seq: Iterable[Any], getNumber: Randomable) -> Any:
+	"""Return ``k`` items of ``seq`` chosen uniformly at random, in the order of ``seq``, with Algorithm L of Li (1994).
+
+	Algorithm L draws the number of items to skip before the next replacement of the reservoir, so it calls
+	``getNumber.random`` ``O(k * log(len(seq) / k))`` times. The rows of a NumPy array are sampled with one call of
+	``numpy.random.Generator.choice``, and the result is an array.
+	"""
+	numpy: ModuleType | None = _numpy_array(seq)
+	if numpy is not None:
+		if len(seq) <= k:
+			return seq.copy()
+		return seq[numpy.sort(_generator(numpy, getNumber).choice(len(seq), size=k, replace=False))]
+
+	iterator: Iterator[tuple[int, Any]] = enumerate(seq)
+	chosen: list[tuple[int, Any]] = list(islice(iterator, k))
+	if len(chosen) == k and k:
+		weight: float = math.exp(math.log(_open_uniform(getNumber)) / k)
+		while True:
+			gap: int = int(math.log(_open_uniform(getNumber)) / math.log1p(-weight))
+			for pair in islice(iterator, gap, gap + 1):
+				chosen[int(getNumber.random() * k)] = pair
+				weight *= math.exp(math.log(_open_uniform(getNumber)) / k)
+				break
+			else:
+				break
+		chosen.sort(key=lambda pair: pair[0])
+	return [item for _index, item in chosen]
@@ -27,7 +27,7 @@ Users should try to not use this module directly.
 
 from __future__ import annotations
 
-from .functoolz import has_keywords, has_varargs, is_arity, is_partial_args, num_required_args
+from .functoolz import _argspec, _ArgSpec, has_keywords, has_varargs, is_arity, is_partial_args, num_required_args
 from collections.abc import Callable
 from importlib import import_module
 from typing import Any, TYPE_CHECKING, TypeAlias
@@ -288,11 +288,12 @@ module_info[operator] = {
 	'xor': [lambda a, b: None],
 }
 module_info['humpy_toolz'] = {
+	'checked_curry': [(0, lambda *args, **kwargs: None)],
 	'curry': [(0, lambda *args, **kwargs: None)],
 	'excepts': [(0, lambda exc, func, handler=None: None)],
 	'flip': [(0, lambda func=None, a=None, b=None: None)],
 	'juxt': [(0, lambda *funcs: None)],
-	'memoize': [(0, lambda func=None, cache=None, key=None: None)],
+	'memoize': [(0, lambda func=None, cache=None, key=None, *, maxsize=None, policy='lru', ttl=None, getsizeof=None, concurrency=None: None)],
 }
 module_info['humpy_toolz.functoolz'] = {
 	'Compose': [(0, lambda funcs: None)],
@@ -314,10 +315,8 @@ def get_exclude_keywords(num_pos_only: builtins.int, sigspec: inspect.Signature)
 	return tuple(x.name for x in pos_args)
 
 def signature_or_spec(func: Callable[..., Any]) -> inspect.Signature | None:
-	try:
-		return inspect.signature(func)
-	except (ValueError, TypeError):
-		return None
+	spec = _argspec(func)
+	return spec.sigspec if isinstance(spec, _ArgSpec) else None
 
 def expand_sig(sig: SignatureInput) -> SignatureSpecification:
 	"""Convert the signature spec in ``module_info`` to add to ``signatures``
@@ -0,0 +1,281 @@
+# ruff:file-ignore[undocumented-public-module]
+"""Spill hash partitions of grouped data to temporary files.
+
+The functions in this module back the ``max_memory`` modes of ``groupby`` and ``join`` in ``humpy_toolz`` and
+``humpy_cytoolz``. Every record is pickled, so keys and items must be picklable when the memory budget is exceeded.
+"""
+from __future__ import annotations
+
+from humpy_toolz.utils import no_default
+from typing import TYPE_CHECKING
+import os
+import pickle
+import sys
+import tempfile
+
+if TYPE_CHECKING:
+	from collections.abc import Callable, Hashable, Iterable, Iterator
+
+SPILL_BUCKETS: int = 32
+"""Number of hash buckets into which one level of spilling partitions the data."""
+
+SPILL_LEVELS: int = 4
+"""Maximum depth of recursive repartitioning of a bucket that is larger than the memory budget."""
+
+def _sizeof_item(item: object) -> int:
+	# The shallow size of the item plus one slot of the list that holds it.
+	return sys.getsizeof(item) + 8
+
+def _bucket_of(key: Hashable, level: int) -> int:
+	# Salting the hash with the level spreads the keys of one bucket over the buckets of the next level.
+	return hash((level, key)) % SPILL_BUCKETS
+
+def check_max_memory(max_memory: int) -> None:
+	if max_memory <= 0:
+		message: str = f'`max_memory` must be a positive number of bytes, not {max_memory!r}.'
+		raise ValueError(message)
+
+class SpillDirectory:
+	"""Own a temporary directory of bucket files into which records are appended with ``pickle``."""
+
+	def __init__(self, tmpdir: str | None = None) -> None:
+		self._directory: tempfile.TemporaryDirectory[str] = tempfile.TemporaryDirectory(prefix='humpy_toolz-', dir=tmpdir)
+		self._counter: int = 0
+
+	@property
+	def name(self) -> str:
+		return self._directory.name
+
+	def new_buckets(self) -> list[str]:
+		self._counter += 1
+		return [os.path.join(self.name, f'{self._counter}-{index}.pickle') for index in range(SPILL_BUCKETS)]
+
+	def new_file(self) -> str:
+		self._counter += 1
+		return os.path.join(self.name, f'{self._counter}.run')
+
+	def cleanup(self) -> None:
+		self._directory.cleanup()
+
+def flush_records[R](partitions: list[list[R]], buckets: list[str]) -> None:
+	"""Append the records of every partition to the file of its bucket and empty the partitions."""
+	for path, records in zip(buckets, partitions, strict=True):
+		if records:
+			with open(path, 'ab') as writeStream:
+				pickle.dump(records, writeStream, pickle.HIGHEST_PROTOCOL)
+			records.clear()
+
+def flush_groups[K: Hashable, T](groups: dict[K, list[T]], buckets: list[str], level: int) -> None:
+	"""Append every group of ``groups`` to the file of its bucket and clear ``groups``."""
+	partitions: list[list[tuple[K, list[T]]]] = [[] for _ in range(SPILL_BUCKETS)]
+	for key, items in groups.items():
+		partitions[_bucket_of(key, level)].append((key, items))
+	flush_records(partitions, buckets)
+	groups.clear()
+
+def read_records[R](path: str) -> Iterator[R]:
+	if not os.path.exists(path):
+		return
+	with open(path, 'rb') as readStream:
+		while True:
+			try:
+				records: list[R] = pickle.load(readStream)
+			except EOFError:
+				return
+			yield from records
+
+def _load_groups[K: Hashable, T](path: str) -> dict[K, list[T]]:
+	groups: dict[K, list[T]] = {}
+	for key, items in read_records(path):
+		if key in groups:
+			groups[key].extend(items)
+		else:
+			groups[key] = items
+	return groups
+
+def _too_large(path: str, max_memory: int, level: int) -> bool:
+	return level < SPILL_LEVELS and os.path.exists(path) and os.path.getsize(path) > max_memory
+
+def _repartition_groups(spill: SpillDirectory, path: str, max_memory: int, level: int) -> list[str]:
+	groups: dict[Hashable, list[object]] = {}
+	buckets: list[str] = spill.new_buckets()
+	used: int = 0
+	for key, items in read_records(path):
+		if key in groups:
+			groups[key].extend(items)
+		else:
+			groups[key] = items
+		used += sum(map(_sizeof_item, items))
+		if used > max_memory:
+			flush_groups(groups, buckets, level)
+			used = 0
+	flush_groups(groups, buckets, level)
+	os.remove(path)
+	return buckets
+
+def _repartition_keyed(spill: SpillDirectory, path: str, max_memory: int, level: int) -> list[str]:
+	partitions: list[list[tuple[Hashable, object]]] = [[] for _ in range(SPILL_BUCKETS)]
+	buckets: list[str] = spill.new_buckets()
+	used: int = 0
+	for key, item in read_records(path):
+		partitions[_bucket_of(key, level)].append((key, item))
+		used += _sizeof_item(item)
+		if used > max_memory:
+			flush_records(partitions, buckets)
+			used = 0
+	flush_records(partitions, buckets)
+	if os.path.exists(path):
+		os.remove(path)
+	return buckets
+
+def _is_split(buckets: list[str]) -> bool:
+	# If every key landed in the same bucket, more levels will not split it.
+	return sum(map(os.path.exists, buckets)) > 1
+
+def _partition_groups[T, K: Hashable](
+	predicate: Callable[[T], K], seq: Iterable[T], max_memory: int, tmpdir: str | None,
+) -> tuple[dict[K, list[T]], SpillDirectory | None, list[str]]:
+	"""Group ``seq`` in memory until ``max_memory`` is exceeded, then spill hash buckets of the groups.
+
+	Return the groups that are still in memory, the spill directory or ``None`` if nothing was spilled, and the paths of the
+	buckets of level 0.
+	"""
+	check_max_memory(max_memory)
+	groups: dict[K, list[T]] = {}
+	spill: SpillDirectory | None = None
+	buckets: list[str] = []
+	used: int = 0
+	try:
+		for item in seq:
+			key: K = predicate(item)
+			if key in groups:
+				groups[key].append(item)
+			else:
+				groups[key] = [item]
+				used += sys.getsizeof(key) + 64
+			used += _sizeof_item(item)
+			if used > max_memory:
+				if spill is None:
+					spill = SpillDirectory(tmpdir)
+					buckets = spill.new_buckets()
+				flush_groups(groups, buckets, 0)
+				used = 0
+	except BaseException:
+		if spill is not None:
+			spill.cleanup()
+		raise
+	return (groups, spill, buckets)
+
+def _read_bucket[K: Hashable, T](spill: SpillDirectory, path: str, max_memory: int, level: int) -> Iterator[tuple[K, list[T]]]:
+	if _too_large(path, max_memory, level):
+		buckets: list[str] = _repartition_groups(spill, path, max_memory, level)
+		if _is_split(buckets):
+			for bucket in buckets:
+				yield from _read_bucket(spill, bucket, max_memory, level + 1)
+			return
+		path = next(bucket for bucket in buckets if os.path.exists(bucket))
+	groups: dict[K, list[T]] = _load_groups(path)
+	if os.path.exists(path):
+		os.remove(path)
+	yield from groups.items()
+
+def spilling_groupby[T, K: Hashable](
+	predicate: Callable[[T], K], seq: Iterable[T], max_memory: int, tmpdir: str | None = None,
+) -> Iterator[tuple[K, list[T]]]:
+	"""Group ``seq`` by ``predicate`` and spill hash buckets of the groups to disk whenever ``max_memory`` is exceeded.
+
+	Return an iterator of ``(key, group)`` pairs. If ``seq`` fits in ``max_memory`` bytes, the pairs are in order of first
+	appearance; otherwise the pairs come bucket by bucket. The items of each group are always in the order of ``seq``.
+	``max_memory`` is checked before this returns, not when the iterator starts.
+	"""
+	check_max_memory(max_memory)
+	return _spilling_groupby(predicate, seq, max_memory, tmpdir)
+
+def _spilling_groupby[T, K: Hashable](
+	predicate: Callable[[T], K], seq: Iterable[T], max_memory: int, tmpdir: str | None,
+) -> Iterator[tuple[K, list[T]]]:
+	groups, spill, buckets = _partition_groups(predicate, seq, max_memory, tmpdir)
+	if spill is None:
+		yield from groups.items()
+		return
+	try:
+		flush_groups(groups, buckets, 0)
+		for path in buckets:
+			yield from _read_bucket(spill, path, max_memory, 1)
+	finally:
+		spill.cleanup()
+
+def probe[K: Hashable, T, U](
+	groups: dict[K, list[T]], keyed_right: Iterable[tuple[K, U]], left_default: object, right_default: object,
+) -> Iterator[tuple[T | object, U | object]]:
+	"""Hash join the ``(key, item)`` pairs of the right side against the groups of the left side."""
+	seen_keys: set[K] | None = None if right_default == no_default else set()
+	for key, item in keyed_right:
+		if seen_keys is not None:
+			seen_keys.add(key)
+		matches: list[T] | None = groups.get(key)
+		if matches is not None:
+			for match in matches:
+				yield (match, item)
+		elif left_default != no_default:
+			yield (left_default, item)
+	if seen_keys is not None:
+		for key, matches in groups.items():
+			if key not in seen_keys:
+				for match in matches:
+					yield (match, right_default)
+
+def _join_buckets(
+	spill: SpillDirectory, left_path: str, right_path: str, left_default: object, right_default: object, max_memory: int, level: int,
+) -> Iterator[tuple[object, object]]:
+	if _too_large(left_path, max_memory, level):
+		left_buckets: list[str] = _repartition_groups(spill, left_path, max_memory, level)
+		if _is_split(left_buckets):
+			right_buckets: list[str] = _repartition_keyed(spill, right_path, max_memory, level)
+			for left_bucket, right_bucket in zip(left_buckets, right_buckets, strict=True):
+				yield from _join_buckets(spill, left_bucket, right_bucket, left_default, right_default, max_memory, level + 1)
+			return
+		left_path = next(bucket for bucket in left_buckets if os.path.exists(bucket))
+	groups: dict[Hashable, list[object]] = _load_groups(left_path)
+	yield from probe(groups, read_records(right_path), left_default, right_default)
+	for path in (left_path, right_path):
+		if os.path.exists(path):
+			os.remove(path)
+
+def grace_join[T, U](
+	leftkey: Callable[[T], Hashable],
+	leftseq: Iterable[T],
+	rightkey: Callable[[U], Hashable],
+	rightseq: Iterable[U],
+	left_default: object,
+	right_default: object,
+	max_memory: int,
+	tmpdir: str | None = None,
+) -> Iterator[tuple[T | object, U | object]]:
+	"""Hash join two sequences and partition both of them to disk if the left side exceeds ``max_memory``.
+
+	If ``leftseq`` fits in ``max_memory`` bytes, this is the in-memory hash join of ``join``. Otherwise the groups of the left
+	side and the ``(key, item)`` pairs of the right side are partitioned into matching hash buckets on disk, and each pair
+	of buckets is joined in memory. Buckets whose left side is still too large are repartitioned with a new hash salt.
+	"""
+	groups, spill, left_buckets = _partition_groups(leftkey, leftseq, max_memory, tmpdir)
+	if spill is None:
+		yield from probe(groups, ((rightkey(item), item) for item in rightseq), left_default, right_default)
+		return
+	try:
+		flush_groups(groups, left_buckets, 0)
+		right_buckets: list[str] = spill.new_buckets()
+		partitions: list[list[tuple[Hashable, U]]] = [[] for _ in range(SPILL_BUCKETS)]
+		used: int = 0
+		for item in rightseq:
+			key: Hashable = rightkey(item)
+			partitions[_bucket_of(key, 0)].append((key, item))
+			used += _sizeof_item(item)
+			if used > max_memory:
+				flush_records(partitions, right_buckets)
+				used = 0
+		flush_records(partitions, right_buckets)
+		for left_path, right_path in zip(left_buckets, right_buckets, strict=True):
+			yield from _join_buckets(spill, left_path, right_path, left_default, right_default, max_memory, 1)
+	finally:
+		spill.cleanup()
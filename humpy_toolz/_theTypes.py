@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable
-from typing import Any, Protocol, TypeVar
+from typing import Any, IO, Literal, Protocol, TypeVar
 
 _KT_contra = TypeVar('_KT_contra', contravariant=True)
 _T_contra = TypeVar('_T_contra', contravariant=True)
@@ -12,6 +12,22 @@ class Randomable(Protocol):
 
 	def random(self) -> float: ...
 
+class Serializer(Protocol):
+	"""Objects, such as the ``pickle`` and ``marshal`` modules, that write objects to and read objects from binary files."""
+
+	def dump(self, obj: Any, file: IO[bytes], /) -> None: ...
+	def load(self, file: IO[bytes], /) -> Any: ...
+
+class BytesSerializer(Protocol):
+	"""Objects, such as the ``pickle`` and ``marshal`` modules, that convert objects to and from ``bytes``."""
+
+	def dumps(self, obj: Any, /) -> bytes: ...
+	def loads(self, data: bytes, /) -> Any: ...
+
+class SupportsAddContains(Protocol[_T_contra]):
+	def __contains__(self, x: object, /) -> bool: ...
+	def add(self, x: _T_contra, /) -> None: ...
+
 class SupportsBool(Protocol):
 	"""Objects supporting truth-value testing via ``__bool__``."""
 
@@ -32,6 +48,8 @@ class SupportsGetItem(Protocol[_KT_contra, _VT_co]):
 
 	def __getitem__(self, key: _KT_contra, /) -> _VT_co: ...
 
+type JoinStrategy = Literal['auto', 'grace', 'hash', 'sort-merge']
+
 type SupportsRichComparison = SupportsDunderLT[Any] | SupportsDunderGT[Any]
 
 type MapFunction[TypeElement, TypeResult] = Callable[[Callable[[Iterable[TypeElement]], TypeResult], Iterable[Iterable[TypeElement]]], Iterable[TypeResult]]
@@ -0,0 +1,157 @@
+# ruff:file-ignore[undocumented-public-module, import-outside-top-level]
+"""Compute ``frequencies``, ``groupby``, ``reduceby``, and ``countby`` of NumPy arrays with NumPy.
+
+NumPy is never imported here: if the ``numpy`` module has not been imported, ``seq`` cannot be an array. Every function
+returns ``None`` when its arguments are not eligible for the vectorized path, and the caller then runs its pure Python
+loop. The dictionaries that are returned have the keys in order of first appearance, as the pure Python loops do, but
+the keys and reduced values are Python scalars from ``ndarray.tolist`` instead of NumPy scalars.
+"""
+from __future__ import annotations
+
+from humpy_toolz.utils import no_default
+from typing import TYPE_CHECKING
+import operator
+import sys
+
+if TYPE_CHECKING:
+	from collections.abc import Callable, Hashable
+	from types import ModuleType
+	from typing import Any
+
+_KEY_KINDS: str = 'biufUS'
+"""`dtype.kind` of keys that `numpy.unique` sorts the same way that Python compares them: bool, integers, floats, str, bytes."""
+
+_VALUE_KINDS: str = 'iuf'
+"""`dtype.kind` of values that ``reduceby`` reduces with a ufunc."""
+
+def _numpy(seq: Any) -> ModuleType | None:
+	numpy: ModuleType | None = sys.modules.get('numpy')
+	if numpy is None or not isinstance(seq, numpy.ndarray) or seq.ndim != 1:
+		return None
+	return numpy
+
+def _simple(numpy: ModuleType, keys: Any) -> bool:
+	dtypes: list[Any] = [keys.dtype] if keys.dtype.names is None else [keys.dtype[name] for name in keys.dtype.names]
+	for dtype in dtypes:
+		if dtype.kind not in _KEY_KINDS or dtype.shape:
+			return False
+	# `nan != nan`, so every NaN is its own key in a dict, but `numpy.unique` would merge them.
+	if keys.dtype.names is None:
+		return keys.dtype.kind != 'f' or not numpy.isnan(keys).any()
+	return not any(keys.dtype[name].kind == 'f' and numpy.isnan(keys[name]).any() for name in keys.dtype.names)
+
+def _keys(numpy: ModuleType, key: Callable[[Any], Hashable] | Any, seq: Any) -> Any:
+	"""Return the array of the keys of the elements of ``seq``, or ``None`` if the keys cannot be computed by NumPy."""
+	if isinstance(key, numpy.ufunc):
+		if key.nin != 1 or key.nout != 1:
+			return None
+		keys: Any = key(seq)
+	else:
+		if type(key) is operator.itemgetter:
+			fields: tuple[Any, ...] = key.__reduce__()[1]
+			is_tuple: bool = len(fields) > 1
+		elif callable(key):
+			return None
+		elif isinstance(key, list):
+			fields = tuple(key)
+			is_tuple = True
+		else:
+			fields = (key,)
+			is_tuple = False
+		names: tuple[str, ...] | None = seq.dtype.names
+		if names is None or not fields or not all(isinstance(field, str) and field in names for field in fields):
+			return None
+		if is_tuple:
+			from numpy.lib import recfunctions
+			keys = recfunctions.repack_fields(seq[list(fields)])
+		else:
+			keys = seq[fields[0]]
+	if getattr(keys, 'shape', None) != seq.shape or not _simple(numpy, keys):
+		return None
+	return keys
+
+def _distinct(numpy: ModuleType, keys: Any) -> tuple[Any, Any, Any, Any]:
+	"""Return the distinct keys in order of first appearance, the count of each, the index of each element's key in the
+	sorted distinct keys, and the permutation from sorted order to order of first appearance."""
+	# `numpy.unique(..., return_index=True)` needs a stable argsort of all of `keys`, which costs more than everything else
+	# here; `searchsorted` and `minimum.at` find the first appearances from the sorted distinct keys instead.
+	distinct, counts = numpy.unique(keys, return_counts=True)
+	inverse: Any = numpy.searchsorted(distinct, keys)
+	first: Any = numpy.full(len(distinct), len(keys), dtype=numpy.intp)
+	numpy.minimum.at(first, inverse, numpy.arange(len(keys), dtype=numpy.intp))
+	appearance: Any = numpy.argsort(first, kind='stable')
+	return (distinct[appearance], counts[appearance], inverse, appearance)
+
+def _group_indices(numpy: ModuleType, keys: Any) -> tuple[list[Hashable], Any, Any]:
+	"""Return the distinct keys in order of first appearance, the stable permutation that sorts ``seq`` by group, and the
+	offsets in the permuted ``seq`` at which the groups after the first start."""
+	distinct, counts, inverse, appearance = _distinct(numpy, keys)
+	rank: Any = numpy.empty_like(appearance)
+	rank[appearance] = numpy.arange(len(appearance))
+	order: Any = numpy.argsort(rank[inverse], kind='stable')
+	return (distinct.tolist(), order, numpy.cumsum(counts)[:-1])
+
+def vectorized_frequencies(seq: Any) -> dict[Any, int] | None:
+	numpy: ModuleType | None = _numpy(seq)
+	if numpy is None or not _simple(numpy, seq):
+		return None
+	distinct, counts, _inverse, _appearance = _distinct(numpy, seq)
+	return dict(zip(distinct.tolist(), counts.tolist(), strict=True))
+
+def vectorized_countby(key: Callable[[Any], Hashable] | Any, seq: Any) -> dict[Any, int] | None:
+	numpy: ModuleType | None = _numpy(seq)
+	if numpy is None:
+		return None
+	keys: Any = _keys(numpy, key, seq)
+	if keys is None:
+		return None
+	return vectorized_frequencies(keys)
+
+def vectorized_groupby(key: Callable[[Any], Hashable] | Any, seq: Any) -> dict[Any, list[Any]] | None:
+	numpy: ModuleType | None = _numpy(seq)
+	if numpy is None:
+		return None
+	keys: Any = _keys(numpy, key, seq)
+	if keys is None:
+		return None
+	distinct, order, offsets = _group_indices(numpy, keys)
+	if not distinct:
+		return {}
+	return dict(zip(distinct, map(list, numpy.split(seq[order], offsets)), strict=True))
+
+def _ufunc_of(numpy: ModuleType, binop: Callable[[Any, Any], Any]) -> Any:
+	ufuncs: dict[Any, Any] = {
+		operator.add: numpy.add,
+		operator.mul: numpy.multiply,
+		max: numpy.maximum,
+		min: numpy.minimum,
+		numpy.add: numpy.add,
+		numpy.multiply: numpy.multiply,
+		numpy.maximum: numpy.maximum,
+		numpy.minimum: numpy.minimum,
+	}
+	return ufuncs.get(binop)
+
+def vectorized_reduceby(
+	key: Callable[[Any], Hashable] | Any, binop: Callable[[Any, Any], Any], seq: Any, init: Any = no_default,
+) -> dict[Any, Any] | None:
+	numpy: ModuleType | None = _numpy(seq)
+	if numpy is None or seq.dtype.kind not in _VALUE_KINDS:
+		return None
+	ufunc: Any = _ufunc_of(numpy, binop)
+	if ufunc is None:
+		return None
+	keys: Any = _keys(numpy, key, seq)
+	if keys is None:
+		return None
+	distinct, order, offsets = _group_indices(numpy, keys)
+	if not distinct:
+		return {}
+	starts: Any = numpy.concatenate(([0], offsets))
+	# Without `dtype`, `reduceat` computes small integers in a wider type, but the Python loop stays in the dtype of `seq`.
+	reduced: list[Any] = ufunc.reduceat(seq[order], starts, dtype=seq.dtype).tolist()
+	if init == no_default:
+		return dict(zip(distinct, reduced, strict=True))
+	if callable(init):
+		return {group: binop(init(), value) for group, value in zip(distinct, reduced, strict=True)}
+	return {group: binop(init, value) for group, value in zip(distinct, reduced, strict=True)}
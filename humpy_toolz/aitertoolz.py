@@ -0,0 +1,316 @@
+# ruff:file-ignore[undocumented-public-module]
+"""Asynchronous counterparts of the streaming functions of ``humpy_toolz.itertoolz``.
+
+Every function here has the name and the arguments of its counterpart in ``itertoolz``, but consumes asynchronous
+iterables and returns an asynchronous iterator, or, for ``groupby`` and ``reduceby``, a coroutine. A plain iterable is
+accepted wherever an asynchronous iterable is. ``amap`` maps an asynchronous function over an iterable with a bounded
+number of calls in flight.
+
+>>> import asyncio
+>>> async def inc(x):
+...     return x + 1
+>>> async def main():
+...     return [window async for window in sliding_window(2, take(4, amap(inc, range(10))))]
+>>> asyncio.run(main())
+[(1, 2), (2, 3), (3, 4)]
+"""
+from __future__ import annotations
+
+from collections import deque
+from humpy_toolz.itertoolz import getter
+from humpy_toolz.utils import no_default
+from typing import TYPE_CHECKING
+import asyncio
+import heapq
+
+if TYPE_CHECKING:
+	from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Hashable, Iterable
+	from humpy_toolz._theTypes import SupportsAddContains, SupportsDunderLT
+	from typing import Any, Literal
+
+__all__ = ('amap', 'drop', 'groupby', 'interleave', 'merge_sorted', 'partition_all', 'reduceby', 'sliding_window', 'take', 'unique')
+
+async def _from_iterable[T](seq: Iterable[T]) -> AsyncIterator[T]:
+	for item in seq:
+		yield item
+
+def _aiter[T](seq: AsyncIterable[T] | Iterable[T]) -> AsyncIterator[T]:
+	if hasattr(seq, '__aiter__'):
+		return aiter(seq)  # pyright: ignore[reportArgumentType]
+	return _from_iterable(seq)  # pyright: ignore[reportArgumentType]
+
+async def take[T](n: int, seq: AsyncIterable[T] | Iterable[T]) -> AsyncIterator[T]:
+	"""The first n elements of a sequence
+
+	No element after the first ``n`` is awaited.
+
+	>>> import asyncio
+	>>> async def main():
+	...     return [x async for x in take(2, [10, 20, 30, 40, 50])]
+	>>> asyncio.run(main())
+	[10, 20]
+
+	See Also
+	--------
+		drop
+	"""
+	if n <= 0:
+		return
+	index: int = 0
+	async for item in _aiter(seq):
+		yield item
+		index += 1
+		if index >= n:
+			return
+
+async def drop[T](n: int, seq: AsyncIterable[T] | Iterable[T]) -> AsyncIterator[T]:
+	"""The sequence following the first n elements
+
+	>>> import asyncio
+	>>> async def main():
+	...     return [x async for x in drop(2, [10, 20, 30, 40, 50])]
+	>>> asyncio.run(main())
+	[30, 40, 50]
+
+	See Also
+	--------
+		take
+	"""
+	index: int = 0
+	async for item in _aiter(seq):
+		if index >= n:
+			yield item
+		else:
+			index += 1
+
+async def partition_all[T](n: int, seq: AsyncIterable[T] | Iterable[T]) -> AsyncIterator[tuple[T, ...]]:
+	"""Partition all elements of sequence into tuples of length at most n
+
+	The final tuple may be shorter to accommodate extra elements.
+
+	>>> import asyncio
+	>>> async def main():
+	...     return [part async for part in partition_all(2, [1, 2, 3, 4, 5])]
+	>>> asyncio.run(main())
+	[(1, 2), (3, 4), (5,)]
+	"""
+	partition: list[T] = []
+	async for item in _aiter(seq):
+		partition.append(item)
+		if len(partition) == n:
+			yield tuple(partition)
+			partition.clear()
+	if partition:
+		yield tuple(partition)
+
+async def sliding_window[T](n: int, seq: AsyncIterable[T] | Iterable[T]) -> AsyncIterator[tuple[T, ...]]:
+	"""A sequence of overlapping subsequences
+
+	>>> import asyncio
+	>>> async def main():
+	...     return [window async for window in sliding_window(2, [1, 2, 3, 4])]
+	>>> asyncio.run(main())
+	[(1, 2), (2, 3), (3, 4)]
+	"""
+	window: deque[T] = deque(maxlen=n)
+	async for item in _aiter(seq):
+		window.append(item)
+		if len(window) == n:
+			yield tuple(window)
+
+async def unique[T](
+	seq: AsyncIterable[T] | Iterable[T], key: Callable[[T], Any] | None = None, seen: SupportsAddContains[Any] | None = None,
+) -> AsyncIterator[T]:
+	"""Return only unique elements of a sequence
+
+	Uniqueness can be defined by key keyword. ``seen`` is as in ``itertoolz.unique``: any object with ``__contains__``
+	and ``add``, such as a bounded set of the ``sandbox`` package for an endless stream.
+
+	>>> import asyncio
+	>>> async def main():
+	...     return [x async for x in unique(['cat', 'mouse', 'dog', 'hen'], key=len)]
+	>>> asyncio.run(main())
+	['cat', 'mouse']
+	"""
+	if seen is None:
+		seen = set()
+	async for item in _aiter(seq):
+		value: Any = item if key is None else key(item)
+		if value not in seen:
+			seen.add(value)
+			yield item
+
+async def merge_sorted[T](
+	*seqs: AsyncIterable[T] | Iterable[T], key: Callable[[T], SupportsDunderLT[Any]] | None = None,
+) -> AsyncIterator[T]:
+	"""Merge and sort a collection of sorted collections
+
+	Only one element of each sequence is held at a time, and equal elements
+	come in the order of ``seqs``.
+
+	>>> import asyncio
+	>>> async def main():
+	...     return [x async for x in merge_sorted([1, 3, 5], [2, 4, 6])]
+	>>> asyncio.run(main())
+	[1, 2, 3, 4, 5, 6]
+	"""
+	heap: list[tuple[Any, int, T, AsyncIterator[T]]] = []
+	for index, seq in enumerate(seqs):
+		iterator: AsyncIterator[T] = _aiter(seq)
+		async for item in iterator:
+			heap.append((item if key is None else key(item), index, item, iterator))
+			break
+	heapq.heapify(heap)
+	while heap:
+		_value, index, item, iterator = heap[0]
+		yield item
+		async for item in iterator:
+			heapq.heapreplace(heap, (item if key is None else key(item), index, item, iterator))
+			break
+		else:
+			heapq.heappop(heap)
+
+async def interleave[T](seqs: Iterable[AsyncIterable[T] | Iterable[T]]) -> AsyncIterator[T]:
+	"""Interleave a sequence of sequences
+
+	>>> import asyncio
+	>>> async def main():
+	...     return [x async for x in interleave([[1, 2], [3, 4]])]
+	>>> asyncio.run(main())
+	[1, 3, 2, 4]
+
+	Returns a lazy iterator
+	"""
+	iterators: deque[AsyncIterator[T]] = deque(_aiter(seq) for seq in seqs)
+	while iterators:
+		iterator: AsyncIterator[T] = iterators.popleft()
+		async for item in iterator:
+			yield item
+			iterators.append(iterator)
+			break
+
+async def groupby[T, K: Hashable](key: Callable[[T], K] | Any, seq: AsyncIterable[T] | Iterable[T]) -> dict[K, list[T]]:
+	"""Group a collection by a key function
+
+	>>> import asyncio
+	>>> names = ['Alice', 'Bob', 'Charlie', 'Dan', 'Edith', 'Frank']
+	>>> asyncio.run(groupby(len, names))
+	{5: ['Alice', 'Edith', 'Frank'], 3: ['Bob', 'Dan'], 7: ['Charlie']}
+
+	Non-callable keys imply grouping on a member.
+
+	See Also
+	--------
+		reduceby
+	"""
+	if not callable(key):
+		key = getter(key)
+	groups: dict[K, list[T]] = {}
+	async for item in _aiter(seq):
+		k: K = key(item)
+		if k in groups:
+			groups[k].append(item)
+		else:
+			groups[k] = [item]
+	return groups
+
+async def reduceby[T, K: Hashable](
+	key: Callable[[T], K] | Any,
+	binop: Callable[[Any, T], Any],
+	seq: AsyncIterable[T] | Iterable[T],
+	init: Any | Literal['__no__default__'] = no_default,
+) -> dict[K, Any]:
+	"""Perform a simultaneous groupby and reduction
+
+	>>> import asyncio
+	>>> from operator import add
+	>>> iseven = lambda x: x % 2 == 0
+	>>> asyncio.run(reduceby(iseven, add, [1, 2, 3, 4, 5]))
+	{False: 9, True: 6}
+
+	As in ``itertoolz.reduceby``, ``init`` is the initial value of every
+	group, or a function of no arguments that returns it.
+
+	See Also
+	--------
+		groupby
+	"""
+	if not callable(key):
+		key = getter(key)
+	totals: dict[K, Any] = {}
+	async for item in _aiter(seq):
+		k: K = key(item)
+		if k in totals:
+			totals[k] = binop(totals[k], item)
+		elif init == no_default:
+			totals[k] = item
+		else:
+			totals[k] = binop(init() if callable(init) else init, item)
+	return totals
+
+async def _cancel(tasks: Iterable[asyncio.Task[Any]]) -> None:
+	unfinished: list[asyncio.Task[Any]] = [task for task in tasks if not task.done()]
+	for task in unfinished:
+		task.cancel()
+	await asyncio.gather(*unfinished, return_exceptions=True)
+
+def amap[T, R](
+	func: Callable[[T], Awaitable[R]], seq: AsyncIterable[T] | Iterable[T], *, ordered: bool = True, max_inflight: int = 16,
+) -> AsyncIterator[R]:
+	"""Map an asynchronous function over a sequence concurrently
+
+	Up to ``max_inflight`` calls of ``func`` run at once. The results come in
+	the order of ``seq``, or, with ``ordered=False``, as soon as they are
+	ready. ``seq`` is read as calls are started, so at most ``max_inflight``
+	items and results are held at once.
+
+	>>> import asyncio
+	>>> async def inc(x):
+	...     await asyncio.sleep(0)
+	...     return x + 1
+	>>> async def main():
+	...     return [x async for x in amap(inc, [1, 2, 3])]
+	>>> asyncio.run(main())
+	[2, 3, 4]
+
+	An exception raised by ``func`` is raised when its result is reached, and
+	the calls still in flight are cancelled when the iterator is closed.
+
+	See Also
+	--------
+		humpy_toolz.itertoolz.pmap
+	"""
+	if max_inflight < 1:
+		message: str = f'`max_inflight` must be a positive number of calls, not {max_inflight!r}.'
+		raise ValueError(message)
+	return _amap(func, seq, ordered, max_inflight)
+
+async def _amap[T, R](
+	func: Callable[[T], Awaitable[R]], seq: AsyncIterable[T] | Iterable[T], ordered: bool, max_inflight: int,
+) -> AsyncIterator[R]:
+	if ordered:
+		queued: deque[asyncio.Task[R]] = deque()
+		try:
+			async for item in _aiter(seq):
+				queued.append(asyncio.ensure_future(func(item)))
+				if len(queued) >= max_inflight:
+					yield await queued.popleft()
+			while queued:
+				yield await queued.popleft()
+		finally:
+			await _cancel(queued)
+	else:
+		pending: set[asyncio.Task[R]] = set()
+		try:
+			async for item in _aiter(seq):
+				pending.add(asyncio.ensure_future(func(item)))
+				if len(pending) >= max_inflight:
+					done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+					for task in done:
+						yield task.result()
+			while pending:
+				done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+				for task in done:
+					yield task.result()
+		finally:
+			await _cancel(pending)
@@ -29,11 +29,11 @@ See Also
 from __future__ import annotations
 
 from humpy_toolz import (
-	apply as apply, comp as comp, complement as complement, compose as compose, compose_left as compose_left, concat as concat,
-	concatv as concatv, count as count, curry as curry, diff as diff, first as first, flip as flip, frequencies as frequencies,
-	identity as identity, interleave as interleave, isdistinct as isdistinct, isiterable as isiterable, juxt as juxt, last as last,
-	memoize as memoize, merge_sorted as merge_sorted, peek as peek, pipe as pipe, second as second, thread_first as thread_first,
-	thread_last as thread_last)
+	apply as apply, checked_curry as checked_curry, comp as comp, complement as complement, compose as compose,
+	compose_left as compose_left, concat as concat, concatv as concatv, count as count, curry as curry, diff as diff, first as first,
+	flip as flip, frequencies as frequencies, identity as identity, interleave as interleave, isdistinct as isdistinct,
+	isiterable as isiterable, juxt as juxt, last as last, memoize as memoize, merge_sorted as merge_sorted, peek as peek, pipe as pipe,
+	second as second, thread_first as thread_first, thread_last as thread_last)
 from humpy_toolz.curried import operator as operator
 from humpy_toolz.curried.exceptions import merge as merge, merge_with as merge_with
 from humpy_toolz.curried.toolz import (
@@ -41,13 +41,14 @@ from humpy_toolz.curried.toolz import (
 	excepts as excepts, filter as filter, get as get, get_in as get_in, groupby as groupby, interpose as interpose, itemfilter as itemfilter,
 	itemmap as itemmap, iterate as iterate, join as join, keyfilter as keyfilter, keymap as keymap, map as map, mapcat as mapcat, nth as nth,
 	partial as partial, partition as partition, partition_all as partition_all, partitionby as partitionby, peekn as peekn, pluck as pluck,
-	random_sample as random_sample, reduce as reduce, reduceby as reduceby, remove as remove, sliding_window as sliding_window,
-	sorted as sorted, tail as tail, take as take, take_nth as take_nth, topk as topk, unique as unique, update_in as update_in,
-	valfilter as valfilter, valmap as valmap)
+	pmap as pmap, prefetch as prefetch, random_sample as random_sample, reduce as reduce, reduceby as reduceby, remove as remove,
+	sliding_window as sliding_window, sorted as sorted, tail as tail, take as take, take_nth as take_nth, topk as topk, unique as unique,
+	update_in as update_in, valfilter as valfilter, valmap as valmap)
 
 # Re-exported, not curried
 __all__: list[str] = [
 	'apply',
+	'checked_curry',
 	'comp',
 	'complement',
 	'compose',
@@ -116,6 +117,8 @@ __all__ += [
 	'partitionby',
 	'peekn',
 	'pluck',
+	'pmap',
+	'prefetch',
 	'random_sample',
 	'reduce',
 	'reduceby',
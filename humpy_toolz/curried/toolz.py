@@ -12,6 +12,7 @@ from typing import (
 if TYPE_CHECKING:
 	from _typeshed import SupportsRichComparison
 	from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, MutableMapping, Sequence
+	from humpy_toolz._theTypes import JoinStrategy
 	from humpy_toolz.functoolz import excepts as _excepts_class
 	from typing import Any, Literal, TypeGuard
 	from typing_extensions import TypeIs
@@ -181,6 +182,12 @@ class __Groupby(__Protocol):
 	def __call__(self, key: Callable[[T], KT], seq: Iterable[T], /) -> dict[KT, list[T]]: ...
 	@_overload
 	def __call__(self, key: Any, seq: Iterable[T], /) -> dict[Any, list[T]]: ...
+	@_overload
+	def __call__(self, key: Callable[[T], KT], /, *, max_memory: int) -> Callable[[Iterable[T]], Iterator[tuple[KT, list[T]]]]: ...
+	@_overload
+	def __call__(self, key: Callable[[T], KT], seq: Iterable[T], /, max_memory: int) -> Iterator[tuple[KT, list[T]]]: ...
+	@_overload
+	def __call__(self, key: Any, seq: Iterable[T], /, max_memory: int) -> Iterator[tuple[Any, list[T]]]: ...
 
 class __Interpose(__Protocol):
 	@_overload
@@ -278,7 +285,15 @@ class __Join(__Protocol):
 	# Stage 4a: Full application (inner join) - executes immediately
 	@_overload
 	def __call__(
-		self, leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], /
+		self,
+		leftkey: Callable[[T], Hashable],
+		leftseq: Iterable[T],
+		rightkey: Callable[[U], Hashable],
+		rightseq: Iterable[U],
+		/,
+		*,
+		strategy: JoinStrategy = 'auto',
+		max_memory: int | None = None,
 	) -> Iterator[tuple[T, U]]: ...
 
 	# Stage 4b: Full application with left_default only (right outer join)
@@ -291,6 +306,9 @@ class __Join(__Protocol):
 		rightseq: Iterable[U],
 		/,
 		left_default: L,
+		*,
+		strategy: JoinStrategy = 'auto',
+		max_memory: int | None = None,
 	) -> Iterator[tuple[T | L, U]]: ...
 
 	# Stage 4c: Full application with right_default only (left outer join)
@@ -304,6 +322,8 @@ class __Join(__Protocol):
 		/,
 		*,
 		right_default: R,
+		strategy: JoinStrategy = 'auto',
+		max_memory: int | None = None,
 	) -> Iterator[tuple[T, U | R]]: ...
 
 	# Stage 4d: Full application with both defaults (full outer join)
@@ -317,6 +337,9 @@ class __Join(__Protocol):
 		/,
 		left_default: L,
 		right_default: R,
+		*,
+		strategy: JoinStrategy = 'auto',
+		max_memory: int | None = None,
 	) -> Iterator[tuple[T | L, U | R]]: ...
 
 	# Stage 3 with defaults: leftkey + leftseq + rightkey + defaults - returns callable
@@ -470,6 +493,11 @@ class __Partition(__Protocol):
 	@_overload
 	def __call__(self, n: int, seq: Iterable[T], pad: PType, /) -> Iterator[tuple[T | PType, ...]]: ...
 
+	@_overload
+	def __call__(self, n: int, /, *, view: Literal[True]) -> Callable[[Any], Iterator[Any]]: ...
+	@_overload
+	def __call__(self, n: int, seq: Any, /, *, view: Literal[True]) -> Iterator[Any]: ...
+
 class __PartitionAll(__Protocol):
 	@_overload
 	def __call__(self) -> Callable[..., Iterator[tuple[T, ...]]]: ...
@@ -486,6 +514,15 @@ class __PartitionAll(__Protocol):
 	@_overload
 	def __call__(self, n: int, seq: Iterable[T], /) -> Iterator[tuple[T, ...]]: ...
 
+	@_overload
+	def __call__(self, n: int, /, *, reuse: Literal[True]) -> Callable[[Iterable[T]], Iterator[list[T]]]: ...
+	@_overload
+	def __call__(self, n: int, seq: Iterable[T], /, *, reuse: Literal[True]) -> Iterator[list[T]]: ...
+	@_overload
+	def __call__(self, n: int, /, *, view: Literal[True]) -> Callable[[Any], Iterator[Any]]: ...
+	@_overload
+	def __call__(self, n: int, seq: Any, /, *, view: Literal[True]) -> Iterator[Any]: ...
+
 class __Pluck(__Protocol):
 	@_overload
 	def __call__(self) -> Callable[..., Iterator[T] | Iterator[tuple[T, ...]]]: ...
@@ -572,6 +609,12 @@ class __SlidingWindow(__Protocol):
 	@_overload
 	def __call__(self, n: int, seq: Iterable[T], /) -> Iterator[tuple[T, ...]]: ...
 
+	# Stage 1e/2e: Views of a buffer or NumPy array
+	@_overload
+	def __call__(self, n: int, /, *, view: Literal[True]) -> Callable[[Any], Iterator[Any]]: ...
+	@_overload
+	def __call__(self, n: int, seq: Any, /, *, view: Literal[True]) -> Iterator[Any]: ...
+
 class __Sorted(__Protocol):
 	@_overload
 	def __call__(self) -> Callable[..., list[T]]: ...
@@ -701,6 +744,8 @@ partition_all = __cast('__PartitionAll', humpy_toolz.curry(humpy_toolz.partition
 partitionby = humpy_toolz.curry(humpy_toolz.partitionby)
 peekn = humpy_toolz.curry(humpy_toolz.peekn)
 pluck = __cast('__Pluck', humpy_toolz.curry(humpy_toolz.pluck))
+pmap = humpy_toolz.curry(humpy_toolz.pmap)
+prefetch = humpy_toolz.curry(humpy_toolz.prefetch)
 random_sample = humpy_toolz.curry(humpy_toolz.random_sample)
 reduce = __cast('__Reduce', humpy_toolz.curry(humpy_toolz.reduce))
 reduceby = humpy_toolz.curry(humpy_toolz.reduceby)
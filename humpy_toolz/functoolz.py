@@ -3,6 +3,8 @@
 # ruff:file-ignore[boolean-type-hint-positional-argument]
 # ruff:file-ignore[builtin-argument-shadowing] `type`.
 # ruff:file-ignore[try-consider-else, bad-dunder-method-name, used-dummy-variable, private-member-access, import-outside-top-level]
+# ruff:file-ignore[too-many-return-statements] `_ArgSpec.bind` returns as soon as one argument does not fit.
+# ruff:file-ignore[exec-builtin] `_compiled_compose` runs code that it generates from a count of functions.
 # ty:ignore[call-top-callable]
 # ty:ignore[invalid-parameter-default]
 # ty:ignore[no-matching-overload]
@@ -25,18 +27,20 @@
 from __future__ import annotations
 
 from functools import partial, reduce
+from humpy_toolz import _caches
 from humpy_toolz.utils import no_default
 from importlib import import_module
-from operator import attrgetter, not_
-from types import MethodType
+from operator import attrgetter, is_, not_
+from types import BuiltinFunctionType, FunctionType, MethodType
 from typing import overload, TYPE_CHECKING
 import contextlib
 import inspect
 import sys
+import weakref
 
 if TYPE_CHECKING:
-	from collections.abc import Callable, Iterable, Mapping
-	from typing import Any
+	from collections.abc import Callable, Iterable, Mapping, MutableMapping
+	from typing import Any, Literal
 
 type CurryState = tuple[Any, ...]
 type _Getter[_Instance, _T] = Callable[[_Instance], _T]
@@ -48,6 +52,7 @@ PYPY: bool = hasattr(sys, 'pypy_version_info')
 
 __all__: tuple[str, ...] = (
 	'apply',
+	'checked_curry',
 	'complement',
 	'compose',  # DEVELOPMENT
 	'compose_left',
@@ -320,7 +325,7 @@ class curry[**P, T]:
 		self.__name__ = getattr(func, '__name__', '<curry>')
 		self.__module__ = getattr(func, '__module__', None)
 		self.__qualname__ = getattr(func, '__qualname__', None)
-		self._sigspec = None
+		self._sigspec: _ArgSpec | type[Exception] | None = None
 		self._has_unknown_args = None
 
 	@instanceproperty
@@ -411,10 +416,10 @@ class curry[**P, T]:
 		if self.keywords:
 			kwargs = dict(self.keywords, **kwargs)
 		if self._sigspec is None:
-			sigspec = self._sigspec = _sigs.signature_or_spec(func)
+			sigspec = self._sigspec = _argspec(func)
 			self._has_unknown_args: bool = has_varargs(func, sigspec) is not False
 		else:
-			sigspec: inspect.Signature = self._sigspec
+			sigspec: _ArgSpec | type[Exception] = self._sigspec
 		if is_partial_args(func, args, kwargs, sigspec) is False:
 			return False
 		return bool((self._has_unknown_args) or not (is_valid_args(func, args, kwargs, sigspec)))
@@ -456,6 +461,59 @@ class curry[**P, T]:
 		state = (type(self), func, self.args, self.keywords, userdict, is_decorated)
 		return (_restore_curry, state)
 
+class checked_curry[**P, T](curry[P, T]):
+	"""Curry a callable function, deciding before each call whether the arguments are complete
+
+	``curry`` calls the function first and, if the call raises ``TypeError``,
+	inspects the signature to decide whether to curry.  ``checked_curry`` checks
+	the arguments against the signature before the call, so a partial
+	application never raises and catches an exception, and a ``TypeError``
+	raised inside the function reaches the caller without a signature check.
+
+	>>> @checked_curry
+	... def mul(x, y):
+	...     return x * y
+	>>> double = mul(2)
+	>>> double(10)
+	20
+
+	A call with every argument costs a little more than with ``curry``.  A
+	function with ``*args``, or without a signature, is curried as by ``curry``.
+
+	See Also
+	--------
+		curry
+	"""
+
+	@overload
+	def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T: ...
+
+	@overload
+	def __call__(self, *args: Any, **kwargs: Any) -> curry[P, T]: ...
+
+	def __call__(self, *args: Any, **kwargs: Any) -> T | curry[P, T]:
+		sigspec = self._sigspec
+		if sigspec is None:
+			sigspec = self._sigspec = _argspec(self.func)
+			self._has_unknown_args = has_varargs(self.func, sigspec) is not False
+		if type(sigspec) is not _ArgSpec or sigspec.varargs:
+			return curry.__call__(self, *args, **kwargs)
+		bound = self._partial
+		allargs = bound.args + args
+		allkwargs = {**bound.keywords, **kwargs} if bound.keywords else kwargs
+		if sigspec.bind(allargs, allkwargs) or not sigspec.bind(allargs, allkwargs, partial=True):
+			return bound(*args, **kwargs)
+		# Same as `self.bind(*args, **kwargs)`, but the new curry starts from the function and shares the signature.
+		curried = type(self)(bound.func, *allargs, **allkwargs)
+		curried._sigspec = sigspec
+		curried._has_unknown_args = False
+		return curried
+
+	def __get__(self, instance: object | None, owner: type | None) -> curry[P, T]:
+		if instance is None:
+			return self
+		return type(self)(self, instance)
+
 def _restore_curry[**P, T](
 	cls: type[curry[P, T]]
 	, func: str | Callable[P, T]
@@ -481,6 +539,12 @@ def memoize[T](
 	func: Callable[..., T]
 	, cache: dict[Any, T] | None = None
 	, key: Callable[[tuple[Any, ...], Mapping[str, Any]], Any] | None = None
+	, *
+	, maxsize: int | None = None
+	, policy: Literal['lru', 'lfu'] = 'lru'
+	, ttl: float | None = None
+	, getsizeof: Callable[[T], int] | None = None
+	, concurrency: Literal['single_flight'] | None = None
 ) -> Callable[..., T]:
 	"""Cache a function's result for speedy future evaluation
 
@@ -517,9 +581,32 @@ def memoize[T](
 	...     if verbose:
 	...         print('Calculating %s + %s' % (x, y))
 	...     return x + y
+
+	By default the cache grows without bound. With ``maxsize``, it holds at
+	most ``maxsize`` results and evicts the least recently used one first, or,
+	with ``policy='lfu'``, the least frequently used one. With ``getsizeof``, a
+	function such as ``sys.getsizeof``, ``maxsize`` bounds the total
+	``getsizeof`` of the results instead of their number. With ``ttl``, a result
+	expires ``ttl`` seconds after it was computed. These options make a new
+	cache, so they cannot be combined with ``cache``, and its hits, misses,
+	and evictions are counted by ``cache_info``.
+
+	>>> @memoize(maxsize=2)
+	... def double(x):
+	...     return 2 * x
+	>>> [double(x) for x in [1, 2, 1, 3, 2]]
+	[2, 4, 2, 6, 4]
+	>>> double.cache_info()
+	CacheInfo(hits=1, misses=4, evictions=2, maxsize=2, currsize=2)
+
+	By default, concurrent calls with the same uncached arguments each call
+	the function. With ``concurrency='single_flight'``, the first call computes
+	the result while the others wait for it, so a cold cache under many threads
+	calls the function once per key; an exception reaches every waiting call
+	and is not cached. If the function is a coroutine function, the memoized
+	function is too, and the waiting is done by the tasks of the event loop.
 	"""
-	if cache is None:
-		cache = {}
+	storage: MutableMapping[Any, T] = _caches.memoize_cache(cache, maxsize, policy, ttl, getsizeof)
 	try:
 		may_have_kwargs = has_keywords(func) is not False
 		is_unary = is_arity(1, func)
@@ -540,21 +627,29 @@ def memoize[T](
 			def key(args: tuple[Any, ...], kwargs: Mapping[str, Any]) -> Any:
 				return args
 
+	if concurrency is not None:
+		return _caches.single_flight(func, storage, key, concurrency)
+
 	def memof(*args: Any, **kwargs: Any) -> T:
 		k = key(args, kwargs)
 		try:
-			return cache[k]
+			return storage[k]
 		except TypeError as error:
 			message = 'Arguments to memoized function must be hashable'
 			raise TypeError(message) from error
 		except KeyError:
-			cache[k] = result = func(*args, **kwargs)
+			storage[k] = result = func(*args, **kwargs)
 			return result
 
+	def cache_info() -> _caches.CacheInfo:
+		"""Report the hits, misses, and evictions of the cache, its ``maxsize``, and its current size."""
+		return _caches.cache_info(storage)
+
 	with contextlib.suppress(AttributeError):
 		memof.__name__ = func.__name__
 	memof.__doc__ = func.__doc__
 	memof.__wrapped__ = func
+	memof.cache_info = cache_info
 	return memof
 
 class Compose:
@@ -634,21 +729,55 @@ class Compose:
 
 	__wrapped__ = instanceproperty(attrgetter('first'))
 
+def _reduce_compiled_compose(self: Compose) -> tuple[Callable[..., Compose], tuple[tuple[Callable[..., Any], ...]]]:
+	return (_compiled_compose, (tuple(reversed((self.first, *self.funcs))),))
+
+_compiled_compose_types: dict[int, type[Compose]] = {}
+
+def _compiled_compose(funcs: tuple[Callable[..., Any], ...]) -> Compose:
+	"""Return the ``Compose`` of ``funcs`` made by ``compose(*funcs, compile=True)``.
+
+	Every number of functions has its own subclass of ``Compose`` whose generated ``__call__`` calls the functions in
+	straight-line code instead of a loop. The subclasses are made with ``type`` so that they keep the ``__doc__`` property
+	of ``Compose``, which a class statement would replace.
+	"""
+	count: int = len(funcs) - 1
+	if count not in _compiled_compose_types:
+		lines: list[str] = ['def __call__(self, *args, **kwargs):', '\tfuncs = self.funcs', '\tret = self.first(*args, **kwargs)']
+		# Nested calls are faster than a statement per call, but the parser limits how deep parentheses nest.
+		for start in range(0, count, 16):
+			call: str = 'ret'
+			for index in range(start, min(start + 16, count)):
+				call = f'funcs[{index}]({call})'
+			lines.append(f'\tret = {call}')
+		lines.append('\treturn ret')
+		namespace: dict[str, Any] = {}
+		exec(compile('\n'.join(lines), f'<humpy_toolz.functoolz.compose of {count + 1} functions>', 'exec'), namespace)
+		_compiled_compose_types[count] = type(
+			'Compose', (Compose,), {
+				'__slots__': (),
+				'__call__': namespace['__call__'],
+				'__reduce__': _reduce_compiled_compose,
+				'__doc__': Compose.__dict__['__doc__'],
+				'__module__': __name__,
+			})
+	return _compiled_compose_types[count](funcs)
+
 @overload
-def compose[**P, T](fn_0: Callable[P, T]) -> Callable[P, T]: ...
+def compose[**P, T](fn_0: Callable[P, T], *, compile: bool = False) -> Callable[P, T]: ...
 @overload
-def compose[**P, T0, T1](fn_0: Callable[[T0], T1], fn_1: Callable[P, T0]) -> Callable[P, T1]: ...
+def compose[**P, T0, T1](fn_0: Callable[[T0], T1], fn_1: Callable[P, T0], *, compile: bool = False) -> Callable[P, T1]: ...
 @overload
-def compose[**P, T0, T1, T2](fn_0: Callable[[T1], T2], fn_1: Callable[[T0], T1], fn_2: Callable[P, T0]) -> Callable[P, T2]: ...
+def compose[**P, T0, T1, T2](fn_0: Callable[[T1], T2], fn_1: Callable[[T0], T1], fn_2: Callable[P, T0], *, compile: bool = False) -> Callable[P, T2]: ...
 @overload
-def compose[**P, T0, T1, T2, T3](fn_0: Callable[[T2], T3], fn_1: Callable[[T1], T2], fn_2: Callable[[T0], T1], fn_3: Callable[P, T0]) -> Callable[P, T3]: ...
+def compose[**P, T0, T1, T2, T3](fn_0: Callable[[T2], T3], fn_1: Callable[[T1], T2], fn_2: Callable[[T0], T1], fn_3: Callable[P, T0], *, compile: bool = False) -> Callable[P, T3]: ...
 @overload
-def compose[**P, T0, T1, T2, T3, T4](fn_0: Callable[[T3], T4], fn_1: Callable[[T2], T3], fn_2: Callable[[T1], T2], fn_3: Callable[[T0], T1], fn_4: Callable[P, T0]) -> Callable[P, T4]: ...
+def compose[**P, T0, T1, T2, T3, T4](fn_0: Callable[[T3], T4], fn_1: Callable[[T2], T3], fn_2: Callable[[T1], T2], fn_3: Callable[[T0], T1], fn_4: Callable[P, T0], *, compile: bool = False) -> Callable[P, T4]: ...
 @overload
-def compose[**P, T0, T1, T2, T3, T4, T5](fn_0: Callable[[T4], T5], fn_1: Callable[[T3], T4], fn_2: Callable[[T2], T3], fn_3: Callable[[T1], T2], fn_4: Callable[[T0], T1], fn_5: Callable[P, T0]) -> Callable[P, T5]: ...
+def compose[**P, T0, T1, T2, T3, T4, T5](fn_0: Callable[[T4], T5], fn_1: Callable[[T3], T4], fn_2: Callable[[T2], T3], fn_3: Callable[[T1], T2], fn_4: Callable[[T0], T1], fn_5: Callable[P, T0], *, compile: bool = False) -> Callable[P, T5]: ...
 @overload
-def compose(*funcs: Callable[..., Any]) -> Callable[..., Any]: ...
-def compose(*funcs: Callable[..., Any]) -> Callable[..., Any]:
+def compose(*funcs: Callable[..., Any], compile: bool = False) -> Callable[..., Any]: ...
+def compose(*funcs: Callable[..., Any], compile: bool = False) -> Callable[..., Any]:
 	"""Compose functions to operate in series.
 
 	Returns a function that applies other functions in sequence.
@@ -662,6 +791,11 @@ def compose(*funcs: Callable[..., Any]) -> Callable[..., Any]:
 	>>> compose(str, inc)(3)
 	'4'
 
+	With ``compile=True``, the composition calls its functions without the
+	per-call overhead of a loop, which matters for compositions that are called
+	many times. It is equal to, hashes like, and pickles like the composition
+	without ``compile``.
+
 	See Also
 	--------
 		compose_left
@@ -671,24 +805,25 @@ def compose(*funcs: Callable[..., Any]) -> Callable[..., Any]:
 		return identity
 	if len(funcs) == 1:
 		return funcs[0]
-	else:
-		return Compose(funcs)
+	if compile:
+		return _compiled_compose(funcs)
+	return Compose(funcs)
 
 @overload
-def compose_left[**P, T](fn_0: Callable[P, T]) -> Callable[P, T]: ...
+def compose_left[**P, T](fn_0: Callable[P, T], *, compile: bool = False) -> Callable[P, T]: ...
 @overload
-def compose_left[**P, T0, T1](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1]) -> Callable[P, T1]: ...
+def compose_left[**P, T0, T1](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], *, compile: bool = False) -> Callable[P, T1]: ...
 @overload
-def compose_left[**P, T0, T1, T2](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2]) -> Callable[P, T2]: ...
+def compose_left[**P, T0, T1, T2](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2], *, compile: bool = False) -> Callable[P, T2]: ...
 @overload
-def compose_left[**P, T0, T1, T2, T3](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2], fn_3: Callable[[T2], T3]) -> Callable[P, T3]: ...
+def compose_left[**P, T0, T1, T2, T3](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2], fn_3: Callable[[T2], T3], *, compile: bool = False) -> Callable[P, T3]: ...
 @overload
-def compose_left[**P, T0, T1, T2, T3, T4](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2], fn_3: Callable[[T2], T3], fn_4: Callable[[T3], T4]) -> Callable[P, T4]: ...
+def compose_left[**P, T0, T1, T2, T3, T4](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2], fn_3: Callable[[T2], T3], fn_4: Callable[[T3], T4], *, compile: bool = False) -> Callable[P, T4]: ...
 @overload
-def compose_left[**P, T0, T1, T2, T3, T4, T5](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2], fn_3: Callable[[T2], T3], fn_4: Callable[[T3], T4], fn_5: Callable[[T4], T5]) -> Callable[P, T5]: ...
+def compose_left[**P, T0, T1, T2, T3, T4, T5](fn_0: Callable[P, T0], fn_1: Callable[[T0], T1], fn_2: Callable[[T1], T2], fn_3: Callable[[T2], T3], fn_4: Callable[[T3], T4], fn_5: Callable[[T4], T5], *, compile: bool = False) -> Callable[P, T5]: ...
 @overload
-def compose_left(*funcs: Callable[..., Any]) -> Callable[..., Any]: ...
-def compose_left(*funcs: Callable[..., Any]) -> Callable[..., Any]:
+def compose_left(*funcs: Callable[..., Any], compile: bool = False) -> Callable[..., Any]: ...
+def compose_left(*funcs: Callable[..., Any], compile: bool = False) -> Callable[..., Any]:
 	"""Compose functions to operate in series.
 
 	Returns a function that applies other functions in sequence.
@@ -702,12 +837,14 @@ def compose_left(*funcs: Callable[..., Any]) -> Callable[..., Any]:
 	>>> compose_left(inc, str)(3)
 	'4'
 
+	``compile=True`` is as in ``compose``.
+
 	See Also
 	--------
 		compose
 		pipe
 	"""
-	return compose(*reversed(funcs))
+	return compose(*reversed(funcs), compile=compile)
 
 @overload
 def pipe[T0, T1](data: T0, fn_0: Callable[[T0], T1]) -> T1: ...
@@ -952,29 +1089,118 @@ class excepts[**P, T]:
 		except AttributeError:
 			return 'excepting'
 
+class _ArgSpec:
+	"""The parameters of a signature, grouped once so that checking a call does not go through ``inspect``."""
+
+	__slots__: tuple[str, ...] = (
+		'index', 'keyword_only', 'keywords', 'positional', 'positional_only', 'required', 'required_keyword_only', 'sigspec', 'varargs', 'varkw',
+	)
+
+	def __init__(self, sigspec: inspect.Signature) -> None:
+		parameters: list[inspect.Parameter] = list(sigspec.parameters.values())
+		positional: list[inspect.Parameter] = [p for p in parameters if p.kind in {p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD}]
+		self.sigspec: inspect.Signature = sigspec
+		self.positional: tuple[str, ...] = tuple(p.name for p in positional)
+		self.index: dict[str, int] = {name: index for index, name in enumerate(self.positional)}
+		self.positional_only: int = sum(1 for p in positional if p.kind == p.POSITIONAL_ONLY)
+		self.required: tuple[int, ...] = tuple(index for index, p in enumerate(positional) if p.default is p.empty)
+		self.keyword_only: frozenset[str] = frozenset(p.name for p in parameters if p.kind == p.KEYWORD_ONLY)
+		self.required_keyword_only: frozenset[str] = frozenset(p.name for p in parameters if p.kind == p.KEYWORD_ONLY and p.default is p.empty)
+		self.varargs: bool = any(p.kind == p.VAR_POSITIONAL for p in parameters)
+		self.varkw: bool = any(p.kind == p.VAR_KEYWORD for p in parameters)
+		self.keywords: bool = any(p.default is not p.empty or p.kind in {p.KEYWORD_ONLY, p.VAR_KEYWORD} for p in parameters)
+
+	def bind(self, args: tuple[Any, ...], kwargs: Mapping[str, Any], *, partial: bool = False) -> bool:
+		"""Return whether ``sigspec.bind(*args, **kwargs)``, or ``sigspec.bind_partial`` if ``partial``, succeeds."""
+		given: int = len(args)
+		if given > len(self.positional):
+			if not self.varargs:
+				return False
+			given = len(self.positional)
+		for name in kwargs:
+			index: int | None = self.index.get(name)
+			if index is None:
+				if not self.varkw and name not in self.keyword_only:
+					return False
+			elif index < self.positional_only:
+				# A positional-only name passed as a keyword is a key of `**kwargs`.
+				if not self.varkw:
+					return False
+			elif index < given:
+				return False
+		if partial:
+			return True
+		for index in self.required:
+			if index >= given and (index < self.positional_only or self.positional[index] not in kwargs):
+				return False
+		return self.required_keyword_only.issubset(kwargs)
+
+_HEAPTYPE: int = 1 << 9
+
+def _signature_token(func: Any) -> tuple[Any, ...] | None:
+	"""Return the attributes that the signature of ``func`` is computed from, or ``None`` not to cache it.
+
+	A function can be given new defaults or a new ``__signature__`` at any time, so its cached signature is used only
+	while these attributes are the same objects. A builtin function or a builtin type cannot change.
+	"""
+	if type(func) is FunctionType:
+		namespace: dict[str, Any] = func.__dict__
+		return (func.__code__, func.__defaults__, func.__kwdefaults__, namespace.get('__signature__'), namespace.get('__wrapped__'))
+	if type(func) is BuiltinFunctionType or (type(func) is type and not func.__flags__ & _HEAPTYPE):
+		return ()
+	return None
+
+_argspecs: weakref.WeakKeyDictionary[Callable[..., Any], tuple[tuple[Any, ...], _ArgSpec | type[Exception]]] = weakref.WeakKeyDictionary()
+
+def _argspec(func: Callable[..., Any]) -> _ArgSpec | type[Exception]:
+	"""Return the ``_ArgSpec`` of ``func``, or the type of the exception that ``inspect.signature(func)`` raises.
+
+	The result is cached for the life of ``func``, so every ``curry`` of a function, every partial call of it, and
+	``memoize`` share one call of ``inspect.signature``.
+	"""
+	token: tuple[Any, ...] | None = _signature_token(func)
+	if token is not None:
+		try:
+			cached = _argspecs.get(func)
+		except TypeError:
+			token = cached = None
+		if cached is not None and all(map(is_, cached[0], token)):
+			return cached[1]
+	try:
+		spec: _ArgSpec | type[Exception] = _ArgSpec(inspect.signature(func))
+	except (ValueError, TypeError) as exc:
+		spec = type(exc)
+	if token is not None:
+		_argspecs[func] = (token, spec)
+	return spec
+
 def _check_sigspec[T](
-	sigspec: inspect.Signature | None, func: Callable[..., Any], builtin_func: Callable[..., T], *builtin_args: Any
-) -> tuple[inspect.Signature | None, T | bool | None]:
+	sigspec: inspect.Signature | _ArgSpec | None, func: Callable[..., Any], builtin_func: Callable[..., T], *builtin_args: Any
+) -> tuple[_ArgSpec | None, T | bool | None]:
+	if isinstance(sigspec, _ArgSpec):
+		return (sigspec, None)
 	if sigspec is None:
-		try:
-			sigspec = inspect.signature(func)
-		except (ValueError, TypeError) as e:
-			sigspec = e
-	if isinstance(sigspec, ValueError):
+		sigspec = _argspec(func)
+	elif isinstance(sigspec, inspect.Signature):
+		spec: _ArgSpec | type[Exception] | None = _argspec(func) if _signature_token(func) is not None else None
+		if not (isinstance(spec, _ArgSpec) and spec.sigspec is sigspec):
+			spec = _ArgSpec(sigspec)
+		sigspec = spec
+	if isinstance(sigspec, _ArgSpec):
+		return (sigspec, None)
+	if isinstance(sigspec, type) and issubclass(sigspec, ValueError):
 		return (None, builtin_func(*builtin_args))
-	elif not isinstance(sigspec, inspect.Signature):
-		if func in _sigs.signatures and (hasattr(func, '__signature__') and hasattr(func.__signature__, '__get__')):
-			val = builtin_func(*builtin_args)
-			return (None, val)
-		return (None, False)
-	return (sigspec, None)
+	if func in _sigs.signatures and (hasattr(func, '__signature__') and hasattr(func.__signature__, '__get__')):
+		val = builtin_func(*builtin_args)
+		return (None, val)
+	return (None, False)
 
 if PYPY:
 	_check_sigspec_orig = _check_sigspec
 
 	def _check_sigspec[T](
-		sigspec: inspect.Signature | None, func: Callable[..., Any], builtin_func: Callable[..., T], *builtin_args: Any
-	) -> tuple[inspect.Signature | None, T | bool | None]:
+		sigspec: inspect.Signature | _ArgSpec | None, func: Callable[..., Any], builtin_func: Callable[..., T], *builtin_args: Any
+	) -> tuple[_ArgSpec | None, T | bool | None]:
 		if func in _sigs.signatures:
 			val = builtin_func(*builtin_args)
 			return (None, val)
@@ -982,49 +1208,41 @@ if PYPY:
 
 _check_sigspec.__doc__ = " Private function to aid in introspection compatibly across Python versions.\n\nIf a callable doesn't have a signature (Python 3) or an argspec (Python 2),\nthe signature registry in humpy_toolz._signatures is used.\n"
 
-def num_required_args(func: Callable[..., Any], sigspec: inspect.Signature | None = None) -> int | None:
+def num_required_args(func: Callable[..., Any], sigspec: inspect.Signature | _ArgSpec | None = None) -> int | None:
 	sigspec, rv = _check_sigspec(sigspec, func, _sigs._num_required_args, func)
 	if sigspec is None:
 		return rv
-	return sum(1 for p in sigspec.parameters.values() if p.default is p.empty and p.kind in {p.POSITIONAL_OR_KEYWORD, p.POSITIONAL_ONLY})
+	return len(sigspec.required)
 
-def has_varargs(func: Callable[..., Any], sigspec: inspect.Signature | None = None) -> bool | None:
+def has_varargs(func: Callable[..., Any], sigspec: inspect.Signature | _ArgSpec | None = None) -> bool | None:
 	sigspec, rv = _check_sigspec(sigspec, func, _sigs._has_varargs, func)
 	if sigspec is None:
 		return rv
-	return any(p.kind == p.VAR_POSITIONAL for p in sigspec.parameters.values())
+	return sigspec.varargs
 
-def has_keywords(func: Callable[..., Any], sigspec: inspect.Signature | None = None) -> bool | None:
+def has_keywords(func: Callable[..., Any], sigspec: inspect.Signature | _ArgSpec | None = None) -> bool | None:
 	sigspec, rv = _check_sigspec(sigspec, func, _sigs._has_keywords, func)
 	if sigspec is None:
 		return rv
-	return any(p.default is not p.empty or p.kind in {p.KEYWORD_ONLY, p.VAR_KEYWORD} for p in sigspec.parameters.values())
+	return sigspec.keywords
 
 def is_valid_args(
-	func: Callable[..., Any], args: tuple[Any, ...], kwargs: Mapping[str, Any], sigspec: inspect.Signature | None = None
+	func: Callable[..., Any], args: tuple[Any, ...], kwargs: Mapping[str, Any], sigspec: inspect.Signature | _ArgSpec | None = None
 ) -> bool | None:
 	sigspec, rv = _check_sigspec(sigspec, func, _sigs._is_valid_args, func, args, kwargs)
 	if sigspec is None:
 		return rv
-	try:
-		sigspec.bind(*args, **kwargs)
-	except TypeError:
-		return False
-	return True
+	return sigspec.bind(args, kwargs)
 
 def is_partial_args(
-	func: Callable[..., Any], args: tuple[Any, ...], kwargs: Mapping[str, Any], sigspec: inspect.Signature | None = None
+	func: Callable[..., Any], args: tuple[Any, ...], kwargs: Mapping[str, Any], sigspec: inspect.Signature | _ArgSpec | None = None
 ) -> bool | None:
 	sigspec, rv = _check_sigspec(sigspec, func, _sigs._is_partial_args, func, args, kwargs)
 	if sigspec is None:
 		return rv
-	try:
-		sigspec.bind_partial(*args, **kwargs)
-	except TypeError:
-		return False
-	return True
+	return sigspec.bind(args, kwargs, partial=True)
 
-def is_arity(n: int, func: Callable[..., Any], sigspec: inspect.Signature | None = None) -> bool | None:
+def is_arity(n: int, func: Callable[..., Any], sigspec: inspect.Signature | _ArgSpec | None = None) -> bool | None:
 	"""Does a function have only n positional arguments?
 
 	This function relies on introspection and does not call the function.
@@ -23,6 +23,11 @@ from __future__ import annotations
 from collections import defaultdict, deque
 from collections.abc import Sequence
 from functools import partial
+from humpy_toolz._buffers import partition_all_views, partition_views, sliding_window_views
+from humpy_toolz._prefetch import check_batchsize, parallel_map, prefetched_merge, read_ahead
+from humpy_toolz._sampling import skip_sample
+from humpy_toolz._spill import grace_join, spilling_groupby
+from humpy_toolz._vectorized import vectorized_frequencies, vectorized_groupby, vectorized_reduceby
 from humpy_toolz.utils import no_default
 from itertools import filterfalse, zip_longest
 from operator import is_not, itemgetter
@@ -32,7 +37,7 @@ import itertools
 
 if TYPE_CHECKING:
 	from collections.abc import Callable, Collection, Hashable, ItemsView, Iterable, Iterator, KeysView, Mapping, ValuesView
-	from humpy_toolz._theTypes import Randomable, SupportsDunderLT, SupportsGetItem, SupportsRichComparison
+	from humpy_toolz._theTypes import JoinStrategy, Randomable, SupportsAddContains, SupportsDunderLT, SupportsGetItem, SupportsRichComparison
 	from typing import Any, Literal
 	from typing_extensions import TypeIs
 
@@ -63,6 +68,8 @@ __all__ = (
 	'peek',
 	'peekn',
 	'pluck',
+	'pmap',
+	'prefetch',
 	'random_sample',
 	'reduceby',
 	'remove',
@@ -271,11 +278,18 @@ def frequencies[T](seq: Iterable[T]) -> dict[T, int]:
 	>>> frequencies(['cat', 'cat', 'ox', 'pig', 'pig', 'cat'])  # doctest: +SKIP
 	{'cat': 3, 'ox': 1, 'pig': 2}
 
+	If ``seq`` is a one-dimensional NumPy array of booleans, numbers,
+	strings, or bytes, NumPy counts the values, and the keys are Python
+	scalars.
+
 	See Also
 	--------
 		countby
 		groupby
 	"""
+	vectorized: dict[T, int] | None = vectorized_frequencies(seq)
+	if vectorized is not None:
+		return vectorized
 	d: dict[T, int] = defaultdict(int)
 	for item in seq:
 		d[item] += 1
@@ -347,10 +361,16 @@ def get[T, V](ind: T | Sequence[T], seq: SupportsGetItem[T, V], default: V | Lit
 		return default
 
 @overload
-def groupby[T, K: Hashable](key: Callable[[T], K], seq: Iterable[T]) -> dict[K, list[T]]: ...
+def groupby[T, K: Hashable](key: Callable[[T], K], seq: Iterable[T], max_memory: None = None) -> dict[K, list[T]]: ...
+@overload
+def groupby[K: Hashable, T](key: K, seq: Iterable[T], max_memory: None = None) -> dict[K, list[T]]: ...
+@overload
+def groupby[T, K: Hashable](key: Callable[[T], K], seq: Iterable[T], max_memory: int) -> Iterator[tuple[K, list[T]]]: ...
 @overload
-def groupby[K: Hashable, T](key: K, seq: Iterable[T]) -> dict[K, list[T]]: ...
-def groupby[T, K: Hashable](key: Callable[[T], K] | K, seq: Iterable[T]) -> dict[K, list[T]]:
+def groupby[K: Hashable, T](key: K, seq: Iterable[T], max_memory: int) -> Iterator[tuple[K, list[T]]]: ...
+def groupby[T, K: Hashable](
+	key: Callable[[T], K] | K, seq: Iterable[T], max_memory: int | None = None,
+) -> dict[K, list[T]] | Iterator[tuple[K, list[T]]]:
 	"""Group a collection by a key function
 
 	>>> names = ['Alice', 'Bob', 'Charlie', 'Dan', 'Edith', 'Frank']
@@ -370,16 +390,38 @@ def groupby[T, K: Hashable](key: Callable[[T], K] | K, seq: Iterable[T]) -> dict
 	 'M': [{'gender': 'M', 'name': 'Bob'},
 		   {'gender': 'M', 'name': 'Charlie'}]}
 
+	With ``max_memory``, a number of bytes, ``groupby`` returns a lazy
+	iterator of ``(key, group)`` pairs instead of a dict. When the estimated
+	size of the groups exceeds ``max_memory``, the groups are partitioned into
+	hash buckets that are pickled to temporary files, and the pairs are then
+	yielded bucket by bucket. Keys and items must be picklable, the items of
+	each group keep the order of ``seq``, and the order of the groups is
+	arbitrary. The temporary files are removed when the iterator is exhausted
+	or closed.
+
+	>>> sorted(groupby(iseven, [1, 2, 3, 4, 5, 6, 7, 8], max_memory=2**20))
+	[(False, [1, 3, 5, 7]), (True, [2, 4, 6, 8])]
+
+	If ``seq`` is a one-dimensional NumPy array and ``key`` is a unary ufunc,
+	or ``seq`` is a structured array and ``key`` names fields of it, NumPy
+	computes and sorts the keys, and the keys are Python scalars or tuples.
+
 	Not to be confused with ``itertools.groupby``
 
 	See Also
 	--------
 		countby
 	"""
+	if max_memory is None:
+		vectorized: dict[K, list[T]] | None = vectorized_groupby(key, seq)
+		if vectorized is not None:
+			return vectorized
 	if not callable(key):
 		predicate: Callable[[SupportsGetItem[K, T]], tuple[T]] = getter(key)
 	else:
 		predicate = key
+	if max_memory is not None:
+		return spilling_groupby(predicate, seq, max_memory)
 	d: defaultdict[K, list[T]] = defaultdict(list)
 	for item in seq:
 		d[predicate(item)].append(item)
@@ -497,18 +539,99 @@ def iterate[T](func: Callable[[T], T], x: T) -> Iterator[T]:
 		yield x
 		x = func(x)
 
+def _join_strategy(strategy: JoinStrategy, max_memory: int | None) -> JoinStrategy:
+	if strategy == 'auto':
+		return 'hash' if max_memory is None else 'grace'
+	if strategy not in {'grace', 'hash', 'sort-merge'}:
+		message: str = f"`strategy` must be 'auto', 'grace', 'hash', or 'sort-merge', not {strategy!r}."
+		raise ValueError(message)
+	if (strategy == 'grace') != (max_memory is not None):
+		message = f"`max_memory` is required by, and only used by, strategy='grace', but {strategy=} and {max_memory=}."
+		raise ValueError(message)
+	return strategy
+
+def _sorted_groups[T](key: Callable[[T], Any], seq: Iterable[T]) -> Iterator[tuple[Any, Iterator[T]]]:
+	previous: Any = None
+	for index, (value, group) in enumerate(itertools.groupby(seq, key)):
+		if index and value < previous:
+			message: str = f"join with strategy='sort-merge' requires sequences sorted by their keys, but {value!r} follows {previous!r}."
+			raise ValueError(message)
+		previous = value
+		yield (value, group)
+
+def _sort_merge_join[T, U, L, R](
+	leftkey: Callable[[T], Any],
+	leftseq: Iterable[T],
+	rightkey: Callable[[U], Any],
+	rightseq: Iterable[U],
+	left_default: L | Literal['__no__default__'],
+	right_default: R | Literal['__no__default__'],
+) -> Iterator[tuple[T | L, U | R]]:
+	lefts: Iterator[tuple[Any, Iterator[T]]] = _sorted_groups(leftkey, leftseq)
+	rights: Iterator[tuple[Any, Iterator[U]]] = _sorted_groups(rightkey, rightseq)
+	left: tuple[Any, Iterator[T]] | None = next(lefts, None)
+	right: tuple[Any, Iterator[U]] | None = next(rights, None)
+	while left is not None and right is not None:
+		if left[0] < right[0]:
+			if right_default != no_default:
+				for match in left[1]:
+					yield (match, right_default)
+			left = next(lefts, None)
+		elif right[0] < left[0]:
+			if left_default != no_default:
+				for item in right[1]:
+					yield (left_default, item)
+			right = next(rights, None)
+		else:
+			matches: list[T] = list(left[1])
+			for item in right[1]:
+				for match in matches:
+					yield (match, item)
+			left = next(lefts, None)
+			right = next(rights, None)
+	if right_default != no_default:
+		while left is not None:
+			for match in left[1]:
+				yield (match, right_default)
+			left = next(lefts, None)
+	if left_default != no_default:
+		while right is not None:
+			for item in right[1]:
+				yield (left_default, item)
+			right = next(rights, None)
+
 # === CALLABLE + CALLABLE (4 overloads) ===
 @overload
 def join[T, U](
-	leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U]
+	leftkey: Callable[[T], Hashable],
+	leftseq: Iterable[T],
+	rightkey: Callable[[U], Hashable],
+	rightseq: Iterable[U],
+	*,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
 ) -> Iterator[tuple[T, U]]: ...
 @overload
 def join[T, U, L](
-	leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], left_default: L
+	leftkey: Callable[[T], Hashable],
+	leftseq: Iterable[T],
+	rightkey: Callable[[U], Hashable],
+	rightseq: Iterable[U],
+	left_default: L,
+	*,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
 ) -> Iterator[tuple[T | L, U]]: ...
 @overload
 def join[T, U, R](
-	leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], *, right_default: R
+	leftkey: Callable[[T], Hashable],
+	leftseq: Iterable[T],
+	rightkey: Callable[[U], Hashable],
+	rightseq: Iterable[U],
+	*,
+	right_default: R,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
 ) -> Iterator[tuple[T, U | R]]: ...
 @overload
 def join[T, U, L, R](
@@ -518,54 +641,147 @@ def join[T, U, L, R](
 	rightseq: Iterable[U],
 	left_default: L,
 	right_default: R,
+	*,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
 ) -> Iterator[tuple[T | L, U | R]]: ...
 
 # === HASHABLE + CALLABLE (4 overloads) ===
 @overload
-def join[T, U](leftkey: Hashable, leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U]) -> Iterator[tuple[T, U]]: ...
+def join[T, U](
+	leftkey: Hashable,
+	leftseq: Iterable[T],
+	rightkey: Callable[[U], Hashable],
+	rightseq: Iterable[U],
+	*,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
+) -> Iterator[tuple[T, U]]: ...
 @overload
 def join[T, U, L](
-	leftkey: Hashable, leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], left_default: L
+	leftkey: Hashable,
+	leftseq: Iterable[T],
+	rightkey: Callable[[U], Hashable],
+	rightseq: Iterable[U],
+	left_default: L,
+	*,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
 ) -> Iterator[tuple[T | L, U]]: ...
 @overload
 def join[T, U, R](
-	leftkey: Hashable, leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], *, right_default: R
+	leftkey: Hashable,
+	leftseq: Iterable[T],
+	rightkey: Callable[[U], Hashable],
+	rightseq: Iterable[U],
+	*,
+	right_default: R,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
 ) -> Iterator[tuple[T, U | R]]: ...
 @overload
 def join[T, U, L, R](
-	leftkey: Hashable, leftseq: Iterable[T], rightkey: Callable[[U], Hashable], rightseq: Iterable[U], left_default: L, right_default: R
+	leftkey: Hashable,
+	leftseq: Iterable[T],
+	rightkey: Callable[[U], Hashable],
+	rightseq: Iterable[U],
+	left_default: L,
+	right_default: R,
+	*,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
 ) -> Iterator[tuple[T | L, U | R]]: ...
 
 # === CALLABLE + HASHABLE (4 overloads) ===
 @overload
-def join[T, U](leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U]) -> Iterator[tuple[T, U]]: ...
+def join[T, U](
+	leftkey: Callable[[T], Hashable],
+	leftseq: Iterable[T],
+	rightkey: Hashable,
+	rightseq: Iterable[U],
+	*,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
+) -> Iterator[tuple[T, U]]: ...
 @overload
 def join[T, U, L](
-	leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], left_default: L
+	leftkey: Callable[[T], Hashable],
+	leftseq: Iterable[T],
+	rightkey: Hashable,
+	rightseq: Iterable[U],
+	left_default: L,
+	*,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
 ) -> Iterator[tuple[T | L, U]]: ...
 @overload
 def join[T, U, R](
-	leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], *, right_default: R
+	leftkey: Callable[[T], Hashable],
+	leftseq: Iterable[T],
+	rightkey: Hashable,
+	rightseq: Iterable[U],
+	*,
+	right_default: R,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
 ) -> Iterator[tuple[T, U | R]]: ...
 @overload
 def join[T, U, L, R](
-	leftkey: Callable[[T], Hashable], leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], left_default: L, right_default: R
+	leftkey: Callable[[T], Hashable],
+	leftseq: Iterable[T],
+	rightkey: Hashable,
+	rightseq: Iterable[U],
+	left_default: L,
+	right_default: R,
+	*,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
 ) -> Iterator[tuple[T | L, U | R]]: ...
 
 # === HASHABLE + HASHABLE (4 overloads) ===
 @overload
-def join[T, U](leftkey: Hashable, leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U]) -> Iterator[tuple[T, U]]: ...
+def join[T, U](
+	leftkey: Hashable,
+	leftseq: Iterable[T],
+	rightkey: Hashable,
+	rightseq: Iterable[U],
+	*,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
+) -> Iterator[tuple[T, U]]: ...
 @overload
 def join[T, U, L](
-	leftkey: Hashable, leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], left_default: L
+	leftkey: Hashable,
+	leftseq: Iterable[T],
+	rightkey: Hashable,
+	rightseq: Iterable[U],
+	left_default: L,
+	*,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
 ) -> Iterator[tuple[T | L, U]]: ...
 @overload
 def join[T, U, R](
-	leftkey: Hashable, leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], *, right_default: R
+	leftkey: Hashable,
+	leftseq: Iterable[T],
+	rightkey: Hashable,
+	rightseq: Iterable[U],
+	*,
+	right_default: R,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
 ) -> Iterator[tuple[T, U | R]]: ...
 @overload
 def join[T, U, L, R](
-	leftkey: Hashable, leftseq: Iterable[T], rightkey: Hashable, rightseq: Iterable[U], left_default: L, right_default: R
+	leftkey: Hashable,
+	leftseq: Iterable[T],
+	rightkey: Hashable,
+	rightseq: Iterable[U],
+	left_default: L,
+	right_default: R,
+	*,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
 ) -> Iterator[tuple[T | L, U | R]]: ...
 def join[T, U, L, R](
 	leftkey: Callable[[T], Hashable] | Hashable,
@@ -574,6 +790,9 @@ def join[T, U, L, R](
 	rightseq: Iterable[U],
 	left_default: L | Literal['__no__default__'] = no_default,
 	right_default: R | Literal['__no__default__'] = no_default,
+	*,
+	strategy: JoinStrategy = 'auto',
+	max_memory: int | None = None,
 ) -> Iterator[tuple[T | L, U | R]]:
 	"""Join two sequences on common attributes
 
@@ -620,11 +839,39 @@ def join[T, U, L, R](
 
 	>>> # result = join(second, friends, first, cities)
 	>>> result = join(1, friends, 0, cities)  # doctest: +SKIP
+
+	The keyword argument ``strategy`` selects another algorithm.
+
+	``'hash'``
+		The hash join described above.
+	``'sort-merge'``
+		Both sequences must be sorted by their keys. Both sequences are
+		evaluated lazily, only the LEFT elements that share one key are held
+		in memory, and the pairs are yielded in order of the keys. A key that
+		is smaller than the key before it raises ``ValueError``.
+	``'grace'``
+		A Grace hash join that needs ``max_memory``, a number of bytes. While
+		the LEFT sequence fits in ``max_memory``, this is the hash join. Once
+		it does not, both sequences are partitioned into hash buckets in
+		temporary files, and the pairs are yielded bucket by bucket. Keys and
+		elements must be picklable.
+	``'auto'``
+		The default: ``'grace'`` if ``max_memory`` is given, else ``'hash'``.
+
+	>>> list(join(first, [(1, 'a'), (2, 'b')], first, [(2, 'x'), (3, 'y')], strategy='sort-merge'))
+	[((2, 'b'), (2, 'x'))]
 	"""
 	if not callable(leftkey):
 		leftkey = getter(leftkey)
 	if not callable(rightkey):
 		rightkey = getter(rightkey)
+	strategy = _join_strategy(strategy, max_memory)
+	if strategy == 'sort-merge':
+		yield from _sort_merge_join(leftkey, leftseq, rightkey, rightseq, left_default, right_default)
+		return
+	if strategy == 'grace':
+		yield from grace_join(leftkey, leftseq, rightkey, rightseq, left_default, right_default, max_memory)
+		return
 	d: dict[Hashable, list[T]] = groupby(leftkey, leftseq)
 	if left_default == no_default and right_default == no_default:
 		for item in rightseq:
@@ -757,11 +1004,23 @@ def _merge_sorted_binary_key[T](seqs: Sequence[Iterable[T]], key: Callable[[T],
 	yield val1
 	yield from seq1
 
+def _merge_sorted[T](seqs: Sequence[Iterable[T]], key: Callable[[T], SupportsDunderLT[Any]] | None = None) -> Iterator[T]:
+	if len(seqs) == 0:
+		return iter([])
+	elif len(seqs) == 1:
+		return iter(seqs[0])
+	if key is None:
+		return _merge_sorted_binary(seqs)
+	else:
+		return _merge_sorted_binary_key(seqs, key)
+
 @overload
-def merge_sorted[TSupportsRichComparison: SupportsRichComparison](*seqs: Iterable[TSupportsRichComparison], key: None = None) -> Iterator[TSupportsRichComparison]: ...
+def merge_sorted[TSupportsRichComparison: SupportsRichComparison](
+	*seqs: Iterable[TSupportsRichComparison], key: None = None, prefetch: int | None = None
+) -> Iterator[TSupportsRichComparison]: ...
 @overload
-def merge_sorted[T](*seqs: Iterable[T], key: Callable[[T], SupportsDunderLT[Any]]) -> Iterator[T]: ...
-def merge_sorted[T](*seqs: Iterable[T], key: Callable[[T], SupportsDunderLT[Any]] | None = None) -> Iterator[T]:
+def merge_sorted[T](*seqs: Iterable[T], key: Callable[[T], SupportsDunderLT[Any]], prefetch: int | None = None) -> Iterator[T]: ...
+def merge_sorted[T](*seqs: Iterable[T], key: Callable[[T], SupportsDunderLT[Any]] | None = None, prefetch: int | None = None) -> Iterator[T]:
 	"""Merge and sort a collection of sorted collections
 
 	This works lazily and only keeps one value from each iterable in memory.
@@ -776,15 +1035,20 @@ def merge_sorted[T](*seqs: Iterable[T], key: Callable[[T], SupportsDunderLT[Any]
 
 	>>> list(merge_sorted([2, 3], [1, 3], key=lambda x: x // 3))
 	[2, 1, 3, 3]
+
+	Items that compare equal come out in the order of the collections that
+	hold them.  If ``prefetch`` is a number of items, a pool of background
+	threads reads every collection ahead in batches of ``prefetch`` items,
+	so that slow inputs, such as sorted runs in files, are read while the
+	merge runs; up to two batches of each collection are then in memory.
+
+	>>> list(merge_sorted([1, 4], [2, 3], prefetch=64))
+	[1, 2, 3, 4]
 	"""
-	if len(seqs) == 0:
-		return iter([])
-	elif len(seqs) == 1:
-		return iter(seqs[0])
-	if key is None:
-		return _merge_sorted_binary(seqs)
-	else:
-		return _merge_sorted_binary_key(seqs, key)
+	if prefetch is not None:
+		check_batchsize(prefetch)
+		return prefetched_merge(partial(_merge_sorted, key=key), seqs, prefetch)
+	return _merge_sorted(seqs, key)
 
 def nth[T](n: int, seq: Iterable[T]) -> T:
 	"""The nth element in a sequence
@@ -797,7 +1061,9 @@ def nth[T](n: int, seq: Iterable[T]) -> T:
 	else:
 		return next(itertools.islice(seq, n, None))
 
-def partition[T, L](n: int, seq: Iterable[T], pad: L | Literal['__no__pad__'] = no_pad) -> Iterator[tuple[T, ...]] | Iterator[tuple[T | L, ...]]:
+def partition[T, L](
+	n: int, seq: Iterable[T], pad: L | Literal['__no__pad__'] = no_pad, *, view: bool = False
+) -> Iterator[tuple[T, ...]] | Iterator[tuple[T | L, ...]]:
 	"""Partition sequence into tuples of length n
 
 	>>> list(partition(2, [1, 2, 3, 4]))
@@ -812,10 +1078,22 @@ def partition[T, L](n: int, seq: Iterable[T], pad: L | Literal['__no__pad__'] =
 	>>> list(partition(2, [1, 2, 3, 4, 5], pad=None))
 	[(1, 2), (3, 4), (5, None)]
 
+	With ``view=True``, ``seq`` must be a buffer or a NumPy array, as in
+	``sliding_window``, and the partitions are views of ``seq`` instead of
+	new tuples. A view cannot be padded, so ``pad`` must not be specified.
+
+	>>> [bytes(part) for part in partition(2, b'abcde', view=True)]
+	[b'ab', b'cd']
+
 	See Also
 	--------
 		partition_all
 	"""
+	if view:
+		if pad != no_pad:
+			message: str = 'Partitions that are views cannot be padded; omit `pad` or `view`.'
+			raise ValueError(message)
+		return partition_views(n, seq)
 	args: list[Iterator[T]] = [iter(seq)] * n
 	if pad == no_pad:
 		return zip(*args, strict=False)
@@ -823,7 +1101,13 @@ def partition[T, L](n: int, seq: Iterable[T], pad: L | Literal['__no__pad__'] =
 		fillvalue: L = pad
 		return zip_longest(*args, fillvalue=fillvalue)
 
-def partition_all[T](n: int, seq: Iterable[T]) -> Iterator[tuple[T, ...]]:
+@overload
+def partition_all[T](n: int, seq: Iterable[T], *, view: Literal[False] = False, reuse: Literal[False] = False) -> Iterator[tuple[T, ...]]: ...
+@overload
+def partition_all[T](n: int, seq: Iterable[T], *, view: Literal[False] = False, reuse: Literal[True]) -> Iterator[list[T]]: ...
+@overload
+def partition_all(n: int, seq: Any, *, view: Literal[True], reuse: Literal[False] = False) -> Iterator[Any]: ...
+def partition_all[T](n: int, seq: Iterable[T], *, view: bool = False, reuse: bool = False) -> Iterator[tuple[T, ...]] | Iterator[list[T]] | Iterator[Any]:
 	"""Partition all elements of sequence into tuples of length at most n
 
 	The final tuple may be shorter to accommodate extra elements.
@@ -834,10 +1118,34 @@ def partition_all[T](n: int, seq: Iterable[T]) -> Iterator[tuple[T, ...]]:
 	>>> list(partition_all(2, [1, 2, 3, 4, 5]))
 	[(1, 2), (3, 4), (5,)]
 
+	With ``view=True``, ``seq`` must be a buffer or a NumPy array, as in
+	``partition``, and the partitions, including the shorter final one, are
+	views of ``seq`` instead of new tuples.
+
+	>>> [bytes(part) for part in partition_all(2, b'abcde', view=True)]
+	[b'ab', b'cd', b'e']
+
+	With ``reuse=True``, every partition is the same list, refilled in place,
+	so no container is allocated per partition. Consume each partition, or
+	copy it, before advancing the iterator.
+
+	>>> [sum(part) for part in partition_all(2, [1, 2, 3, 4, 5], reuse=True)]
+	[3, 7, 5]
+
 	See Also
 	--------
 		partition
 	"""
+	if view:
+		if reuse:
+			message: str = 'Partitions that are views cannot be reused lists; omit `view` or `reuse`.'
+			raise ValueError(message)
+		return partition_all_views(n, seq)
+	if reuse:
+		return _refilled(n, seq)
+	return _partition_all(n, seq)
+
+def _partition_all[T](n: int, seq: Iterable[T]) -> Iterator[tuple[T, ...]]:
 	args: list[Iterator[T]] = [iter(seq)] * n
 	it: Iterator[tuple[T, ...]] = zip_longest(*args, fillvalue=no_pad)
 	try:
@@ -866,6 +1174,17 @@ def partition_all[T](n: int, seq: Iterable[T]) -> Iterator[tuple[T, ...]]:
 	else:
 		yield prev
 
+def _refilled[T](n: int, seq: Iterable[T]) -> Iterator[list[T]]:
+	if n < 1:
+		return
+	iterator: Iterator[T] = iter(seq)
+	buffer: list[T] = []
+	for first in iterator:
+		buffer.clear()
+		buffer.append(first)
+		buffer.extend(itertools.islice(iterator, n - 1))
+		yield buffer
+
 def peek[T](seq: Iterable[T]) -> tuple[T, Iterator[T]]:
 	"""Retrieve the next element of a sequence
 
@@ -939,8 +1258,56 @@ def pluck[T](
 		return (tuple(_get(item, seq, default) for item in ind) for seq in seqs)
 	return (_get(ind, seq, default) for seq in seqs)
 
+def pmap[T, R](
+	func: Callable[[T], R], seq: Iterable[T], *, ordered: bool = True, max_inflight: int | None = None, workers: int | None = None
+) -> Iterator[R]:
+	"""Map a function over a sequence on a pool of threads
+
+	Like ``map``, ``pmap`` is lazy and the results come in the order of
+	``seq``, but up to ``max_inflight`` calls of ``func`` run at once on
+	``workers`` threads. This helps when ``func`` waits on I/O, such as
+	reading files or making requests. With ``ordered=False``, every result is
+	returned as soon as it is ready.
+
+	>>> inc = lambda x: x + 1
+	>>> list(pmap(inc, [1, 2, 3]))
+	[2, 3, 4]
+	>>> sorted(pmap(inc, [1, 2, 3], ordered=False))
+	[2, 3, 4]
+
+	``seq`` is read as calls are submitted, so at most ``max_inflight`` items
+	and results are held at once. By default, ``max_inflight`` is twice the
+	number of threads. An exception raised by ``func`` is raised when its
+	result is reached.
+
+	See Also
+	--------
+		prefetch
+	"""
+	return parallel_map(func, seq, ordered, max_inflight, workers)
+
+def prefetch[T](n: int, seq: Iterable[T]) -> Iterator[T]:
+	"""Read up to n items of a sequence ahead on a background thread
+
+	The items come in the order of ``seq``. While the consumer works on one
+	item, a thread keeps reading from ``seq``, so a slow source, such as a
+	file on a network file system, does not stall every step of a pipeline.
+
+	>>> list(prefetch(2, range(5)))
+	[0, 1, 2, 3, 4]
+
+	An exception raised by ``seq`` is raised when its position is reached.
+	When the iterator is closed early, the thread stops after its current
+	read of ``seq``.
+
+	See Also
+	--------
+		pmap
+	"""
+	return read_ahead(n, seq)
+
 def random_sample[T](
-	prob: float, seq: Iterable[T], random_state: Randomable | int | float | str | bytes | bytearray | None = None
+	prob: float, seq: Iterable[T], random_state: Randomable | int | float | str | bytes | bytearray | None = None, *, skip: bool = False
 ) -> Iterator[T]:
 	"""Return elements from a sequence with probability of prob
 
@@ -972,6 +1339,15 @@ def random_sample[T](
 	>>> randobj = Random(2016)
 	>>> list(random_sample(0.1, seq, random_state=randobj))
 	[7, 9, 19, 25, 30, 32, 34, 48, 59, 60, 81, 98]
+
+	With ``skip=True``, the number of items between two chosen items is
+	drawn from the geometric distribution, so ``random`` is called once per
+	chosen item instead of once per item. The sample has the same
+	distribution, but not the same items for a given seed. The rows of a
+	NumPy array are then chosen with a NumPy generator in batches.
+
+	>>> list(random_sample(0.1, seq, random_state=2016, skip=True))
+	[2, 10, 12, 14, 27, 31, 32, 56, 68, 94]
 	"""
 	if hasattr(random_state, 'random'):
 		getNumber: Randomable = cast('Randomable', random_state)
@@ -979,6 +1355,8 @@ def random_sample[T](
 		from random import Random
 
 		getNumber = Random(random_state)
+	if skip:
+		return skip_sample(prob, seq, getNumber)
 	return filter(lambda _faux_bool: getNumber.random() < prob, seq)
 
 @overload
@@ -1026,6 +1404,12 @@ def reduceby[T, K: Hashable](
 	reduction.  This can be either a constant value like ``0`` or a callable
 	like ``lambda : 0`` as might be used in ``defaultdict``.
 
+	If ``seq`` is a one-dimensional NumPy array of numbers, ``key`` is a
+	unary ufunc, and ``binop`` is ``operator.add``, ``operator.mul``,
+	``max``, or ``min``, NumPy groups the values and reduces each group with
+	the matching ufunc. The keys and totals are then Python scalars, and sums
+	of floats may differ in the last digits.
+
 	Simple Examples
 	---------------
 
@@ -1069,6 +1453,9 @@ def reduceby[T, K: Hashable](
 	{True:  set([2, 4]),
 	 False: set([1, 3])}
 	"""
+	vectorized: dict[K, T] | None = vectorized_reduceby(key, binop, seq, init)
+	if vectorized is not None:
+		return vectorized
 	is_no_default: bool = init == no_default
 	if not is_no_default and (not callable(init)):
 		_init: T = init
@@ -1111,18 +1498,20 @@ def second[T](seq: Iterable[T]) -> T:
 	return next(seq)
 
 @overload
-def sliding_window[T](n: Literal[1], seq: Iterable[T]) -> Iterator[tuple[T]]: ...
+def sliding_window[T](n: Literal[1], seq: Iterable[T], *, view: Literal[False] = False) -> Iterator[tuple[T]]: ...
 @overload
-def sliding_window[T](n: Literal[2], seq: Iterable[T]) -> Iterator[tuple[T, T]]: ...
+def sliding_window[T](n: Literal[2], seq: Iterable[T], *, view: Literal[False] = False) -> Iterator[tuple[T, T]]: ...
 @overload
-def sliding_window[T](n: Literal[3], seq: Iterable[T]) -> Iterator[tuple[T, T, T]]: ...
+def sliding_window[T](n: Literal[3], seq: Iterable[T], *, view: Literal[False] = False) -> Iterator[tuple[T, T, T]]: ...
 @overload
-def sliding_window[T](n: Literal[4], seq: Iterable[T]) -> Iterator[tuple[T, T, T, T]]: ...
+def sliding_window[T](n: Literal[4], seq: Iterable[T], *, view: Literal[False] = False) -> Iterator[tuple[T, T, T, T]]: ...
 @overload
-def sliding_window[T](n: Literal[5], seq: Iterable[T]) -> Iterator[tuple[T, T, T, T, T]]: ...
+def sliding_window[T](n: Literal[5], seq: Iterable[T], *, view: Literal[False] = False) -> Iterator[tuple[T, T, T, T, T]]: ...
 @overload
-def sliding_window[T](n: int, seq: Iterable[T]) -> Iterator[tuple[T, ...]]: ...
-def sliding_window(n: int, seq: Iterable[Any]) -> Iterator[tuple[Any, ...]]:
+def sliding_window[T](n: int, seq: Iterable[T], *, view: Literal[False] = False) -> Iterator[tuple[T, ...]]: ...
+@overload
+def sliding_window(n: int, seq: Any, *, view: Literal[True]) -> Iterator[Any]: ...
+def sliding_window(n: int, seq: Iterable[Any], *, view: bool = False) -> Iterator[tuple[Any, ...]] | Iterator[Any]:
 	"""A sequence of overlapping subsequences
 
 	>>> list(sliding_window(2, [1, 2, 3, 4]))
@@ -1134,7 +1523,17 @@ def sliding_window(n: int, seq: Iterable[Any]) -> Iterator[tuple[Any, ...]]:
 	>>> mean = lambda seq: float(sum(seq)) / len(seq)
 	>>> list(map(mean, sliding_window(2, [1, 2, 3, 4])))
 	[1.5, 2.5, 3.5]
+
+	With ``view=True``, ``seq`` must be a buffer, such as ``bytes``,
+	``bytearray``, ``array.array``, or ``memoryview``, or a NumPy array, and
+	the windows are ``memoryview`` slices or strided NumPy views that share
+	the memory of ``seq`` instead of new tuples.
+
+	>>> [bytes(window) for window in sliding_window(2, b'abc', view=True)]
+	[b'ab', b'bc']
 	"""
+	if view:
+		return sliding_window_views(n, seq)
 	return zip(*(deque(itertools.islice(it, i), 0) or it for i, it in enumerate(itertools.tee(seq, n))))
 
 @overload
@@ -1219,7 +1618,7 @@ def topk(k: int, seq: Iterable[Any], key: Callable[[Any], Any] | None = None) ->
 		key = getter(key)
 	return tuple(heapq.nlargest(k, seq, key=key))
 
-def unique[T](seq: Iterable[T], key: Callable[[T], Any] | None = None) -> Iterator[T]:
+def unique[T](seq: Iterable[T], key: Callable[[T], Any] | None = None, seen: SupportsAddContains[Any] | None = None) -> Iterator[T]:
 	"""Return only unique elements of a sequence
 
 	>>> tuple(unique((1, 2, 3)))
@@ -1231,8 +1630,20 @@ def unique[T](seq: Iterable[T], key: Callable[[T], Any] | None = None) -> Iterat
 
 	>>> tuple(unique(['cat', 'mouse', 'dog', 'hen'], key=len))
 	('cat', 'mouse')
+
+	By default ``unique`` remembers every key in a new ``set``. ``seen`` may
+	be any object with ``__contains__`` and ``add``, e.g. a ``set`` shared
+	between calls or one of the bounded sets ``LRUSet``, ``WindowSet``, and
+	``BloomFilter`` of the ``sandbox`` package.
+
+	>>> seen = {1}
+	>>> tuple(unique((1, 2, 3), seen=seen))
+	(2, 3)
+	>>> sorted(seen)
+	[1, 2, 3]
 	"""
-	seen: set[T] = set()
+	if seen is None:
+		seen = set()
 	seen_add: Callable[[T], None] = seen.add
 	if key is None:
 		for item in seq:
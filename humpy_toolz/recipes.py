@@ -1,6 +1,7 @@
 # ruff:file-ignore[undocumented-public-module]
 from __future__ import annotations
 
+from humpy_toolz._vectorized import vectorized_countby
 from humpy_toolz.itertoolz import frequencies, getter, pluck
 from typing import TYPE_CHECKING
 import itertools
@@ -27,10 +28,17 @@ def countby[T, K: Hashable](key: Callable[[T], K] | K, seq: Iterable[T]) -> dict
 	>>> countby(iseven, [1, 2, 3])  # doctest:+SKIP
 	{True: 1, False: 2}
 
+	If ``seq`` is a one-dimensional NumPy array and ``key`` is a unary ufunc,
+	or ``seq`` is a structured array and ``key`` names fields of it, NumPy
+	computes and counts the keys, and the keys are Python scalars or tuples.
+
 	See Also
 	--------
 		groupby
 	"""
+	vectorized: dict[K, int] | None = vectorized_countby(key, seq)
+	if vectorized is not None:
+		return vectorized
 	if not callable(key):
 		key = getter(key)
 	return frequencies(map(key, seq))
@@ -1,7 +1,44 @@
 # ruff:file-ignore[undocumented-public-package]
 from __future__ import annotations
 
+from humpy_toolz.sandbox.accumulators import GroupBy, ReduceBy
+from humpy_toolz.sandbox.columns import column_getter, get_columns, pluck_columns
 from humpy_toolz.sandbox.core import EqualityHashKey, unzip
-from humpy_toolz.sandbox.parallel import fold
+from humpy_toolz.sandbox.diskcache import DiskCache
+from humpy_toolz.sandbox.external import external_sorted
+from humpy_toolz.sandbox.parallel import fold, foldby
+from humpy_toolz.sandbox.pipeline import Pipeline
+from humpy_toolz.sandbox.rolling import rolling_max, rolling_mean, rolling_min, rolling_reduce, rolling_sum
+from humpy_toolz.sandbox.sampling import reservoir_sample
+from humpy_toolz.sandbox.sketches import (
+	approx_countby, approx_frequencies, BloomFilter, CountMinSketch, HyperLogLog, LRUSet, SpaceSaving, TopK, WindowSet)
 
-__all__ = ['EqualityHashKey', 'fold', 'unzip']
+__all__ = [
+	'BloomFilter',
+	'CountMinSketch',
+	'DiskCache',
+	'EqualityHashKey',
+	'GroupBy',
+	'HyperLogLog',
+	'LRUSet',
+	'Pipeline',
+	'ReduceBy',
+	'SpaceSaving',
+	'TopK',
+	'WindowSet',
+	'approx_countby',
+	'approx_frequencies',
+	'column_getter',
+	'external_sorted',
+	'fold',
+	'foldby',
+	'get_columns',
+	'pluck_columns',
+	'reservoir_sample',
+	'rolling_max',
+	'rolling_mean',
+	'rolling_min',
+	'rolling_reduce',
+	'rolling_sum',
+	'unzip',
+]
@@ -0,0 +1,155 @@
+# ruff:file-ignore[undocumented-public-module]
+from __future__ import annotations
+
+from humpy_toolz.itertoolz import getter
+from humpy_toolz.sandbox.parallel import _merge_reductions
+from humpy_toolz.utils import no_default
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from collections.abc import Callable, Hashable, Iterable
+	from typing import Any, Literal, Self
+
+class ReduceBy[T, K: Hashable, R]:
+	"""Accumulate ``reduceby`` over a stream that arrives in batches.
+
+	``update`` adds the items of a batch to the totals of their groups exactly as ``reduceby(key, binop, seq, init)``
+	does, so ``result()`` after ``update(a)`` and ``update(b)`` equals ``reduceby(key, binop, a + b, init)``.
+	Accumulators of different shards or periods are combined with ``merge``, which passes the totals of a group to
+	``combine`` in stream order. An accumulator pickles, and so can be checkpointed, if ``key``, ``binop``, ``init``,
+	``combine``, and the totals pickle.
+
+	>>> from operator import add
+	>>> iseven = lambda x: x % 2 == 0
+	>>> totals = ReduceBy(iseven, add, init=0)
+	>>> totals.update([1, 2, 3])
+	>>> totals.update([4, 5])
+	>>> totals.result()
+	{False: 9, True: 6}
+
+	See Also
+	--------
+		humpy_toolz.itertoolz.reduceby
+		GroupBy
+		foldby
+	"""
+
+	def __init__(
+		self,
+		key: Callable[[T], K] | Any,
+		binop: Callable[[R, T], R],
+		init: R | Callable[[], R] | Literal['__no__default__'] = no_default,
+		combine: Callable[[R, R], R] | None = None,
+	) -> None:
+		if not callable(key):
+			key = getter(key)
+		self.key: Callable[[T], K] = key
+		self.binop: Callable[[R, T], R] = binop
+		self.init: R | Callable[[], R] | Literal['__no__default__'] = init
+		self.combine: Callable[[R, R], R] = combine if combine is not None else binop
+		self.totals: dict[K, R] = {}
+
+	def update(self, seq: Iterable[T]) -> None:
+		key: Callable[[T], K] = self.key
+		binop: Callable[[R, T], R] = self.binop
+		init: Any = self.init
+		totals: dict[K, Any] = self.totals
+		if init == no_default:
+			for item in seq:
+				k: K = key(item)
+				totals[k] = binop(totals[k], item) if k in totals else item
+		elif callable(init):
+			for item in seq:
+				k = key(item)
+				totals[k] = binop(totals[k] if k in totals else init(), item)
+		else:
+			for item in seq:
+				k = key(item)
+				totals[k] = binop(totals[k] if k in totals else init, item)
+
+	def merge(self, other: ReduceBy[T, K, R]) -> Self:
+		"""Return an accumulator of the stream of ``self`` followed by the stream of ``other``.
+
+		The merged accumulator has a new ``dict`` but shares the total objects of ``self`` and ``other``. A ``combine``
+		that mutates its first argument therefore also changes the totals of ``self``, and a later ``update`` of either
+		accumulator with a mutating ``binop`` changes the merged totals.
+		"""
+		merged: Self = self.copy()
+		_merge_reductions(self.combine, merged.totals, other.totals)
+		return merged
+
+	def copy(self) -> Self:
+		"""Return an accumulator with a new ``dict`` of the same total objects, as ``result`` does."""
+		duplicate: Self = type(self).__new__(type(self))
+		duplicate.__dict__.update(self.__dict__)
+		duplicate.totals = dict(self.totals)
+		return duplicate
+
+	def result(self) -> dict[K, R]:
+		"""Return a new ``dict`` of the totals.
+
+		Later updates do not add keys to the ``dict`` or replace its values. The totals themselves are not copied, so with
+		a ``binop`` that mutates its first argument and returns it, such as one that adds to a ``set``, a later ``update``
+		also changes the totals in the returned ``dict``.
+		"""
+		return dict(self.totals)
+
+	def __len__(self) -> int:
+		return len(self.totals)
+
+class GroupBy[T, K: Hashable]:
+	"""Accumulate ``groupby`` over a stream that arrives in batches.
+
+	``result()`` after ``update(a)`` and ``update(b)`` equals ``groupby(key, a + b)``, and ``merge`` concatenates the
+	groups of two accumulators in stream order. An accumulator pickles if ``key`` and the items pickle.
+
+	>>> groups = GroupBy(len)
+	>>> groups.update(['Alice', 'Bob'])
+	>>> groups.update(['Charlie', 'Dan'])
+	>>> groups.result()
+	{5: ['Alice'], 3: ['Bob', 'Dan'], 7: ['Charlie']}
+
+	See Also
+	--------
+		humpy_toolz.itertoolz.groupby
+		ReduceBy
+	"""
+
+	def __init__(self, key: Callable[[T], K] | Any) -> None:
+		if not callable(key):
+			key = getter(key)
+		self.key: Callable[[T], K] = key
+		self.groups: dict[K, list[T]] = {}
+
+	def update(self, seq: Iterable[T]) -> None:
+		key: Callable[[T], K] = self.key
+		groups: dict[K, list[T]] = self.groups
+		for item in seq:
+			k: K = key(item)
+			if k in groups:
+				groups[k].append(item)
+			else:
+				groups[k] = [item]
+
+	def merge(self, other: GroupBy[T, K]) -> Self:
+		"""Return an accumulator of the stream of ``self`` followed by the stream of ``other``."""
+		merged: Self = self.copy()
+		for k, items in other.groups.items():
+			if k in merged.groups:
+				merged.groups[k].extend(items)
+			else:
+				merged.groups[k] = list(items)
+		return merged
+
+	def copy(self) -> Self:
+		duplicate: Self = type(self).__new__(type(self))
+		duplicate.key = self.key
+		duplicate.groups = {k: list(items) for k, items in self.groups.items()}
+		return duplicate
+
+	def result(self) -> dict[K, list[T]]:
+		"""Return a new ``dict`` of new lists, which later updates do not change."""
+		return {k: list(items) for k, items in self.groups.items()}
+
+	def __len__(self) -> int:
+		return len(self.groups)
@@ -0,0 +1,169 @@
+# ruff:file-ignore[undocumented-public-module, builtin-argument-shadowing, import-outside-top-level]
+from __future__ import annotations
+
+from humpy_toolz.itertoolz import _get
+from humpy_toolz.utils import no_default
+from operator import itemgetter
+from typing import overload, TYPE_CHECKING
+import array
+import itertools
+
+if TYPE_CHECKING:
+	from collections.abc import Callable, Iterable, Iterator, Sequence
+	from typing import Any, Literal
+
+type ColumnFormat = Literal['array', 'list', 'numpy']
+
+_FORMATS: frozenset[str] = frozenset(('array', 'list', 'numpy'))
+
+def _typecodes(typecode: Any, count: int) -> list[Any]:
+	if isinstance(typecode, str) or not isinstance(typecode, (list, tuple)):
+		return [typecode] * count
+	if len(typecode) != count:
+		message: str = f'Expected {count} typecodes, one per index, but got {len(typecode)}.'
+		raise ValueError(message)
+	return list(typecode)
+
+def _builder(format: str, typecode: Any) -> Callable[[Iterable[Any], int], Any]:
+	"""Return a function that builds one column buffer from an iterable of values and the number of values."""
+	if format == 'list':
+		return lambda values, _count: list(values)
+	if format == 'array':
+		if typecode is None:
+			message: str = "`typecode` is required when `format='array'`."
+			raise ValueError(message)
+		return lambda values, _count: array.array(typecode, values)
+	import numpy
+	if typecode is None:
+		return lambda values, _count: numpy.array(list(values))
+	dtype: Any = numpy.dtype(typecode)
+	return lambda values, count: numpy.fromiter(values, dtype, count=count)
+
+def _extractor(ind: Any, default: Any) -> Callable[[Sequence[Any]], Iterable[Any]]:
+	if default == no_default:
+		get: itemgetter[Any] = itemgetter(ind)
+		return lambda records: map(get, records)
+	return lambda records: (_get(ind, record, default) for record in records)
+
+@overload
+def column_getter(
+	ind: list[Any], default: Any = no_default, format: ColumnFormat = 'list', typecode: Any = None,
+) -> Callable[[Sequence[Any]], tuple[Any, ...]]: ...
+@overload
+def column_getter(ind: Any, default: Any = no_default, format: ColumnFormat = 'list', typecode: Any = None) -> Callable[[Sequence[Any]], Any]: ...
+def column_getter(ind: Any, default: Any = no_default, format: ColumnFormat = 'list', typecode: Any = None) -> Callable[[Sequence[Any]], Any]:
+	"""Return a function that plucks the columns ``ind`` out of a batch of records.
+
+	This is the columnar counterpart of ``getter``. The returned function takes a sequence of records (sequences or dicts)
+	and returns one column buffer if ``ind`` is a single index, or a tuple of column buffers, one per index, if ``ind`` is a
+	list. Each column is built straight from the records, so no per-record tuple is ever created.
+
+	Parameters
+	----------
+	ind : Any | list[Any]
+		Index or key, or list of indices or keys, of the columns.
+	default : Any = no_default
+		Value of a missing index or key; if omitted, a missing index or key raises ``IndexError`` or ``KeyError``.
+	format : {'list', 'array', 'numpy'} = 'list'
+		Type of the column buffers: ``list``, ``array.array``, or ``numpy.ndarray``.
+	typecode : Any = None
+		``array`` typecode, or NumPy dtype, of the columns, or a list or tuple with one per index. Required for
+		``format='array'``; with ``format='numpy'`` and no typecode, NumPy infers the dtype.
+
+	Examples
+	--------
+	>>> get = column_getter([0, 2])
+	>>> get([(1, 'a', 2.5), (2, 'b', 3.5)])
+	([1, 2], [2.5, 3.5])
+	>>> column_getter('x', format='array', typecode='q')([{'x': 1}, {'x': 2}])
+	array('q', [1, 2])
+
+	See Also
+	--------
+		pluck_columns
+		getter
+	"""
+	if format not in _FORMATS:
+		message: str = f'`format` must be one of {sorted(_FORMATS)}, not {format!r}.'
+		raise ValueError(message)
+	if isinstance(ind, list):
+		columns: list[tuple[Callable[[Sequence[Any]], Iterable[Any]], Callable[[Iterable[Any], int], Any]]] = [
+			(_extractor(item, default), _builder(format, code)) for item, code in zip(ind, _typecodes(typecode, len(ind)), strict=True)
+		]
+		return lambda records: tuple(build(extract(records), len(records)) for extract, build in columns)
+	extract: Callable[[Sequence[Any]], Iterable[Any]] = _extractor(ind, default)
+	build: Callable[[Iterable[Any], int], Any] = _builder(format, typecode)
+	return lambda records: build(extract(records), len(records))
+
+@overload
+def pluck_columns(
+	ind: list[Any],
+	seqs: Iterable[Any],
+	default: Any = no_default,
+	chunksize: int = 4096,
+	format: ColumnFormat = 'list',
+	typecode: Any = None,
+) -> Iterator[tuple[Any, ...]]: ...
+@overload
+def pluck_columns(
+	ind: Any, seqs: Iterable[Any], default: Any = no_default, chunksize: int = 4096, format: ColumnFormat = 'list', typecode: Any = None,
+) -> Iterator[Any]: ...
+def pluck_columns(
+	ind: Any, seqs: Iterable[Any], default: Any = no_default, chunksize: int = 4096, format: ColumnFormat = 'list', typecode: Any = None,
+) -> Iterator[Any]:
+	"""Pluck columns out of a stream of records, ``chunksize`` records at a time.
+
+	This is the columnar counterpart of ``pluck``: instead of one value or tuple per record, it yields, for every chunk of
+	``chunksize`` records, the column buffer of ``ind`` or, if ``ind`` is a list, a tuple of column buffers. The last chunk
+	may be shorter. See ``column_getter`` for ``default``, ``format``, and ``typecode``.
+
+	>>> data = [{'id': 1, 'name': 'Cheese'}, {'id': 2, 'name': 'Pies'}, {'id': 3}]
+	>>> list(pluck_columns(['id', 'name'], data, default=None, chunksize=2))
+	[([1, 2], ['Cheese', 'Pies']), ([3], [None])]
+
+	See Also
+	--------
+		column_getter
+		get_columns
+		pluck
+	"""
+	if chunksize < 1:
+		message: str = f'`chunksize` must be a positive integer, not {chunksize!r}.'
+		raise ValueError(message)
+	get: Callable[[Sequence[Any]], Any] = column_getter(ind, default, format, typecode)
+	iterator: Iterator[Any] = iter(seqs)
+	while chunk := list(itertools.islice(iterator, chunksize)):
+		yield get(chunk)
+
+def _concatenate(format: str, chunks: list[Any]) -> Any:
+	if format == 'numpy':
+		import numpy
+		return numpy.concatenate(chunks)
+	column: Any = chunks[0]
+	for chunk in chunks[1:]:
+		column.extend(chunk)
+	return column
+
+def get_columns(
+	ind: Any, seqs: Iterable[Any], default: Any = no_default, chunksize: int = 4096, format: ColumnFormat = 'list', typecode: Any = None,
+) -> Any:
+	"""Pluck whole columns out of all of the records of ``seqs``.
+
+	Return the column buffer of ``ind`` or, if ``ind`` is a list, a tuple of column buffers. The records are read
+	``chunksize`` at a time, so only one chunk of records is held alongside the columns. See ``column_getter`` for
+	``default``, ``format``, and ``typecode``.
+
+	>>> get_columns([0, 1], [(1, 'a'), (2, 'b'), (3, 'c')], chunksize=2)
+	([1, 2, 3], ['a', 'b', 'c'])
+
+	See Also
+	--------
+		pluck_columns
+		get
+	"""
+	batches: list[Any] = list(pluck_columns(ind, seqs, default, chunksize, format, typecode))
+	if not batches:
+		return column_getter(ind, default, format, typecode)([])
+	if not isinstance(ind, list):
+		return _concatenate(format, batches)
+	return tuple(_concatenate(format, list(chunks)) for chunks in zip(*batches, strict=True))
@@ -0,0 +1,129 @@
+# ruff:file-ignore[undocumented-public-module]
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from humpy_toolz._hashing import stable_digest
+from importlib import import_module
+from types import ModuleType
+from typing import TYPE_CHECKING
+import os
+import pickle
+import sqlite3
+import threading
+
+if TYPE_CHECKING:
+	from collections.abc import Callable, Hashable, Iterator
+	from humpy_toolz._theTypes import BytesSerializer
+	from typing import Any
+
+_SCHEMA: str = (
+	'CREATE TABLE IF NOT EXISTS cache '
+	'(namespace TEXT NOT NULL, digest BLOB NOT NULL, key BLOB NOT NULL, value BLOB NOT NULL, PRIMARY KEY (namespace, digest)) '
+	'WITHOUT ROWID'
+)
+
+class DiskCache[K: Hashable, V](MutableMapping[K, V]):
+	"""A persistent mapping in a SQLite database that many threads and processes can read and write at once.
+
+	Pass a ``DiskCache`` as the ``cache`` of ``memoize`` to keep results across restarts and to share them between
+	worker processes:
+
+	>>> import os, tempfile
+	>>> from humpy_toolz import memoize
+	>>> path = os.path.join(tempfile.mkdtemp(), 'cache.sqlite')
+	>>> @memoize(cache=DiskCache(path))
+	... def double(x):
+	...     return 2 * x
+	>>> double(21)
+	42
+	>>> DiskCache(path)[21]
+	42
+
+	A key is stored under the BLAKE2b digest of its canonical encoding from ``humpy_toolz._hashing``, so a key must be
+	``None``, a ``bool``, ``int``, ``float``, ``str``, or ``bytes``, or a tuple or frozenset of those, which covers the
+	keys of the default ``key`` functions of ``memoize``. Keys that compare equal, such as ``1`` and ``1.0`` or two
+	frozensets that iterate in different orders, are the same key in every process. Values, and keys for iteration,
+	are converted to ``bytes`` with ``serializer``, ``pickle`` by default, or any object with ``dumps`` and ``loads``.
+
+	The database is in write-ahead-log mode, and every read and write is one statement in its own transaction, so
+	readers never wait for writers, and a write that races another write of the same key keeps one of the two values.
+	``namespace`` separates the caches of different functions in one file. Each thread, and each process after a
+	``fork``, opens its own connection, and a ``DiskCache`` pickles as its arguments, so it can be sent to the workers
+	of a process pool.
+	"""
+
+	def __init__(self, path: str | os.PathLike[str], serializer: BytesSerializer | None = None, namespace: str = '', timeout: float = 30.0) -> None:
+		self.path: str = os.fspath(path)
+		self.serializer: BytesSerializer | None = serializer
+		self._serializer: BytesSerializer = serializer or pickle
+		self.namespace: str = namespace
+		self.timeout: float = timeout
+		self._local: threading.local = threading.local()
+		self._connection()
+
+	def _connection(self) -> sqlite3.Connection:
+		connection: sqlite3.Connection | None = getattr(self._local, 'connection', None)
+		if connection is None or self._local.pid != os.getpid():
+			# Autocommit: every statement is its own transaction, and no transaction stays open between calls.
+			connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+			connection.execute('PRAGMA journal_mode=WAL')
+			connection.execute('PRAGMA synchronous=NORMAL')
+			connection.execute(_SCHEMA)
+			self._local.connection = connection
+			self._local.pid = os.getpid()
+		return connection
+
+	def __getitem__(self, key: K) -> V:
+		row: tuple[bytes] | None = self._connection().execute(
+			'SELECT value FROM cache WHERE namespace = ? AND digest = ?', (self.namespace, stable_digest(key)),
+		).fetchone()
+		if row is None:
+			raise KeyError(key)
+		return self._serializer.loads(row[0])
+
+	def __setitem__(self, key: K, value: V) -> None:
+		self._connection().execute(
+			'INSERT OR REPLACE INTO cache (namespace, digest, key, value) VALUES (?, ?, ?, ?)',
+			(self.namespace, stable_digest(key), self._serializer.dumps(key), self._serializer.dumps(value)),
+		)
+
+	def __delitem__(self, key: K) -> None:
+		cursor: sqlite3.Cursor = self._connection().execute(
+			'DELETE FROM cache WHERE namespace = ? AND digest = ?', (self.namespace, stable_digest(key)),
+		)
+		if cursor.rowcount == 0:
+			raise KeyError(key)
+
+	def __contains__(self, key: object) -> bool:
+		return self._connection().execute(
+			'SELECT 1 FROM cache WHERE namespace = ? AND digest = ?', (self.namespace, stable_digest(key)),  # pyright: ignore[reportArgumentType]
+		).fetchone() is not None
+
+	def __iter__(self) -> Iterator[K]:
+		rows: list[tuple[bytes]] = self._connection().execute('SELECT key FROM cache WHERE namespace = ?', (self.namespace,)).fetchall()
+		return (self._serializer.loads(row[0]) for row in rows)
+
+	def __len__(self) -> int:
+		return self._connection().execute('SELECT COUNT(*) FROM cache WHERE namespace = ?', (self.namespace,)).fetchone()[0]
+
+	def clear(self) -> None:
+		self._connection().execute('DELETE FROM cache WHERE namespace = ?', (self.namespace,))
+
+	def close(self) -> None:
+		"""Close the connection of the calling thread; the next access opens a new one."""
+		connection: sqlite3.Connection | None = getattr(self._local, 'connection', None)
+		if connection is not None:
+			connection.close()
+			del self._local.connection
+
+	def __reduce__(self) -> tuple[Callable[..., DiskCache[K, V]], tuple[Any, ...]]:
+		if isinstance(self.serializer, ModuleType):
+			# A module, such as `json` or `marshal`, does not pickle, but its name does.
+			return (_reopen, (type(self), self.path, self.serializer.__name__, self.namespace, self.timeout))
+		return (type(self), (self.path, self.serializer, self.namespace, self.timeout))
+
+	def __repr__(self) -> str:
+		return f'{type(self).__name__}({self.path!r}, namespace={self.namespace!r})'
+
+def _reopen[K: Hashable, V](cls: type[DiskCache[K, V]], path: str, serializer: str, namespace: str, timeout: float) -> DiskCache[K, V]:
+	return cls(path, import_module(serializer), namespace, timeout)  # pyright: ignore[reportArgumentType]
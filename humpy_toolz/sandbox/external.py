@@ -0,0 +1,153 @@
+# ruff:file-ignore[undocumented-public-module]
+from __future__ import annotations
+
+from humpy_toolz._prefetch import check_batchsize
+from humpy_toolz._spill import SpillDirectory
+from humpy_toolz.itertoolz import cons, merge_sorted, partition_all
+from humpy_toolz.sandbox.parallel import _submit_bounded
+from typing import TYPE_CHECKING
+import os
+import pickle
+
+if TYPE_CHECKING:
+	from collections.abc import Callable, Iterable, Iterator
+	from humpy_toolz._theTypes import Serializer, SupportsDunderLT
+	from humpy_toolz.sandbox.parallel import ExecutorSpecification
+	from typing import Any
+
+RUN_BLOCK: int = 1024
+"""Number of items that one call of ``serializer.dump`` writes to a run file."""
+
+def _dump_run[T](path: str, items: Iterable[T], serializer: Serializer | None) -> str:
+	"""Write ``items`` to ``path`` in blocks of ``RUN_BLOCK`` items followed by an empty block, and return ``path``."""
+	serializer = serializer or pickle
+	with open(path, 'wb') as writeStream:
+		for block in partition_all(RUN_BLOCK, items):
+			serializer.dump(list(block), writeStream)
+		serializer.dump([], writeStream)
+	return path
+
+def _load_run[T](path: str, serializer: Serializer | None) -> Iterator[T]:
+	serializer = serializer or pickle
+	with open(path, 'rb') as readStream:
+		while block := serializer.load(readStream):
+			yield from block
+	os.remove(path)
+
+def _spill_run[T](path: str, key: Callable[[T], SupportsDunderLT[Any]] | None, serializer: Serializer | None, run: tuple[T, ...]) -> str:
+	return _dump_run(path, sorted(run, key=key), serializer)
+
+def _spill_runs[T](
+	spill: SpillDirectory,
+	runs: Iterable[tuple[T, ...]],
+	key: Callable[[T], SupportsDunderLT[Any]] | None,
+	serializer: Serializer | None,
+	executor: ExecutorSpecification,
+	max_workers: int | None,
+) -> list[str]:
+	"""Sort every run, write it to a new file of ``spill``, and return the paths of the files in the order of ``runs``."""
+	if executor is None:
+		return [_spill_run(spill.new_file(), key, serializer, run) for run in runs]
+
+	paths: list[str] = []
+	_submit_bounded(_spill_run, ((spill.new_file(), key, serializer, run) for run in runs), paths.append, executor, max_workers)
+	return paths
+
+def _merge_runs[T](
+	paths: list[str], key: Callable[[T], SupportsDunderLT[Any]] | None, serializer: Serializer | None, prefetch: int | None,
+) -> Iterator[T]:
+	return merge_sorted(*[_load_run(path, serializer) for path in paths], key=key, prefetch=prefetch)
+
+def _external_sorted[T](
+	seq: Iterable[T],
+	key: Callable[[T], SupportsDunderLT[Any]] | None,
+	run_size: int,
+	tmpdir: str | None,
+	serializer: Serializer | None,
+	executor: ExecutorSpecification,
+	max_workers: int | None,
+	fan_in: int,
+	prefetch: int | None,
+) -> Iterator[T]:
+	runs: Iterator[tuple[T, ...]] = partition_all(run_size, seq)
+	first: tuple[T, ...] | None = next(runs, None)
+	if first is None:
+		return
+	if len(first) < run_size:
+		yield from sorted(first, key=key)
+		return
+	spill: SpillDirectory = SpillDirectory(tmpdir)
+	try:
+		paths: list[str] = _spill_runs(spill, cons(first, runs), key, serializer, executor, max_workers)
+		while len(paths) > fan_in:
+			paths = [
+				_dump_run(spill.new_file(), _merge_runs(list(group), key, serializer, prefetch), serializer)
+				for group in partition_all(fan_in, paths)
+			]
+		yield from _merge_runs(paths, key, serializer, prefetch)
+	finally:
+		spill.cleanup()
+
+def external_sorted[T](
+	seq: Iterable[T],
+	key: Callable[[T], SupportsDunderLT[Any]] | None = None,
+	run_size: int = 100_000,
+	tmpdir: str | None = None,
+	serializer: Serializer | None = None,
+	executor: ExecutorSpecification = None,
+	max_workers: int | None = None,
+	fan_in: int = 256,
+	prefetch: int | None = None,
+) -> Iterator[T]:
+	"""Sort a sequence that may be larger than memory.
+
+	``seq`` is cut into runs of ``run_size`` items with ``partition_all``. Every run is sorted and written to a temporary
+	file, and the files are merged lazily with ``merge_sorted``. If ``seq`` has fewer than ``run_size`` items, it is
+	sorted in memory and no file is written. The sort is stable, and the temporary files are removed when the iterator
+	is exhausted or closed.
+
+	Parameters
+	----------
+	seq : Iterable[T]
+		Items to sort.
+	key : Callable[[T], SupportsDunderLT[Any]] | None = None
+		Function of one item that returns the value to sort by, as in ``sorted``.
+	run_size : int = 100_000
+		Number of items that are sorted in memory at once.
+	tmpdir : str | None = None
+		Directory in which the temporary directory of the runs is created; ``None`` uses the default of ``tempfile``.
+	serializer : Serializer | None = None
+		Object with ``dump(obj, file)`` and ``load(file)``, such as the ``marshal`` module, that writes blocks of items to
+		the run files; ``None`` uses ``pickle``.
+	executor : {'thread', 'process'} | Executor | None = None
+		Pool that sorts and writes the runs while the next runs are read from ``seq``, as in ``fold``. At most
+		``2 * max_workers`` runs are in flight. With ``'process'``, ``key``, ``serializer``, and every run are pickled.
+	max_workers : int | None = None
+		Number of workers when ``executor`` is a string.
+	fan_in : int = 256
+		Most run files that are merged at once; more runs are first merged in groups of ``fan_in`` into longer runs.
+	prefetch : int | None = None
+		If given, the run files are read ahead in batches of ``prefetch`` items on background threads, as in
+		``merge_sorted``.
+
+	Examples
+	--------
+	>>> list(external_sorted([5, 3, 8, 1, 9, 2], run_size=2))
+	[1, 2, 3, 5, 8, 9]
+	>>> list(external_sorted(['bb', 'a', 'ccc'], key=len, run_size=2, executor='thread'))
+	['a', 'bb', 'ccc']
+
+	See Also
+	--------
+		merge_sorted
+		partition_all
+	"""
+	if run_size < 1:
+		message: str = f'`run_size` must be a positive number of items, not {run_size!r}.'
+		raise ValueError(message)
+	if fan_in < 2:
+		message = f'`fan_in` must be at least 2, not {fan_in!r}.'
+		raise ValueError(message)
+	if prefetch is not None:
+		check_batchsize(prefetch)
+	return _external_sorted(seq, key, run_size, tmpdir, serializer, executor, max_workers, fan_in, prefetch)
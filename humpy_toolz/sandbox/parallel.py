@@ -1,16 +1,24 @@
 # ruff:file-ignore[undocumented-public-module, builtin-argument-shadowing]
 from __future__ import annotations
 
-from humpy_toolz.itertoolz import partition_all
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from humpy_toolz.itertoolz import reduceby
 from humpy_toolz.utils import no_default
 from typing import overload, TYPE_CHECKING
+import builtins
 import functools
+import itertools
+import os
+import time
 
 if TYPE_CHECKING:
-	from collections.abc import Callable, Iterable
-	from typing import Literal
+	from collections.abc import Callable, Hashable, Iterable, Iterator
+	from concurrent.futures import Future
+	from typing import Any, Literal
 
 type MapFunction[TypeElement, TypeResult] = Callable[[Callable[[Iterable[TypeElement]], TypeResult], Iterable[Iterable[TypeElement]]], Iterable[TypeResult]]
+type ExecutorSpecification = Executor | Literal['process', 'thread'] | None
 
 @overload
 def _reduce[TypeElement](func: Callable[[TypeElement, TypeElement], TypeElement], seq: Iterable[TypeElement], initial: None = None) -> TypeElement: ...
@@ -26,6 +34,138 @@ def _reduce[TypeResult, TypeElement](
 	else:
 		return functools.reduce(func, seq, initial)
 
+def _timed[TypeElement, TypeResult](func: Callable[[tuple[TypeElement, ...]], TypeResult], chunk: tuple[TypeElement, ...]) -> tuple[TypeResult, float, int]:
+	start: float = time.perf_counter()
+	result: TypeResult = func(chunk)
+	return (result, time.perf_counter() - start, len(chunk))
+
+class _Chunker[TypeElement]:
+	"""Cut an iterable into tuples whose size may change between chunks.
+
+	With ``target_latency`` set, every measurement passed to ``record`` moves ``chunksize`` toward the number of elements that
+	one call of the chunk function processes in ``target_latency`` seconds. A single measurement may at most halve or double
+	``chunksize`` so that one slow or fast chunk does not swing the size.
+	"""
+
+	def __init__(self, seq: Iterable[TypeElement], chunksize: int, target_latency: float | None = None) -> None:
+		self.iterator: Iterator[TypeElement] = iter(seq)
+		self.chunksize: int = chunksize
+		self.target_latency: float | None = target_latency
+		self.seconds_per_element: float | None = None
+
+	def __iter__(self) -> _Chunker[TypeElement]:
+		return self
+
+	def __next__(self) -> tuple[TypeElement, ...]:
+		chunk: tuple[TypeElement, ...] = tuple(itertools.islice(self.iterator, self.chunksize))
+		if not chunk:
+			raise StopIteration
+		return chunk
+
+	def record(self, elapsed: float, size: int) -> None:
+		if self.target_latency is None or elapsed <= 0 or size == 0:
+			return
+		measured: float = elapsed / size
+		if self.seconds_per_element is None:
+			self.seconds_per_element = measured
+		else:
+			self.seconds_per_element = (self.seconds_per_element + measured) / 2
+		proposed: int = round(self.target_latency / self.seconds_per_element)
+		self.chunksize = max(1, self.chunksize // 2, min(proposed, 2 * self.chunksize))
+
+class _TreeReduction[TypeResult]:
+	"""Combine partial results pairwise, in order, while they stream in.
+
+	The partial results wait on a stack of ``(height, value)`` pairs that behaves like the digits of a binary counter: two
+	neighbors of equal height are combined as soon as both exist.  At most ``log2(n) + 1`` partial results are alive while
+	``n`` chunk results arrive, and ``combine`` always receives its arguments in sequence order.
+	"""
+
+	def __init__(self, combine: Callable[[TypeResult, TypeResult], TypeResult]) -> None:
+		self.combine: Callable[[TypeResult, TypeResult], TypeResult] = combine
+		self.stack: list[tuple[int, TypeResult]] = []
+
+	def push(self, value: TypeResult) -> None:
+		height: int = 0
+		while self.stack and self.stack[-1][0] == height:
+			value = self.combine(self.stack.pop()[1], value)
+			height += 1
+		self.stack.append((height, value))
+
+	def result(self) -> TypeResult:
+		_height, value = self.stack[-1]
+		for _height, left in reversed(self.stack[:-1]):
+			value = self.combine(left, value)
+		return value
+
+def _make_executor(executor: Literal['process', 'thread'], max_workers: int | None) -> Executor:
+	if executor == 'thread':
+		return ThreadPoolExecutor(max_workers)
+	if executor == 'process':
+		return ProcessPoolExecutor(max_workers)
+	message: str = f"`executor` must be 'thread', 'process', or an `Executor` instance, not {executor!r}."
+	raise ValueError(message)
+
+def _submit_bounded[TypeResult](
+	func: Callable[..., TypeResult],
+	arguments: Iterable[tuple[Any, ...]],
+	collect: Callable[[TypeResult], object],
+	executor: Executor | Literal['process', 'thread'],
+	max_workers: int | None,
+) -> None:
+	"""Call ``func(*args)`` in ``executor`` for every ``args`` of ``arguments`` and pass each result to ``collect`` in order.
+
+	At most twice as many calls as the pool has workers are pending at once, so ``arguments`` is consumed only as fast as the pool works
+	through it. A pool created from ``'thread'`` or ``'process'`` is shut down before returning.
+	"""
+	pool: Executor = executor if isinstance(executor, Executor) else _make_executor(executor, max_workers)
+	window: int = 2 * (max_workers or os.cpu_count() or 1)
+	pending: deque[Future[TypeResult]] = deque()
+	try:
+		for args in arguments:
+			pending.append(pool.submit(func, *args))
+			if len(pending) >= window:
+				collect(pending.popleft().result())
+		while pending:
+			collect(pending.popleft().result())
+	finally:
+		for future in pending:
+			future.cancel()
+		if pool is not executor:
+			pool.shutdown(wait=True)
+
+def _check_distribution(caller: Callable[..., Any], map: Callable[..., Any], executor: ExecutorSpecification, target_latency: float | None) -> None:
+	if executor is not None and map is not builtins.map:
+		message: str = f'Pass `map` or `executor` to `{caller.__name__}`, not both.'
+		raise ValueError(message)
+	if target_latency is not None and target_latency <= 0:
+		message = f'`target_latency` must be positive, not {target_latency!r}.'
+		raise ValueError(message)
+
+def _fold_chunks[TypeElement, TypeResult](
+	reduce_chunk: Callable[[tuple[TypeElement, ...]], TypeResult],
+	combine: Callable[[TypeResult, TypeResult], TypeResult],
+	chunks: _Chunker[TypeElement],
+	map: MapFunction[TypeElement, tuple[TypeResult, float, int]],
+	executor: ExecutorSpecification,
+	max_workers: int | None,
+) -> _TreeReduction[TypeResult]:
+	"""Reduce every chunk with ``reduce_chunk`` and stream the partial results into a ``_TreeReduction``."""
+	reduction: _TreeReduction[TypeResult] = _TreeReduction(combine)
+	timed_reduce: Callable[[tuple[TypeElement, ...]], tuple[TypeResult, float, int]] = functools.partial(_timed, reduce_chunk)
+
+	def collect(timed: tuple[TypeResult, float, int]) -> None:
+		result, elapsed, size = timed
+		chunks.record(elapsed, size)
+		reduction.push(result)
+
+	if executor is None:
+		for timed in map(timed_reduce, chunks):
+			collect(timed)
+	else:
+		_submit_bounded(timed_reduce, zip(chunks), collect, executor, max_workers)
+	return reduction
+
 @overload
 def fold[TypeElement](
 	binop: Callable[[TypeElement, TypeElement], TypeElement],
@@ -34,6 +174,9 @@ def fold[TypeElement](
 	map: MapFunction[TypeElement, TypeElement] = map,
 	chunksize: int = 128,
 	combine: Callable[[TypeElement, TypeElement], TypeElement] | None = None,
+	executor: ExecutorSpecification = None,
+	max_workers: int | None = None,
+	target_latency: float | None = None,
 ) -> TypeElement: ...
 @overload
 def fold[TypeResult, TypeElement](
@@ -43,6 +186,9 @@ def fold[TypeResult, TypeElement](
 	map: MapFunction[TypeElement, TypeResult] = map,
 	chunksize: int = 128,
 	combine: Callable[[TypeResult, TypeResult], TypeResult] | None = None,
+	executor: ExecutorSpecification = None,
+	max_workers: int | None = None,
+	target_latency: float | None = None,
 ) -> TypeResult: ...
 def fold[TypeResult, TypeElement](
 	binop: Callable[[TypeResult, TypeElement], TypeResult] | Callable[[TypeElement, TypeElement], TypeElement],
@@ -51,6 +197,9 @@ def fold[TypeResult, TypeElement](
 	map: MapFunction[TypeElement, TypeResult] | MapFunction[TypeElement, TypeElement] = map,
 	chunksize: int = 128,
 	combine: Callable[[TypeResult, TypeResult], TypeResult] | Callable[[TypeElement, TypeElement], TypeElement] | None = None,
+	executor: ExecutorSpecification = None,
+	max_workers: int | None = None,
+	target_latency: float | None = None,
 ) -> TypeResult | TypeElement:
 	"""
 	Reduce without guarantee of ordered reduction.
@@ -77,6 +226,13 @@ def fold[TypeResult, TypeElement](
 					If ``binop`` is of type (total, item) -> total
 					then ``combine`` is of type (total, total) -> total
 					Defaults to ``binop`` for common case of operators like add
+	``executor``  - ``'thread'``, ``'process'``, or an instance of
+					``concurrent.futures.Executor``. Replaces ``map``.
+	``max_workers`` - Number of workers when ``executor`` is a string.
+	``target_latency`` - Seconds that the reduction of one chunk should take.
+					If given, ``chunksize`` is only the size of the first
+					chunk, and the measured latency of finished chunks sets
+					the size of later chunks.
 
 	Fold chunks up the collection into blocks of size ``chunksize`` and then
 	feeds each of these to calls to ``reduce``. This work is distributed
@@ -86,9 +242,21 @@ def fold[TypeResult, TypeElement](
 	function. This function can be sequential or rely on multithreading,
 	multiprocessing, or even distributed solutions.
 
+	Instead of ``map``, ``fold`` can distribute the work to a thread pool or a
+	process pool. With ``executor='thread'`` or ``executor='process'``, ``fold``
+	creates the pool and shuts it down before returning; an ``Executor``
+	instance is used as given and is not shut down. ``fold`` keeps at most
+	``2 * max_workers`` chunks in flight, so ``seq`` is consumed lazily.
+
+	The results of the chunks are combined as they arrive by a tree reduction
+	in the calling thread: ``combine`` receives neighboring partial results in
+	sequence order, and only ``O(log(number of chunks))`` partial results are
+	kept in memory.
+
 	If ``map`` intends to serialize functions it should be prepared to accept
 	and serialize lambdas. Note that the standard ``pickle`` module fails
-	here.
+	here. The same is true of ``executor='process'``, which pickles ``binop``
+	and every chunk.
 
 	Example
 	-------
@@ -97,17 +265,99 @@ def fold[TypeResult, TypeElement](
 	>>> from operator import add
 	>>> fold(add, [1, 2, 3, 4], chunksize=2, map=map)
 	10
+	>>> fold(add, range(1000), 0, executor='thread', max_workers=2)
+	499500
 	"""
 	assert chunksize > 1
 	if combine is None:
 		combine = binop
-	chunks = partition_all(chunksize, seq)
+	_check_distribution(fold, map, executor, target_latency)
 	if default == no_default:
-		results = map(functools.partial(_reduce, binop), chunks)
+		reduce_chunk = functools.partial(_reduce, binop)
 	else:
-		results = map(functools.partial(_reduce, binop, initial=default), chunks)
-	results = list(results)
-	if len(results) == 1:
-		return results[0]
-	else:
-		return fold(combine, results, map=map, chunksize=chunksize)
+		reduce_chunk = functools.partial(_reduce, binop, initial=default)
+	chunks: _Chunker[TypeElement] = _Chunker(seq, chunksize, target_latency)
+	reduction = _fold_chunks(reduce_chunk, combine, chunks, map, executor, max_workers)
+	if not reduction.stack:
+		if default == no_default:
+			message: str = 'fold() of empty sequence with no default value'
+			raise TypeError(message)
+		return default
+	return reduction.result()
+
+def _merge_reductions[K: Hashable, T](combine: Callable[[T, T], T], left: dict[K, T], right: dict[K, T]) -> dict[K, T]:
+	for key, value in right.items():
+		if key in left:
+			left[key] = combine(left[key], value)
+		else:
+			left[key] = value
+	return left
+
+def foldby[T, K: Hashable](
+	key: Callable[[T], K] | Any,
+	binop: Callable[[T, T], T],
+	seq: Iterable[T],
+	init: T | Callable[[], T] | Literal['__no__default__'] = no_default,
+	combine: Callable[[T, T], T] | None = None,
+	map: MapFunction[T, dict[K, T]] = map,
+	chunksize: int = 128,
+	executor: ExecutorSpecification = None,
+	max_workers: int | None = None,
+	target_latency: float | None = None,
+) -> dict[K, T]:
+	"""Perform a simultaneous groupby and reduction on chunks in parallel.
+
+	``foldby`` is to ``reduceby`` what ``fold`` is to ``reduce``.  It cuts
+	``seq`` into chunks, computes ``reduceby(key, binop, chunk, init)`` for
+	every chunk with ``map`` or ``executor``, and merges the dictionaries of
+	the chunks. When two chunks have a value for the same key, the values are
+	merged with ``combine``.
+
+	inputs:
+
+	``key``       - a function or an index that computes the group of an item
+	``binop``     - binary operator that adds an item to the total of a group.
+					``binop`` and ``combine`` must be associative.
+	``seq``       - a sequence to be aggregated
+	``init``      - initial total of each group in each chunk, or a function
+					of no arguments that creates the initial total
+	``combine``   - Binary operator to combine two totals of the same group.
+					If ``binop`` is of type (total, item) -> total
+					then ``combine`` is of type (total, total) -> total
+					Defaults to ``binop`` for common case of operators like add
+	``map``, ``chunksize``, ``executor``, ``max_workers``, ``target_latency``
+					- as in ``fold``
+
+	The groups of the result are in order of their first appearance in
+	``seq``, and ``combine`` receives the totals of a group in sequence order,
+	which is the same as the order of ``reduceby``.
+
+	With ``executor='process'``, ``key``, ``binop``, ``init``, every chunk,
+	and the dictionaries of the chunks are pickled.
+
+	Example
+	-------
+
+	>>> from operator import add
+	>>> iseven = lambda x: x % 2 == 0
+	>>> foldby(iseven, add, range(10), chunksize=3)
+	{True: 20, False: 25}
+	>>> foldby(iseven, add, range(10), 0, chunksize=3, executor='thread')
+	{True: 20, False: 25}
+
+	See Also
+	--------
+	fold
+	humpy_toolz.itertoolz.reduceby
+	"""
+	assert chunksize > 1
+	if combine is None:
+		combine = binop
+	_check_distribution(foldby, map, executor, target_latency)
+	reduce_chunk: Callable[[tuple[T, ...]], dict[K, T]] = functools.partial(reduceby, key, binop, init=init)
+	chunks: _Chunker[T] = _Chunker(seq, chunksize, target_latency)
+	merge: Callable[[dict[K, T], dict[K, T]], dict[K, T]] = functools.partial(_merge_reductions, combine)
+	reduction = _fold_chunks(reduce_chunk, merge, chunks, map, executor, max_workers)
+	if not reduction.stack:
+		return {}
+	return reduction.result()
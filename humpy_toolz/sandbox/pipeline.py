@@ -0,0 +1,145 @@
+# ruff:file-ignore[undocumented-public-module]
+from __future__ import annotations
+
+from functools import partial
+from humpy_toolz.functoolz import curry
+from humpy_toolz.itertoolz import _get, getter, pluck, remove
+from humpy_toolz.utils import no_default
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from collections.abc import Callable, Iterable, Iterator
+	from typing import Any, Literal, Self
+
+type _Stage = tuple[Literal['map', 'filter', 'remove', 'pluck'], Any, Any]
+
+def _stage(func: Callable[..., Any]) -> _Stage | None:
+	"""Return the element-wise step that ``func`` applies to an iterable, or ``None`` if ``func`` is opaque.
+
+	``func`` is recognized if it is ``map``, ``filter``, ``remove``, or ``pluck`` with the iterable as the only missing
+	argument, as a ``curry`` of ``humpy_toolz.curried`` or as a ``functools.partial``.
+	"""
+	if not isinstance(func, (curry, partial)):
+		return None
+	function: Any = func.func
+	arguments: tuple[Any, ...] = func.args
+	keywords: dict[str, Any] = dict(func.keywords or {})
+	if function in (map, filter, remove) and len(arguments) == 1 and not keywords:
+		return (function.__name__, arguments[0], None)
+	if function is pluck and len(arguments) == 1 and set(keywords) <= {'default'}:
+		return ('pluck', arguments[0], keywords.get('default', no_default))
+	return None
+
+def _fuse(stages: list[_Stage]) -> Callable[[Iterable[Any]], Iterator[Any]]:
+	"""Compile consecutive element-wise steps into one generator function with a single loop."""
+	namespace: dict[str, Any] = {'_IndexError': IndexError, '_KeyError': KeyError}
+	lines: list[str] = ['def fused(seq):', '\tfor x in seq:']
+	for index, (kind, argument, default) in enumerate(stages):
+		name: str = f'_{index}'
+		namespace[name] = argument
+		if kind == 'map':
+			lines.append(f'\t\tx = {name}(x)')
+		elif kind == 'filter':
+			lines.append(f'\t\tif not {name}(x): continue' if argument is not None else '\t\tif not x: continue')
+		elif kind == 'remove':
+			lines.append(f'\t\tif {name}(x): continue' if argument is not None else '\t\tif x: continue')
+		elif isinstance(argument, list):
+			namespace[name] = getter(argument) if default == no_default else _list_getter(argument, default)
+			lines.append(f'\t\tx = {name}(x)')
+		elif default == no_default:
+			lines.append(f'\t\tx = x[{name}]')
+		else:
+			namespace[f'{name}_default'] = default
+			lines.extend([
+				'\t\ttry:',
+				f'\t\t\tx = x[{name}]',
+				'\t\texcept (_KeyError, _IndexError):',
+				f'\t\t\tx = {name}_default',
+			])
+	lines.append('\t\tyield x')
+	exec(compile('\n'.join(lines), '<humpy_toolz.sandbox.Pipeline>', 'exec'), namespace)
+	return namespace['fused']
+
+def _list_getter(ind: list[Any], default: Any) -> Callable[[Any], tuple[Any, ...]]:
+	return lambda record: tuple(_get(item, record, default) for item in ind)
+
+class Pipeline:
+	"""A lazy chain of functions of iterables that fuses its element-wise steps into one loop.
+
+	``Pipeline(*funcs)(seq)`` equals ``pipe(seq, *funcs)``. A run of consecutive ``map``, ``filter``, ``remove``, and
+	``pluck`` steps, given as curried functions of ``humpy_toolz.curried``, as ``functools.partial`` objects, or with the
+	builder methods, is compiled into one generator function. So each element passes through one Python frame instead of
+	one generator per step. Every other function is applied to the whole iterable, as ``pipe`` does.
+
+	Nothing runs until a ``Pipeline`` is called, and the fused loop is built at the first call. A ``Pipeline`` pickles if
+	its functions pickle.
+
+	>>> from humpy_toolz.curried import filter, map, partition_all
+	>>> inc = lambda x: x + 1
+	>>> iseven = lambda x: x % 2 == 0
+	>>> pipeline = Pipeline(map(inc), filter(iseven)).map(str).then(partition_all(2))
+	>>> list(pipeline(range(10)))
+	[('2', '4'), ('6', '8'), ('10',)]
+
+	See Also
+	--------
+		humpy_toolz.functoolz.pipe
+		humpy_toolz.functoolz.compose_left
+	"""
+
+	__slots__: tuple[str, ...] = ('_compiled', 'funcs')
+
+	def __init__(self, *funcs: Callable[[Any], Any]) -> None:
+		self.funcs: tuple[Callable[[Any], Any], ...] = funcs
+		self._compiled: list[Callable[[Any], Any]] | None = None
+
+	def then(self, *funcs: Callable[[Any], Any]) -> Self:
+		"""Return a new ``Pipeline`` that applies ``funcs`` after the functions of ``self``."""
+		return type(self)(*self.funcs, *funcs)
+
+	def map(self, func: Callable[[Any], Any]) -> Self:
+		return self.then(partial(map, func))
+
+	def filter(self, predicate: Callable[[Any], Any] | None) -> Self:
+		return self.then(partial(filter, predicate))
+
+	def remove(self, predicate: Callable[[Any], Any]) -> Self:
+		return self.then(partial(remove, predicate))
+
+	def pluck(self, ind: Any, default: Any = no_default) -> Self:
+		if default == no_default:
+			return self.then(partial(pluck, ind))
+		return self.then(partial(pluck, ind, default=default))
+
+	def _compile(self) -> list[Callable[[Any], Any]]:
+		compiled: list[Callable[[Any], Any]] = []
+		run: list[Callable[[Any], Any]] = []
+		stages: list[_Stage] = []
+		for func in (*self.funcs, None):
+			stage: _Stage | None = None if func is None else _stage(func)
+			if stage is not None:
+				run.append(func)
+				stages.append(stage)
+				continue
+			# One step alone runs faster as the builtin `map` or `filter` that it came from than as a generated loop.
+			if len(run) > 1:
+				compiled.append(_fuse(stages))
+			else:
+				compiled.extend(run)
+			run, stages = [], []
+			if func is not None:
+				compiled.append(func)
+		return compiled
+
+	def __call__(self, seq: Any) -> Any:
+		if self._compiled is None:
+			self._compiled = self._compile()
+		for func in self._compiled:
+			seq = func(seq)
+		return seq
+
+	def __reduce__(self) -> tuple[type[Self], tuple[Callable[[Any], Any], ...]]:
+		return (type(self), self.funcs)
+
+	def __repr__(self) -> str:
+		return f'{type(self).__name__}({", ".join(map(repr, self.funcs))})'
@@ -0,0 +1,198 @@
+# ruff:file-ignore[undocumented-public-module]
+from __future__ import annotations
+
+from collections import deque
+from humpy_toolz._vectorized import _VALUE_KINDS, _numpy, _ufunc_of
+from typing import TYPE_CHECKING
+import math
+import operator
+
+if TYPE_CHECKING:
+	from collections.abc import Callable, Iterable, Iterator
+	from types import ModuleType
+	from typing import Any
+
+def _check_window(n: int) -> None:
+	if n < 1:
+		message: str = f'The window `n` must be a positive integer, not {n!r}.'
+		raise ValueError(message)
+
+def _rolling_ufunc(numpy: ModuleType, ufunc: Any, n: int, seq: Any) -> Any:
+	"""Reduce every window of ``n`` elements of the 1-D array ``seq`` with the associative ``ufunc`` in ``O(len(seq))``.
+
+	This is the algorithm of van Herk and Gil-Werman: ``seq`` is cut into blocks of ``n`` elements, and every window is
+	the suffix of one block followed by the prefix of the next block, or exactly one block. Prefixes and suffixes come
+	from ``ufunc.accumulate``, so each output combines at most two partial reductions that each span less than ``n``
+	elements.
+	"""
+	size: int = len(seq)
+	if size < n:
+		return seq[:0]
+	blocks: Any = numpy.concatenate((seq, numpy.repeat(seq[-1:], -size % n))).reshape(-1, n)
+	prefix: Any = ufunc.accumulate(blocks, axis=1).ravel()
+	suffix: Any = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+	starts: Any = numpy.arange(size - n + 1)
+	return numpy.where(starts % n == 0, suffix[: size - n + 1], ufunc(suffix[: size - n + 1], prefix[n - 1 : size]))
+
+def _rolling_inverse[T](binop: Callable[[T, T], T], inverse: Callable[[T, T], T], n: int, seq: Iterable[T]) -> Iterator[T]:
+	window: deque[T] = deque()
+	total: Any = None
+	for item in seq:
+		total = binop(total, item) if window else item
+		window.append(item)
+		if len(window) == n:
+			yield total
+			total = inverse(total, window.popleft())
+
+def _rolling_two_stacks[T](binop: Callable[[T, T], T], n: int, seq: Iterable[T]) -> Iterator[T]:
+	# The window is `front` followed by `back`. `front[i]` is the reduction of the `i + 1` newest elements of the front, so
+	# `front[-1]` covers all of it; `back_total` is the reduction of `back`. Every element moves from `back` to `front`
+	# once, which makes the cost amortized O(1) per element for any associative `binop`.
+	front: list[T] = []
+	back: list[T] = []
+	back_total: Any = None
+	for item in seq:
+		back_total = binop(back_total, item) if back else item
+		back.append(item)
+		if len(front) + len(back) == n:
+			yield binop(front[-1], back_total) if front else back_total
+			if not front:
+				total: Any = None
+				for index, element in enumerate(reversed(back)):
+					total = binop(element, total) if index else element
+					front.append(total)
+				back.clear()
+			front.pop()
+
+def rolling_reduce[T](binop: Callable[[T, T], T], n: int, seq: Iterable[T], inverse: Callable[[T, T], T] | None = None) -> Iterator[T] | Any:
+	"""Reduce every window of ``n`` consecutive elements with the associative ``binop`` in ``O(1)`` per element.
+
+	``rolling_reduce(binop, n, seq)`` has the values of ``map(partial(reduce, binop), sliding_window(n, seq))``, but
+	does not reduce each window from scratch. With ``inverse``, a function that removes an element from a total, such
+	as ``operator.sub`` for ``operator.add``, every step adds the new element and removes the oldest. Without
+	``inverse``, the window is kept as two stacks of partial reductions, which works for any associative ``binop``,
+	such as ``max`` or string concatenation.
+
+	``seq`` is consumed lazily and the result is an iterator, unless ``seq`` is a 1-D NumPy array of numbers and ``binop``
+	is ``operator.add``, ``operator.mul``, ``max``, ``min``, or the matching ufunc; then the result is an array.
+
+	>>> from operator import add, sub
+	>>> list(rolling_reduce(add, 3, [1, 2, 3, 4, 5], inverse=sub))
+	[6, 9, 12]
+	>>> list(rolling_reduce(add, 2, 'abcd'))
+	['ab', 'bc', 'cd']
+
+	See Also
+	--------
+		sliding_window
+		rolling_sum
+	"""
+	_check_window(n)
+	numpy: ModuleType | None = _numpy(seq)
+	if numpy is not None and seq.dtype.kind in _VALUE_KINDS:
+		ufunc: Any = _ufunc_of(numpy, binop)
+		if ufunc is not None:
+			return _rolling_ufunc(numpy, ufunc, n, seq)
+	if inverse is not None:
+		return _rolling_inverse(binop, inverse, n, seq)
+	return _rolling_two_stacks(binop, n, seq)
+
+def _rolling_sum(n: int, seq: Iterable[Any]) -> Iterator[Any]:
+	window: deque[Any] = deque()
+	total: Any = 0
+	steps: int = 0
+	for item in seq:
+		total += item
+		window.append(item)
+		if len(window) == n:
+			yield total
+			total -= window.popleft()
+			steps += 1
+			if steps == n and isinstance(total, float):
+				# Adding and subtracting floats accumulates rounding error; summing the window exactly every `n` steps
+				# bounds the error at amortized O(1) cost.
+				total = math.fsum(window)
+				steps = 0
+
+def rolling_sum(n: int, seq: Iterable[Any]) -> Iterator[Any] | Any:
+	"""Sum every window of ``n`` consecutive elements in ``O(1)`` per element.
+
+	>>> list(rolling_sum(2, [1, 2, 3, 4]))
+	[3, 5, 7]
+
+	The sums of floats are corrected with ``math.fsum`` every ``n`` steps, so rounding errors do not accumulate over
+	long streams. If ``seq`` is a 1-D NumPy array of numbers, the result is an array.
+
+	See Also
+	--------
+		rolling_mean
+		rolling_reduce
+	"""
+	_check_window(n)
+	numpy: ModuleType | None = _numpy(seq)
+	if numpy is not None and seq.dtype.kind in _VALUE_KINDS:
+		return _rolling_ufunc(numpy, numpy.add, n, seq)
+	return _rolling_sum(n, seq)
+
+def rolling_mean(n: int, seq: Iterable[Any]) -> Iterator[float] | Any:
+	"""Average every window of ``n`` consecutive elements in ``O(1)`` per element.
+
+	This is the moving mean of the ``sliding_window`` docstring without recomputing each window:
+
+	>>> list(rolling_mean(2, [1, 2, 3, 4]))
+	[1.5, 2.5, 3.5]
+
+	See Also
+	--------
+		rolling_sum
+	"""
+	_check_window(n)
+	numpy: ModuleType | None = _numpy(seq)
+	if numpy is not None and seq.dtype.kind in _VALUE_KINDS:
+		return _rolling_ufunc(numpy, numpy.add, n, seq) / n
+	return (total / n for total in _rolling_sum(n, seq))
+
+def _rolling_extreme[T](n: int, seq: Iterable[T], better: Callable[[T, T], bool]) -> Iterator[T]:
+	# `candidates` holds the `(index, item)` pairs that can still become the extreme of a window: their items are in
+	# strictly decreasing order of preference, so the extreme of the current window is always the first one.
+	candidates: deque[tuple[int, T]] = deque()
+	for index, item in enumerate(seq):
+		while candidates and not better(candidates[-1][1], item):
+			candidates.pop()
+		candidates.append((index, item))
+		if candidates[0][0] <= index - n:
+			candidates.popleft()
+		if index >= n - 1:
+			yield candidates[0][1]
+
+def rolling_min(n: int, seq: Iterable[Any]) -> Iterator[Any] | Any:
+	"""Find the smallest element of every window of ``n`` consecutive elements in amortized ``O(1)`` per element.
+
+	>>> list(rolling_min(3, [4, 2, 5, 3, 6, 1]))
+	[2, 2, 3, 1]
+
+	See Also
+	--------
+		rolling_max
+	"""
+	_check_window(n)
+	numpy: ModuleType | None = _numpy(seq)
+	if numpy is not None and seq.dtype.kind in _VALUE_KINDS:
+		return _rolling_ufunc(numpy, numpy.minimum, n, seq)
+	return _rolling_extreme(n, seq, operator.lt)
+
+def rolling_max(n: int, seq: Iterable[Any]) -> Iterator[Any] | Any:
+	"""Find the largest element of every window of ``n`` consecutive elements in amortized ``O(1)`` per element.
+
+	>>> list(rolling_max(3, [4, 2, 5, 3, 6, 1]))
+	[5, 5, 6, 6]
+
+	See Also
+	--------
+		rolling_min
+	"""
+	_check_window(n)
+	numpy: ModuleType | None = _numpy(seq)
+	if numpy is not None and seq.dtype.kind in _VALUE_KINDS:
+		return _rolling_ufunc(numpy, numpy.maximum, n, seq)
+	return _rolling_extreme(n, seq, operator.gt)
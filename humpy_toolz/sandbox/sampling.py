@@ -0,0 +1,42 @@
+# ruff:file-ignore[undocumented-public-module]
+from __future__ import annotations
+
+from humpy_toolz._sampling import reservoir
+from typing import cast, TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from collections.abc import Iterable
+	from humpy_toolz._theTypes import Randomable
+	from typing import Any
+
+def reservoir_sample[T](
+	k: int, seq: Iterable[T], random_state: Randomable | int | float | str | bytes | bytearray | None = None,
+) -> list[T] | Any:
+	"""Choose ``k`` items of ``seq`` uniformly at random, without replacement, in one pass.
+
+	Unlike ``random_sample``, the size of the sample is fixed and the length of ``seq`` need not be known. The reservoir
+	is filled with Algorithm L, which draws how many items to skip before the next replacement, so a stream of ``N`` items
+	needs ``O(k * log(N / k))`` random numbers instead of ``N``. The chosen items are returned in the order of ``seq``;
+	if ``seq`` has at most ``k`` items, all of them are returned. The rows of a NumPy array are chosen with a NumPy
+	generator, and the result is an array.
+
+	``random_state`` is a seed or an object with a method ``random``, as in ``random_sample``, so an integer seed
+	reproduces the sample.
+
+	>>> reservoir_sample(3, range(100), random_state=2016)
+	[15, 53, 99]
+
+	See Also
+	--------
+		humpy_toolz.itertoolz.random_sample
+	"""
+	if k < 0:
+		message: str = f'`k` must be a non-negative number of items, not {k!r}.'
+		raise ValueError(message)
+	if hasattr(random_state, 'random'):
+		getNumber: Randomable = cast('Randomable', random_state)
+	else:
+		from random import Random
+
+		getNumber = Random(random_state)
+	return reservoir(k, seq, getNumber)
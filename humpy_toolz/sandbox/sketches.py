@@ -0,0 +1,527 @@
+# ruff:ignore[undocumented-public-module]
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from humpy_toolz._hashing import stable_hash
+from humpy_toolz.itertoolz import getter
+from typing import overload, TYPE_CHECKING
+import heapq
+import itertools
+import math
+import time
+
+if TYPE_CHECKING:
+	from collections.abc import Callable, Hashable, Iterable, Iterator
+	from typing import Any
+
+_MASK64: int = (1 << 64) - 1
+
+def _mix64(value: int) -> int:
+	"""Scramble the bits of a 64-bit integer with the finalizer of SplitMix64."""
+	value = (value + 0x9E3779B97F4A7C15) & _MASK64
+	value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+	value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+	return value ^ (value >> 31)
+
+def _hash_pair(item: Hashable) -> tuple[int, int]:
+	# `hash` of small integers is the identity, so mix it before deriving the two base hashes of double hashing.
+	first: int = _mix64(hash(item) & _MASK64)
+	return (first, _mix64(first) | 1)
+
+class LRUSet[T: Hashable]:
+	"""A set that remembers at most ``maxsize`` items and forgets the least recently seen item first.
+
+	Pass an ``LRUSet`` as ``seen`` to ``unique`` to drop repeats of the ``maxsize`` most recently seen keys of an endless
+	stream in constant memory. Testing membership of an item counts as seeing it.
+
+	>>> from humpy_toolz import unique
+	>>> list(unique([1, 2, 1, 3, 4, 1, 2], seen=LRUSet(2)))
+	[1, 2, 3, 4, 1, 2]
+	"""
+
+	def __init__(self, maxsize: int, items: Iterable[T] = ()) -> None:
+		if maxsize < 1:
+			message: str = f'`maxsize` must be a positive integer, not {maxsize!r}.'
+			raise ValueError(message)
+		self.maxsize: int = maxsize
+		self._items: OrderedDict[T, None] = OrderedDict()
+		for item in items:
+			self.add(item)
+
+	def __contains__(self, item: object) -> bool:
+		if item in self._items:
+			self._items.move_to_end(item)
+			return True
+		return False
+
+	def __len__(self) -> int:
+		return len(self._items)
+
+	def add(self, item: T) -> None:
+		self._items[item] = None
+		self._items.move_to_end(item)
+		if len(self._items) > self.maxsize:
+			self._items.popitem(last=False)
+
+	def discard(self, item: T) -> None:
+		self._items.pop(item, None)
+
+class WindowSet[T: Hashable]:
+	"""A set that forgets every item ``window`` seconds after it was added.
+
+	Pass a ``WindowSet`` as ``seen`` to ``unique`` to drop repeats that arrive within ``window`` seconds of the first
+	occurrence. With ``maxsize``, the oldest items are also forgotten early so that at most ``maxsize`` items are kept.
+	``clock`` is a function of no arguments that returns seconds, ``time.monotonic`` by default.
+
+	>>> from humpy_toolz import unique
+	>>> now = [0.0]
+	>>> seen = WindowSet(10.0, clock=lambda: now[0])
+	>>> list(unique(['a', 'b', 'a'], seen=seen))
+	['a', 'b']
+	>>> now[0] = 11.0
+	>>> list(unique(['a', 'b', 'a'], seen=seen))
+	['a', 'b']
+	"""
+
+	def __init__(self, window: float, maxsize: int | None = None, clock: Callable[[], float] = time.monotonic) -> None:
+		if window <= 0:
+			message: str = f'`window` must be a positive number of seconds, not {window!r}.'
+			raise ValueError(message)
+		if maxsize is not None and maxsize < 1:
+			message = f'`maxsize` must be a positive integer or None, not {maxsize!r}.'
+			raise ValueError(message)
+		self.window: float = window
+		self.maxsize: int | None = maxsize
+		self.clock: Callable[[], float] = clock
+		self._expiry: OrderedDict[T, float] = OrderedDict()
+
+	def _expire(self, now: float) -> None:
+		expiry: OrderedDict[T, float] = self._expiry
+		while expiry:
+			item, deadline = next(iter(expiry.items()))
+			if deadline > now:
+				break
+			del expiry[item]
+
+	def __contains__(self, item: object) -> bool:
+		self._expire(self.clock())
+		return item in self._expiry
+
+	def __len__(self) -> int:
+		self._expire(self.clock())
+		return len(self._expiry)
+
+	def add(self, item: T) -> None:
+		now: float = self.clock()
+		self._expire(now)
+		self._expiry[item] = now + self.window
+		self._expiry.move_to_end(item)
+		if self.maxsize is not None and len(self._expiry) > self.maxsize:
+			self._expiry.popitem(last=False)
+
+	def discard(self, item: T) -> None:
+		self._expiry.pop(item, None)
+
+class BloomFilter:
+	"""A probabilistic set of fixed size that never forgets an item but may report an item that was not added.
+
+	The filter is sized for ``capacity`` items at a false-positive rate of ``error_rate``; beyond ``capacity`` items the
+	rate of false positives grows. Pass a ``BloomFilter`` as ``seen`` to ``unique`` to drop repeats of an endless stream
+	in constant memory at the price of occasionally dropping an item that is not a repeat.
+
+	Items are hashed with ``hash``, so the bits of a filter are only meaningful within one process unless
+	``PYTHONHASHSEED`` is fixed.
+
+	>>> from humpy_toolz import unique
+	>>> list(unique([1, 2, 1, 3, 2], seen=BloomFilter(1000, error_rate=0.001)))
+	[1, 2, 3]
+	"""
+
+	def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+		if capacity < 1:
+			message: str = f'`capacity` must be a positive integer, not {capacity!r}.'
+			raise ValueError(message)
+		if not 0 < error_rate < 1:
+			message = f'`error_rate` must be between 0 and 1, not {error_rate!r}.'
+			raise ValueError(message)
+		self.capacity: int = capacity
+		self.error_rate: float = error_rate
+		self.num_bits: int = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+		self.num_hashes: int = max(1, round(self.num_bits / capacity * math.log(2)))
+		self.bits: bytearray = bytearray((self.num_bits + 7) // 8)
+		self.count: int = 0
+
+	def _positions(self, item: Hashable) -> Iterable[int]:
+		first, second = _hash_pair(item)
+		num_bits: int = self.num_bits
+		return ((first + index * second) % num_bits for index in range(self.num_hashes))
+
+	def __contains__(self, item: Hashable) -> bool:
+		bits: bytearray = self.bits
+		return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+	def add(self, item: Hashable) -> None:
+		bits: bytearray = self.bits
+		for position in self._positions(item):
+			bits[position >> 3] |= 1 << (position & 7)
+		self.count += 1
+
+	def merge(self, other: BloomFilter) -> BloomFilter:
+		"""Return a filter that contains the items of both filters, which must have the same parameters."""
+		if (self.num_bits, self.num_hashes) != (other.num_bits, other.num_hashes):
+			message: str = 'Only a BloomFilter with the same `capacity` and `error_rate` can be merged.'
+			raise ValueError(message)
+		merged: BloomFilter = BloomFilter(self.capacity, self.error_rate)
+		merged.bits = bytearray(left | right for left, right in zip(self.bits, other.bits, strict=True))
+		merged.count = self.count + other.count
+		return merged
+
+class CountMinSketch[T: Hashable]:
+	"""Estimate how often each item occurs in a stream in a fixed table of ``depth`` rows and ``width`` columns.
+
+	An estimate is never less than the true count. With ``width = ceil(e / epsilon)`` and ``depth = ceil(ln(1 / delta))``,
+	an estimate exceeds the true count by more than ``epsilon * total`` with probability at most ``delta``; the class
+	method ``from_error`` computes the shape from ``epsilon`` and ``delta``.
+
+	Items are hashed with a hash that is the same in every process, so sketches of the same shape from different shards
+	can be merged. Items must be None, bool, int, float, str, bytes, or tuples and frozensets of them.
+
+	>>> sketch = approx_frequencies(['cat', 'cat', 'ox', 'pig', 'pig', 'cat'], CountMinSketch(width=64, depth=4))
+	>>> sketch['cat'], sketch['ox'], sketch.total
+	(3, 1, 6)
+	"""
+
+	def __init__(self, width: int = 2048, depth: int = 5) -> None:
+		if width < 1 or depth < 1:
+			message: str = f'`width` and `depth` must be positive integers, not {width!r} and {depth!r}.'
+			raise ValueError(message)
+		self.width: int = width
+		self.depth: int = depth
+		self.table: list[list[int]] = [[0] * width for _ in range(depth)]
+		self.total: int = 0
+
+	@classmethod
+	def from_error(cls, epsilon: float, delta: float) -> CountMinSketch[T]:
+		"""Create a sketch whose estimates exceed the true count by at most ``epsilon * total`` with probability ``1 - delta``."""
+		if not (0 < epsilon < 1 and 0 < delta < 1):
+			message: str = f'`epsilon` and `delta` must be between 0 and 1, not {epsilon!r} and {delta!r}.'
+			raise ValueError(message)
+		return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)))
+
+	def _columns(self, item: T) -> Iterator[int]:
+		first, second = _stable_hash_pair(item)
+		width: int = self.width
+		return ((first + row * second) % width for row in range(self.depth))
+
+	def add(self, item: T, count: int = 1) -> None:
+		for row, column in zip(self.table, self._columns(item), strict=False):
+			row[column] += count
+		self.total += count
+
+	def update(self, seq: Iterable[T]) -> None:
+		for item in seq:
+			self.add(item)
+
+	def __getitem__(self, item: T) -> int:
+		return min(row[column] for row, column in zip(self.table, self._columns(item), strict=False))
+
+	def merge(self, other: CountMinSketch[T]) -> CountMinSketch[T]:
+		"""Return a sketch of the concatenation of both streams; both sketches must have the same shape."""
+		if (self.width, self.depth) != (other.width, other.depth):
+			message: str = 'Only a CountMinSketch with the same `width` and `depth` can be merged.'
+			raise ValueError(message)
+		merged: CountMinSketch[T] = CountMinSketch(self.width, self.depth)
+		merged.table = [list(map(int.__add__, left, right)) for left, right in zip(self.table, other.table, strict=True)]
+		merged.total = self.total + other.total
+		return merged
+
+class SpaceSaving[T: Hashable](Mapping[T, int]):
+	"""Count the most frequent items of a stream with at most ``capacity`` counters.
+
+	``SpaceSaving`` is a read-only mapping from the monitored items to their estimated counts. When a new item arrives
+	and every counter is taken, the item with the smallest count is replaced, and the new item inherits that count as
+	its error. An estimate is never less than the true count, ``errors[item]`` bounds the overestimate, and every item
+	whose true count exceeds ``total / capacity`` is monitored.
+
+	>>> sketch = approx_frequencies('abracadabra', SpaceSaving(5))
+	>>> sketch.most_common(2)
+	[('a', 5), ('b', 2)]
+	"""
+
+	def __init__(self, capacity: int = 1024) -> None:
+		if capacity < 1:
+			message: str = f'`capacity` must be a positive integer, not {capacity!r}.'
+			raise ValueError(message)
+		self.capacity: int = capacity
+		self.counts: dict[T, int] = {}
+		self.errors: dict[T, int] = {}
+		self.total: int = 0
+		# Entries of `_heap` are `(count, order, item)`; an entry is stale once `counts[item]` differs from its count.
+		self._heap: list[tuple[int, int, T]] = []
+		self._order: Iterator[int] = itertools.count()
+
+	def _compact(self) -> None:
+		self._heap = [(count, next(self._order), item) for item, count in self.counts.items()]
+		heapq.heapify(self._heap)
+
+	def _pop_minimum(self) -> tuple[T, int]:
+		counts: dict[T, int] = self.counts
+		while True:
+			count, _order, item = heapq.heappop(self._heap)
+			if counts.get(item) == count:
+				del counts[item]
+				del self.errors[item]
+				return (item, count)
+
+	def add(self, item: T, count: int = 1) -> None:
+		counts: dict[T, int] = self.counts
+		self.total += count
+		if item in counts:
+			counts[item] += count
+		elif len(counts) < self.capacity:
+			counts[item] = count
+			self.errors[item] = 0
+		else:
+			_evicted, minimum = self._pop_minimum()
+			counts[item] = minimum + count
+			self.errors[item] = minimum
+		heapq.heappush(self._heap, (counts[item], next(self._order), item))
+		if len(self._heap) > 4 * self.capacity:
+			self._compact()
+
+	def update(self, seq: Iterable[T]) -> None:
+		for item in seq:
+			self.add(item)
+
+	def __getitem__(self, item: T) -> int:
+		return self.counts[item]
+
+	def __iter__(self) -> Iterator[T]:
+		return iter(self.counts)
+
+	def __len__(self) -> int:
+		return len(self.counts)
+
+	def most_common(self, n: int | None = None) -> list[tuple[T, int]]:
+		"""List the ``n`` items with the largest estimated counts, largest first."""
+		if n is None:
+			return sorted(self.counts.items(), key=_second, reverse=True)
+		return heapq.nlargest(n, self.counts.items(), key=_second)
+
+	def _floor(self) -> int:
+		"""Return the largest count that an item not monitored by ``self`` can have."""
+		if len(self.counts) < self.capacity:
+			return 0
+		return min(self.counts.values())
+
+	def merge(self, other: SpaceSaving[T]) -> SpaceSaving[T]:
+		"""Return a summary of the concatenation of both streams with the larger of the two capacities.
+
+		Counts and errors of the same item are added. An item that a full summary does not monitor may still have
+		occurred up to that summary's smallest count times, so that count is added to both its count and its error. Only
+		the ``capacity`` items with the largest counts are kept.
+		"""
+		merged: SpaceSaving[T] = SpaceSaving(max(self.capacity, other.capacity))
+		floor_self: int = self._floor()
+		floor_other: int = other._floor()
+		counts: dict[T, int] = {}
+		errors: dict[T, int] = {}
+		for item in itertools.chain(self.counts, other.counts.keys() - self.counts.keys()):
+			counts[item] = self.counts.get(item, floor_self) + other.counts.get(item, floor_other)
+			errors[item] = self.errors.get(item, floor_self) + other.errors.get(item, floor_other)
+		for item, count in heapq.nlargest(merged.capacity, counts.items(), key=_second):
+			merged.counts[item] = count
+			merged.errors[item] = errors[item]
+		merged.total = self.total + other.total
+		merged._compact()
+		return merged
+
+class TopK[T]:
+	"""Keep the ``k`` largest items of a stream that is fed incrementally.
+
+	``TopK`` is ``topk`` for streams: ``add`` and ``update`` feed it items in ``O(log k)`` time each, ``result`` can be
+	called at any time, and the top-k summaries of different shards or time slices can be combined with ``merge``. The
+	result is the same as ``topk(k, everything_added, key)``, including the order of items with equal keys.
+
+	>>> top = TopK(2)
+	>>> top.update([1, 100, 10])
+	>>> top.result()
+	(100, 10)
+	>>> top.add(1000)
+	>>> top.result()
+	(1000, 100)
+
+	With ``frequent=True``, ``TopK`` estimates the ``k`` most frequent items, or keys of items, instead: the items are
+	counted by a ``SpaceSaving`` sketch with ``capacity`` counters (by default ``10 * k``), and ``result`` returns
+	``(item, estimated count)`` pairs, most frequent first.
+
+	>>> top = TopK(1, frequent=True)
+	>>> top.update('abracadabra')
+	>>> top.result()
+	(('a', 5),)
+	"""
+
+	def __init__(self, k: int, key: Callable[[T], Any] | Any = None, frequent: bool = False, capacity: int | None = None) -> None:
+		if k < 1:
+			message: str = f'`k` must be a positive integer, not {k!r}.'
+			raise ValueError(message)
+		if key is not None and not callable(key):
+			key = getter(key)
+		self.k: int = k
+		self.key: Callable[[T], Any] | None = key
+		self.sketch: SpaceSaving[Any] | None = SpaceSaving(capacity or 10 * k) if frequent else None
+		# Entries of `_heap` are `(key, -order, item)`, so the smallest entry is the item that leaves first: the one with the
+		# smallest key and, among equal keys, the one added last, as in `heapq.nlargest`.
+		self._heap: list[tuple[Any, int, T]] = []
+		self._count: int = 0
+
+	def add(self, item: T) -> None:
+		if self.sketch is not None:
+			self.sketch.add(item if self.key is None else self.key(item))
+			return
+		entry: tuple[Any, int, T] = (item if self.key is None else self.key(item), -self._count, item)
+		self._count += 1
+		if len(self._heap) < self.k:
+			heapq.heappush(self._heap, entry)
+		elif self._heap[0] < entry:
+			heapq.heapreplace(self._heap, entry)
+
+	def update(self, seq: Iterable[T]) -> None:
+		for item in seq:
+			self.add(item)
+
+	def result(self) -> tuple[Any, ...]:
+		"""Return the ``k`` largest items, largest first, or the ``k`` most frequent ``(item, count)`` pairs."""
+		if self.sketch is not None:
+			return tuple(self.sketch.most_common(self.k))
+		return tuple(item for _key, _order, item in sorted(self._heap, reverse=True))
+
+	def merge(self, other: TopK[T]) -> TopK[T]:
+		"""Return the top-k summary of the stream of ``self`` followed by the stream of ``other``.
+
+		Both summaries must have the same ``k`` and mode; the key function of ``self`` is kept.
+		"""
+		if self.k != other.k or (self.sketch is None) != (other.sketch is None):
+			message: str = 'Only a TopK with the same `k` and the same `frequent` mode can be merged.'
+			raise ValueError(message)
+		merged: TopK[T] = TopK(self.k, self.key)
+		if self.sketch is not None and other.sketch is not None:
+			merged.sketch = self.sketch.merge(other.sketch)
+			return merged
+		shifted: Iterator[tuple[Any, int, T]] = ((key, order - self._count, item) for key, order, item in other._heap)
+		merged._heap = heapq.nlargest(self.k, itertools.chain(self._heap, shifted))
+		heapq.heapify(merged._heap)
+		merged._count = self._count + other._count
+		return merged
+
+class HyperLogLog[T: Hashable]:
+	"""Estimate the number of distinct items of a stream in ``2 ** precision`` bytes.
+
+	The relative standard error of the estimate is about ``1.04 / sqrt(2 ** precision)``, e.g. 0.8% for the default
+	precision 14. ``len`` returns the rounded estimate. Items are hashed with a hash that is the same in every process, so
+	sketches of the same precision from different shards can be merged. Items must be None, bool, int, float, str,
+	bytes, or tuples and frozensets of them.
+
+	>>> sketch = HyperLogLog()
+	>>> sketch.update(['cat', 'cat', 'ox', 'pig', 'pig', 'cat'])
+	>>> len(sketch)
+	3
+	"""
+
+	def __init__(self, precision: int = 14) -> None:
+		if not 4 <= precision <= 18:
+			message: str = f'`precision` must be an integer from 4 to 18, not {precision!r}.'
+			raise ValueError(message)
+		self.precision: int = precision
+		self.registers: bytearray = bytearray(1 << precision)
+
+	def add(self, item: T) -> None:
+		hashed: int = stable_hash(item)
+		width: int = 64 - self.precision
+		index: int = hashed >> width
+		rank: int = width - (hashed & ((1 << width) - 1)).bit_length() + 1
+		if rank > self.registers[index]:
+			self.registers[index] = rank
+
+	def update(self, seq: Iterable[T]) -> None:
+		for item in seq:
+			self.add(item)
+
+	def cardinality(self) -> float:
+		"""Return the estimated number of distinct items."""
+		size: int = len(self.registers)
+		alpha: float = 0.7213 / (1 + 1.079 / size)
+		estimate: float = alpha * size * size / math.fsum(2.0 ** -register for register in self.registers)
+		zeros: int = self.registers.count(0)
+		if estimate <= 2.5 * size and zeros:
+			return size * math.log(size / zeros)
+		return estimate
+
+	def __len__(self) -> int:
+		return round(self.cardinality())
+
+	def merge(self, other: HyperLogLog[T]) -> HyperLogLog[T]:
+		"""Return a sketch of the union of both streams; both sketches must have the same precision."""
+		if self.precision != other.precision:
+			message: str = 'Only a HyperLogLog with the same `precision` can be merged.'
+			raise ValueError(message)
+		merged: HyperLogLog[T] = HyperLogLog(self.precision)
+		merged.registers = bytearray(map(max, self.registers, other.registers))
+		return merged
+
+def _second[T](pair: tuple[Any, T]) -> T:
+	return pair[1]
+
+def _stable_hash_pair(item: Hashable) -> tuple[int, int]:
+	first: int = stable_hash(item)
+	return (first, _mix64(first) | 1)
+
+type Sketch[T: Hashable] = CountMinSketch[T] | HyperLogLog[T] | SpaceSaving[T]
+
+@overload
+def approx_frequencies[T: Hashable](seq: Iterable[T], sketch: None = None) -> SpaceSaving[T]: ...
+@overload
+def approx_frequencies[T: Hashable, S: Sketch[Any]](seq: Iterable[T], sketch: S) -> S: ...
+def approx_frequencies[T: Hashable](seq: Iterable[T], sketch: Sketch[T] | None = None) -> Sketch[T]:
+	"""Count the occurrences of the values of ``seq`` in a sketch of fixed size.
+
+	This is ``frequencies`` for streams with too many distinct values for a ``dict``. ``sketch`` is a
+	``CountMinSketch``, a ``SpaceSaving``, or a ``HyperLogLog``, and defaults to ``SpaceSaving(1024)``. The sketch is
+	updated in place and returned, and sketches of different shards can be combined with their ``merge`` method.
+
+	>>> approx_frequencies(['cat', 'cat', 'ox', 'pig', 'pig', 'cat']).most_common(1)
+	[('cat', 3)]
+
+	See Also
+	--------
+		humpy_toolz.itertoolz.frequencies
+		approx_countby
+	"""
+	if sketch is None:
+		sketch = SpaceSaving()
+	sketch.update(seq)
+	return sketch
+
+@overload
+def approx_countby[T, K: Hashable](key: Callable[[T], K] | Any, seq: Iterable[T], sketch: None = None) -> SpaceSaving[K]: ...
+@overload
+def approx_countby[T, S: Sketch[Any]](key: Callable[[T], Hashable] | Any, seq: Iterable[T], sketch: S) -> S: ...
+def approx_countby[T, K: Hashable](key: Callable[[T], K] | Any, seq: Iterable[T], sketch: Sketch[K] | None = None) -> Sketch[K]:
+	"""Count elements of a collection by a key function in a sketch of fixed size.
+
+	This is ``countby`` for streams with too many distinct keys for a ``dict``; see ``approx_frequencies``.
+
+	>>> approx_countby(len, ['cat', 'mouse', 'dog'])[3]
+	2
+	>>> len(approx_countby('user', [{'user': 'ann'}, {'user': 'bo'}, {'user': 'ann'}], HyperLogLog()))
+	2
+
+	See Also
+	--------
+		humpy_toolz.recipes.countby
+		approx_frequencies
+	"""
+	if not callable(key):
+		key = getter(key)
+	return approx_frequencies(map(key, seq), sketch)
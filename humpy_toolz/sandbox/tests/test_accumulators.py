@@ -0,0 +1,63 @@
+from humpy_toolz import groupby, reduceby
+from humpy_toolz.sandbox import GroupBy, ReduceBy
+from humpy_toolz.utils import no_default
+from operator import add, itemgetter
+import pickle
+
+def iseven(x):
+	return x % 2 == 0
+
+def set_add(s, item):
+	s.add(item)
+	return s
+
+def test_reduceby():
+	data = [1, 2, 3, 4, 5, 6, 7]
+	for init in (0, no_default):
+		totals = ReduceBy(iseven, add, init)
+		totals.update(data[:3])
+		totals.update(data[3:])
+		assert totals.result() == reduceby(iseven, add, data, init)
+	totals = ReduceBy(iseven, set_add, set, combine=set.union)
+	totals.update(data)
+	assert totals.result() == reduceby(iseven, set_add, data, set)
+	assert len(totals) == 2
+	snapshot = totals.result()
+	totals.update([8, 9])
+	assert snapshot.keys() == {False, True}
+	assert snapshot[True] == {2, 4, 6, 8}
+
+def test_reduceby_merge_and_pickle():
+	records = [{'state': state, 'cost': cost} for state, cost in [('CA', 1), ('IL', 2), ('CA', 3), ('NY', 4), ('IL', 5)]]
+	def cost_add(total, record):
+		return total + record['cost']
+	first = ReduceBy('state', cost_add, 0, combine=add)
+	first.update(records[:2])
+	second = ReduceBy('state', cost_add, 0, combine=add)
+	second.update(records[2:])
+	merged = first.merge(second)
+	assert merged.result() == reduceby('state', cost_add, records, 0)
+	assert list(merged.result()) == ['CA', 'IL', 'NY']
+	assert first.result() == {'CA': 1, 'IL': 2}
+	restored = pickle.loads(pickle.dumps(ReduceBy(itemgetter(0), add)))
+	restored.update([(1, 1), (1, 2)])
+	assert restored.result() == {1: (1, 1, 1, 2)}
+
+def test_groupby():
+	words = ['Alice', 'Bob', 'Charlie', 'Dan', 'Edith', 'Frank']
+	groups = GroupBy(len)
+	groups.update(words[:2])
+	checkpoint = pickle.loads(pickle.dumps(groups))
+	checkpoint.update(words[2:])
+	assert checkpoint.result() == groupby(len, words)
+	assert groups.result() == groupby(len, words[:2])
+	later = GroupBy(len)
+	later.update(words[2:])
+	assert groups.merge(later).result() == groupby(len, words)
+	assert len(groups) == 2
+	result = groups.result()
+	result[5].append('Zed')
+	assert groups.result() == {5: ['Alice'], 3: ['Bob']}
+	pairs = GroupBy(0)
+	pairs.update([(1, 'a'), (2, 'b'), (1, 'c')])
+	assert pairs.result() == {1: [(1, 'a'), (1, 'c')], 2: [(2, 'b')]}
@@ -0,0 +1,49 @@
+from array import array
+from humpy_toolz import pluck
+from humpy_toolz.sandbox import column_getter, get_columns, pluck_columns
+import pytest
+
+def test_column_getter():
+	records = [(1, 'a', 2.5), (2, 'b', 3.5), (3, 'c', 4.5)]
+	assert column_getter(0)(records) == [1, 2, 3]
+	assert column_getter([2, 0])(records) == ([2.5, 3.5, 4.5], [1, 2, 3])
+	assert column_getter([0, 2], format='array', typecode=['q', 'd'])(records) == (array('q', [1, 2, 3]), array('d', [2.5, 3.5, 4.5]))
+	assert column_getter([0], format='array', typecode='q')(records) == (array('q', [1, 2, 3]),)
+	assert column_getter([])(records) == ()
+	assert column_getter('x', default=0)([{'x': 1}, {}]) == [1, 0]
+	with pytest.raises(KeyError):
+		column_getter('x')([{'x': 1}, {}])
+	with pytest.raises(ValueError, match='typecode'):
+		column_getter(0, format='array')
+	with pytest.raises(ValueError, match='typecodes'):
+		column_getter([0, 1], format='array', typecode=['q'])
+	with pytest.raises(ValueError, match='format'):
+		column_getter(0, format='tuple')
+
+def test_pluck_columns():
+	data = [{'id': i, 'name': str(i)} for i in range(10)]
+	chunks = list(pluck_columns(['id', 'name'], data, chunksize=4))
+	assert [len(ids) for ids, _ in chunks] == [4, 4, 2]
+	assert [tuple(row) for ids, names in chunks for row in zip(ids, names)] == list(pluck(['id', 'name'], data))
+	assert list(pluck_columns('id', iter(data), chunksize=8)) == [list(range(8)), [8, 9]]
+	assert list(pluck_columns(0, [])) == []
+	assert list(pluck_columns(1, [(0,), (0, 1)], default=None)) == [[None, 1]]
+	with pytest.raises(ValueError, match='chunksize'):
+		list(pluck_columns(0, [(1,)], chunksize=0))
+
+def test_get_columns():
+	records = [(i, i * 0.5) for i in range(7)]
+	assert get_columns([0, 1], records, chunksize=3) == (list(range(7)), [i * 0.5 for i in range(7)])
+	assert get_columns(0, records, chunksize=3, format='array', typecode='q') == array('q', range(7))
+	assert get_columns(0, []) == []
+	assert get_columns([0, 1], []) == ([], [])
+
+def test_columns_numpy():
+	numpy = pytest.importorskip('numpy')
+	records = [(i, float(i)) for i in range(5)]
+	ids, values = get_columns([0, 1], records, chunksize=2, format='numpy', typecode=['i8', None])
+	assert ids.dtype == numpy.int64
+	assert values.dtype == numpy.float64
+	assert ids.tolist() == list(range(5))
+	assert values.tolist() == [float(i) for i in range(5)]
+	assert column_getter(0, format='numpy', typecode='i4')([]).dtype == numpy.int32
@@ -0,0 +1,77 @@
+from concurrent.futures import ProcessPoolExecutor
+from humpy_toolz import memoize
+from humpy_toolz.sandbox import DiskCache
+import json
+import pickle
+import pytest
+import threading
+
+def fill(cache, start):
+	for index in range(start, start + 50):
+		cache[index] = index * index
+	return len(cache)
+
+def test_diskcache_mapping(tmp_path):
+	cache = DiskCache(tmp_path / 'cache.sqlite')
+	cache[('a', 1)] = [1, 2]
+	cache[frozenset({'x', 'y'})] = 'set'
+	cache[None] = 0
+	assert cache[('a', 1.0)] == [1, 2]
+	assert cache[frozenset({'y', 'x'})] == 'set'
+	assert ('a', 1) in cache
+	assert ('a', 2) not in cache
+	assert len(cache) == 3
+	assert set(cache) == {('a', 1), frozenset({'x', 'y'}), None}
+	cache[None] = 1
+	assert cache[None] == 1
+	del cache[None]
+	with pytest.raises(KeyError):
+		cache[None]
+	with pytest.raises(KeyError):
+		del cache[None]
+	with pytest.raises(TypeError):
+		cache[object()] = 1
+	other = DiskCache(tmp_path / 'cache.sqlite', namespace='other')
+	assert len(other) == 0
+	other.clear()
+	assert len(cache) == 2
+	cache.clear()
+	assert len(cache) == 0
+
+def test_diskcache_persists(tmp_path):
+	path = str(tmp_path / 'cache.sqlite')
+	calls = []
+
+	def slow(x, y=0):
+		calls.append(x)
+		return x + y
+
+	first = memoize(slow, cache=DiskCache(path))
+	assert first(1, y=2) == 3
+	DiskCache(path).close()
+	second = memoize(slow, cache=DiskCache(path))
+	assert second(1, y=2) == 3
+	assert calls == [1]
+	with pytest.raises(TypeError):
+		second([1], y=0)
+
+def test_diskcache_serializer(tmp_path):
+	cache = DiskCache(tmp_path / 'cache.sqlite', serializer=json)
+	cache['key'] = {'a': [1, 2]}
+	assert cache['key'] == {'a': [1, 2]}
+	copy = pickle.loads(pickle.dumps(cache))
+	assert copy['key'] == {'a': [1, 2]}
+	assert copy.serializer is json
+
+def test_diskcache_threads_and_processes(tmp_path):
+	cache = DiskCache(tmp_path / 'cache.sqlite')
+	threads = [threading.Thread(target=fill, args=(cache, start)) for start in (0, 25, 50)]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	assert len(cache) == 100
+	with ProcessPoolExecutor(2) as executor:
+		assert all(executor.map(fill, [cache] * 4, [100, 125, 150, 175]))
+	assert len(cache) == 225
+	assert all(cache[index] == index * index for index in range(225))
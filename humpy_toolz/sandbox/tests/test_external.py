@@ -0,0 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
+from humpy_toolz.sandbox import external_sorted
+from random import Random
+import marshal
+import os
+import pytest
+
+def test_external_sorted():
+	data = [Random(1).randrange(1000) for _ in range(2000)]
+	assert list(external_sorted(data, run_size=100)) == sorted(data)
+	assert list(external_sorted(iter(data), run_size=3000)) == sorted(data)
+	assert list(external_sorted(data, run_size=7, fan_in=3)) == sorted(data)
+	assert list(external_sorted([])) == []
+	assert list(external_sorted([2, 1], run_size=2)) == [1, 2]
+
+def test_external_sorted_stable():
+	data = [(Random(2).randrange(10), index) for index in range(500)]
+	def key(item):
+		return item[0]
+	assert list(external_sorted(data, key=key, run_size=50)) == sorted(data, key=key)
+	assert list(external_sorted(data, key=key, run_size=50, fan_in=2, prefetch=16)) == sorted(data, key=key)
+
+def test_external_sorted_options(tmp_path):
+	data = list(range(300, 0, -1))
+	assert list(external_sorted(data, run_size=40, serializer=marshal, tmpdir=str(tmp_path))) == sorted(data)
+	assert list(external_sorted(data, run_size=40, executor='thread', max_workers=2)) == sorted(data)
+	with ThreadPoolExecutor(2) as pool:
+		assert list(external_sorted(data, run_size=40, executor=pool)) == sorted(data)
+	assert list(external_sorted(data, run_size=40, executor='process', max_workers=2)) == sorted(data)
+	assert os.listdir(tmp_path) == []
+
+def test_external_sorted_cleanup(tmp_path):
+	merged = external_sorted(range(100, 0, -1), run_size=10, tmpdir=str(tmp_path))
+	assert next(merged) == 1
+	assert len(os.listdir(tmp_path)) == 1
+	merged.close()
+	assert os.listdir(tmp_path) == []
+
+def test_external_sorted_errors():
+	with pytest.raises(ValueError, match='run_size'):
+		external_sorted([1], run_size=0)
+	with pytest.raises(ValueError, match='fan_in'):
+		external_sorted([1], fan_in=1)
+	with pytest.raises(ValueError, match='prefetch'):
+		external_sorted([1], prefetch=0)
+	with pytest.raises(ValueError, match='executor'):
+		list(external_sorted(range(10), run_size=2, executor='fiber'))
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from humpy_toolz import reduce
-from humpy_toolz.sandbox import fold
+from concurrent.futures import ThreadPoolExecutor
+from humpy_toolz import reduce, reduceby
+from humpy_toolz.sandbox import fold, foldby
+from humpy_toolz.sandbox.parallel import _Chunker
 from multiprocessing import Pool
 from operator import add
 from pickle import dumps, loads
+import pytest
 
 no_default2 = loads(dumps('__no__default__'))
 
+def iseven(x):
+	return x % 2 == 0
+
 def test_fold():
 	assert fold(add, range(10), 0) == reduce(add, range(10), 0)
 	with Pool() as pool:
@@ -23,3 +29,67 @@ def test_fold():
 	assert fold(setadd, [1, 2, 3], set()) == {1, 2, 3}
 	assert fold(setadd, [1, 2, 3], set(), chunksize=2, combine=set.union) == {1, 2, 3}
 	assert fold(add, range(10), default=no_default2) == fold(add, range(10))
+
+def test_fold_executor():
+	assert fold(add, range(1000), 0, executor='thread', max_workers=3) == sum(range(1000))
+	assert fold(add, range(1000), 0, chunksize=7, executor='process', max_workers=2) == sum(range(1000))
+	with ThreadPoolExecutor(2) as executor:
+		assert fold(add, range(100), 0, chunksize=3, executor=executor) == sum(range(100))
+		assert fold(add, range(100), 0, executor=executor) == sum(range(100))
+	with pytest.raises(ValueError):
+		fold(add, range(10), executor='cluster')
+	with pytest.raises(ValueError):
+		fold(add, range(10), map=lambda func, seq: list(map(func, seq)), executor='thread')
+
+def test_fold_keeps_order():
+	letters = [chr(ord('a') + index % 26) for index in range(500)]
+	expected = ''.join(letters)
+	assert fold(add, letters, chunksize=3) == expected
+	assert fold(add, letters, '', chunksize=4, executor='thread', max_workers=4) == expected
+	assert fold(add, letters, '', chunksize=2, target_latency=1e-9) == expected
+
+def test_fold_empty():
+	assert fold(add, [], 0) == 0
+	assert fold(add, [], 0, executor='thread') == 0
+	with pytest.raises(TypeError):
+		fold(add, [])
+
+def test_fold_target_latency():
+	assert fold(add, range(10000), 0, chunksize=2, target_latency=0.001) == sum(range(10000))
+	with pytest.raises(ValueError):
+		fold(add, range(10), target_latency=0)
+
+	chunks = _Chunker(range(100), 8, target_latency=1.0)
+	assert len(next(chunks)) == 8
+	chunks.record(0.1, 8)
+	assert chunks.chunksize == 16
+	chunks.record(100.0, 16)
+	assert chunks.chunksize == 8
+	assert len(next(chunks)) == 8
+	assert len(_Chunker(range(10), 4).__next__()) == 4
+
+def test_foldby():
+	projects = [{'state': state, 'cost': cost} for state, cost in zip('ABCDE' * 40, range(200), strict=True)]
+
+	def addcost(total, project):
+		return total + project['cost']
+
+	expected = reduceby('state', addcost, projects, 0)
+	assert foldby('state', addcost, projects, 0, combine=add, chunksize=7) == expected
+	assert foldby('state', addcost, projects, 0, combine=add, chunksize=7, executor='thread') == expected
+	assert list(foldby('state', addcost, projects, 0, combine=add, chunksize=7, executor='thread')) == list(expected)
+	assert foldby(iseven, add, range(100), executor='process', max_workers=2, chunksize=9) == reduceby(iseven, add, range(100))
+	assert foldby(iseven, add, range(100), 0, target_latency=1e-6, chunksize=2) == reduceby(iseven, add, range(100), 0)
+	assert foldby(iseven, add, []) == {}
+
+def test_foldby_init_and_order():
+	words = ['ab', 'cd', 'e', 'fgh', 'ij', 'k', 'lm', 'n']
+	expected = reduceby(len, add, words, '')
+	assert foldby(len, add, words, '', chunksize=2) == expected
+	assert foldby(len, add, words, str, chunksize=3, executor='thread', max_workers=2) == expected
+
+	def append(total, item):
+		total.append(item)
+		return total
+
+	assert foldby(iseven, append, range(20), list, combine=list.__add__, chunksize=3) == reduceby(iseven, append, range(20), list)
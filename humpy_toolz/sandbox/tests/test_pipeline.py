@@ -0,0 +1,68 @@
+from functools import partial
+from humpy_toolz import curried, pipe
+from humpy_toolz.sandbox import Pipeline
+from itertools import product
+import pickle
+
+def inc(x):
+	return x + 1
+
+def iseven(x):
+	return x % 2 == 0
+
+def stages():
+	return [
+		curried.map(inc),
+		curried.filter(iseven),
+		curried.remove(lambda x: x % 3 == 0),
+		curried.filter(None),
+		partial(map, lambda x: (x, -x, x * 2)),
+		curried.pluck(2),
+		curried.map(lambda x: {'key': x} if x % 4 else {}),
+		curried.pluck('key', default=-1),
+		curried.map(lambda x: [x, x + 1]),
+		curried.pluck([1, 0]),
+		curried.pluck([2, 0], default=None),
+		curried.take(50),
+		sorted,
+	]
+
+def test_pipeline_equals_pipe():
+	data = list(range(-20, 100))
+	for first, second, third in product(stages(), repeat=3):
+		funcs = (first, second, third)
+		try:
+			expected = list(pipe(data, *funcs))
+		except (KeyError, IndexError, TypeError):
+			continue
+		assert list(Pipeline(*funcs)(data)) == expected
+
+def test_pipeline_fuses_runs():
+	pipeline = Pipeline(curried.map(inc), curried.filter(iseven), sorted, curried.map(str), curried.pluck(0), list)
+	assert pipeline(range(9)) == list('2468')
+	assert len(pipeline._compiled) == 4
+	single = Pipeline(curried.map(inc))
+	assert list(single(range(3))) == [1, 2, 3]
+	assert single._compiled == [single.funcs[0]]
+
+def test_pipeline_builder():
+	pipeline = Pipeline().map(inc).filter(iseven).remove(lambda x: x > 6).map(lambda x: (x, str(x))).pluck(1)
+	assert list(pipeline(range(10))) == ['2', '4', '6']
+	plucked = Pipeline().pluck('a', default=0).then(sum)
+	assert plucked([{'a': 1}, {}, {'a': 2}]) == 3
+	assert Pipeline().then(len)([1, 2]) == 2
+	assert Pipeline()([1, 2]) == [1, 2]
+
+def test_pipeline_is_lazy():
+	seen = []
+	pipeline = Pipeline(curried.map(seen.append), curried.map(lambda x: x))
+	result = pipeline(range(5))
+	assert seen == []
+	next(result)
+	assert seen == [0]
+
+def test_pipeline_pickle():
+	pipeline = Pipeline(curried.map(inc), curried.filter(iseven), sum)
+	copy = pickle.loads(pickle.dumps(pipeline))
+	assert copy(range(10)) == pipeline(range(10)) == 30
+	assert repr(copy).startswith('Pipeline(')
@@ -0,0 +1,52 @@
+from functools import reduce
+from humpy_toolz import sliding_window
+from humpy_toolz.sandbox import rolling_max, rolling_mean, rolling_min, rolling_reduce, rolling_sum
+from operator import add, mul, sub, truediv
+from random import Random
+import pytest
+
+def windows(func, n, seq):
+	return [func(window) for window in sliding_window(n, seq)]
+
+def test_rolling_sum_and_mean():
+	data = [Random(3).randrange(-50, 50) for _ in range(200)]
+	for n in (1, 2, 7, 200, 201):
+		assert list(rolling_sum(n, data)) == windows(sum, n, data)
+		assert list(rolling_mean(n, iter(data))) == [total / n for total in windows(sum, n, data)]
+	floats = [0.1 * index for index in range(1000)] + [1e16, 1.0, -1e16] + [0.1] * 50
+	assert list(rolling_sum(5, floats))[-1] == pytest.approx(0.5)
+
+def test_rolling_min_max():
+	data = [Random(4).randrange(20) for _ in range(300)]
+	for n in (1, 3, 16, 300):
+		assert list(rolling_min(n, data)) == windows(min, n, data)
+		assert list(rolling_max(n, iter(data))) == windows(max, n, data)
+	assert list(rolling_max(4, [1, 2])) == []
+
+def test_rolling_reduce():
+	data = list(range(1, 30))
+	assert list(rolling_reduce(add, 4, data, inverse=sub)) == windows(sum, 4, data)
+	assert list(rolling_reduce(mul, 3, [1.0, 2.0, 4.0, 8.0], inverse=truediv)) == [8.0, 64.0]
+	for n in (1, 2, 5, 29):
+		assert list(rolling_reduce(add, n, 'abcdefghijklmnopqrstuvwxyz')) == windows(''.join, n, 'abcdefghijklmnopqrstuvwxyz')
+		assert list(rolling_reduce(max, n, data[::-1])) == windows(max, n, data[::-1])
+	assert list(rolling_reduce(add, 3, [])) == []
+	with pytest.raises(ValueError, match='window'):
+		rolling_reduce(add, 0, data)
+	with pytest.raises(ValueError, match='window'):
+		rolling_mean(0, data)
+
+def test_rolling_numpy():
+	numpy = pytest.importorskip('numpy')
+	signal = numpy.array([Random(5).uniform(-1, 1) for _ in range(1003)])
+	for n in (1, 2, 10, 1003):
+		assert numpy.allclose(rolling_sum(n, signal), windows(sum, n, signal.tolist()))
+		assert numpy.allclose(rolling_mean(n, signal), [total / n for total in windows(sum, n, signal.tolist())])
+		assert rolling_min(n, signal).tolist() == windows(min, n, signal.tolist())
+		assert rolling_max(n, signal).tolist() == windows(max, n, signal.tolist())
+		assert numpy.allclose(rolling_reduce(mul, n, signal), windows(lambda window: reduce(mul, window), n, signal.tolist()))
+	counts = numpy.arange(10)
+	assert rolling_sum(3, counts).tolist() == windows(sum, 3, range(10))
+	assert len(rolling_max(11, counts)) == 0
+	# `sub` has no ufunc, so the array falls back to the iterator path; `oldest - total` undoes `sub` for windows of two.
+	assert list(rolling_reduce(sub, 2, counts, inverse=lambda total, oldest: oldest - total)) == windows(lambda window: reduce(sub, window), 2, range(10))
@@ -0,0 +1,29 @@
+from humpy_toolz.sandbox import reservoir_sample
+from random import Random
+import pytest
+
+def test_reservoir_sample() -> None:
+	assert reservoir_sample(5, range(3), random_state=1) == [0, 1, 2]
+	assert reservoir_sample(0, range(10), random_state=1) == []
+	sample: list[int] = reservoir_sample(10, iter(range(10_000)), random_state=2016)
+	assert sample == reservoir_sample(10, range(10_000), random_state=Random(2016))
+	assert sample != reservoir_sample(10, range(10_000), random_state=1984)
+	assert len(sample) == 10
+	assert sample == sorted(set(sample))
+	counts: list[int] = [0] * 10
+	for seed in range(4000):
+		for item in reservoir_sample(2, range(10), random_state=seed):
+			counts[item] += 1
+	assert all(700 < count < 900 for count in counts)
+	with pytest.raises(ValueError, match='`k`'):
+		reservoir_sample(-1, range(10))
+
+def test_reservoir_sample_numpy() -> None:
+	numpy = pytest.importorskip('numpy')
+	values = numpy.arange(1000).reshape(500, 2)
+	sample = reservoir_sample(7, values, random_state=2016)
+	assert isinstance(sample, numpy.ndarray)
+	assert sample.shape == (7, 2)
+	assert (sample == reservoir_sample(7, values, random_state=2016)).all()
+	assert (numpy.diff(sample[:, 0]) > 0).all()
+	assert (reservoir_sample(9, numpy.arange(3), random_state=1) == numpy.arange(3)).all()
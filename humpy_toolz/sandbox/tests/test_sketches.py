@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from humpy_toolz import countby, frequencies, topk, unique
+from humpy_toolz._hashing import stable_hash
+from humpy_toolz.sandbox.sketches import (
+	approx_countby, approx_frequencies, BloomFilter, CountMinSketch, HyperLogLog, LRUSet, SpaceSaving, TopK, WindowSet)
+import os
+import pytest
+import random
+import subprocess
+import sys
+
+def test_lruset():
+	seen = LRUSet(2)
+	assert list(unique([1, 2, 1, 3, 4, 1, 2], seen=seen)) == [1, 2, 3, 4, 1, 2]
+	assert len(seen) == 2
+	seen = LRUSet(2, [1, 2])
+	assert 1 in seen
+	seen.add(3)
+	assert 1 in seen
+	assert 2 not in seen
+	seen.discard(1)
+	assert 1 not in seen
+	with pytest.raises(ValueError):
+		LRUSet(0)
+
+def test_windowset():
+	now = [0.0]
+	seen = WindowSet(10.0, clock=lambda: now[0])
+	assert list(unique(['a', 'b', 'a'], seen=seen)) == ['a', 'b']
+	now[0] = 5.0
+	seen.add('c')
+	assert len(seen) == 3
+	now[0] = 10.0
+	assert 'a' not in seen
+	assert 'c' in seen
+	assert len(seen) == 1
+	assert list(unique(['a', 'c'], seen=seen)) == ['a']
+
+	bounded = WindowSet(10.0, maxsize=2, clock=lambda: now[0])
+	assert list(unique([1, 2, 3, 1], seen=bounded)) == [1, 2, 3, 1]
+	with pytest.raises(ValueError):
+		WindowSet(0)
+	with pytest.raises(ValueError):
+		WindowSet(1.0, maxsize=0)
+
+def test_bloomfilter():
+	bloom = BloomFilter(1000, error_rate=0.01)
+	for item in range(1000):
+		bloom.add(item)
+	assert all(item in bloom for item in range(1000))
+	false_positives = sum(item in bloom for item in range(1000, 11000))
+	assert false_positives < 300
+	assert list(unique([1, 2, 1, 3, 2], seen=BloomFilter(100))) == [1, 2, 3]
+
+	other = BloomFilter(1000, error_rate=0.01)
+	other.add('x')
+	merged = bloom.merge(other)
+	assert 'x' in merged
+	assert 999 in merged
+	assert merged.count == 1001
+	with pytest.raises(ValueError):
+		bloom.merge(BloomFilter(10))
+	with pytest.raises(ValueError):
+		BloomFilter(0)
+	with pytest.raises(ValueError):
+		BloomFilter(10, error_rate=1.0)
+
+def test_stable_hash():
+	assert stable_hash(1) == stable_hash(1.0) == stable_hash(True)
+	assert stable_hash(frozenset({'a', 'b', 3})) == stable_hash(frozenset({3, 'b', 'a'}))
+	assert stable_hash(('a', 'b')) != stable_hash(('ab',))
+	assert stable_hash(('a', ('b',))) != stable_hash((('a',), 'b'))
+	assert stable_hash(b'x') != stable_hash('x')
+	with pytest.raises(TypeError):
+		stable_hash(object())
+	code = 'from humpy_toolz._hashing import stable_hash; print(stable_hash(("user", 42, 0.5)))'
+	hashes = {
+		subprocess.run([sys.executable, '-c', code], capture_output=True, check=True, text=True, env={**os.environ, 'PYTHONHASHSEED': seed}).stdout
+		for seed in ('1', '2')
+	}
+	assert hashes == {f'{stable_hash(("user", 42, 0.5))}\n'}
+
+def test_countminsketch():
+	words = ['cat'] * 50 + ['dog'] * 20 + [str(index) for index in range(500)]
+	sketch = approx_frequencies(words, CountMinSketch(width=272, depth=5))
+	assert sketch.total == 570
+	assert 50 <= sketch['cat'] <= 50 + 570 // 100 * 2
+	assert sketch['dog'] >= 20
+	assert sketch['absent'] >= 0
+	left = approx_frequencies(words[:300], CountMinSketch(width=272, depth=5))
+	right = approx_frequencies(words[300:], CountMinSketch(width=272, depth=5))
+	merged = left.merge(right)
+	assert merged.table == sketch.table
+	assert merged.total == sketch.total
+	shaped = CountMinSketch.from_error(0.01, 0.01)
+	assert (shaped.width, shaped.depth) == (272, 5)
+	with pytest.raises(ValueError):
+		left.merge(CountMinSketch(width=10))
+	with pytest.raises(ValueError):
+		CountMinSketch(width=0)
+	with pytest.raises(ValueError):
+		CountMinSketch.from_error(0, 0.5)
+
+def test_spacesaving():
+	stream = ['a'] * 100 + ['b'] * 50 + [index for index in range(1000)] + ['c'] * 30
+	sketch = approx_frequencies(stream, SpaceSaving(40))
+	assert len(sketch) == 40
+	assert sketch.total == len(stream)
+	assert sketch.most_common(1)[0][0] == 'a'
+	assert {'a', 'b', 'c'} <= set(sketch)
+	assert sketch['a'] >= 100
+	for item, count in sketch.items():
+		assert count - sketch.errors[item] <= stream.count(item) <= count
+	exact = approx_frequencies('abracadabra', SpaceSaving(10))
+	assert dict(exact) == frequencies('abracadabra')
+	assert exact.most_common() == sorted(frequencies('abracadabra').items(), key=lambda pair: pair[1], reverse=True)
+
+	left = approx_frequencies(stream[:600], SpaceSaving(20))
+	right = approx_frequencies(stream[600:], SpaceSaving(20))
+	merged = left.merge(right)
+	assert merged.total == len(stream)
+	assert len(merged) == 20
+	assert merged.most_common(1)[0][0] == 'a'
+	with pytest.raises(ValueError):
+		SpaceSaving(0)
+
+def test_spacesaving_merge_never_undercounts():
+	left, right = SpaceSaving(2), SpaceSaving(2)
+	left.update('xxxab')
+	right.update('yyyxab')
+	merged = left.merge(right)
+	assert merged['x'] >= 4
+	assert merged['x'] - merged.errors['x'] <= 4
+	generator = random.Random(7)
+	for _trial in range(50):
+		streams = [[generator.randrange(30) for _index in range(generator.randrange(1, 200))] for _part in range(3)]
+		sketches = [approx_frequencies(stream, SpaceSaving(generator.randrange(1, 12))) for stream in streams]
+		merged = sketches[0].merge(sketches[1]).merge(sketches[2])
+		true = frequencies(streams[0] + streams[1] + streams[2])
+		for item, count in merged.items():
+			assert count - merged.errors[item] <= true[item] <= count
+
+def test_hyperloglog():
+	sketch = HyperLogLog(12)
+	sketch.update(range(20000))
+	sketch.update(range(10000))
+	assert abs(sketch.cardinality() - 20000) < 20000 * 0.05
+	assert len(approx_frequencies('abracadabra', HyperLogLog())) == 5
+	left = approx_frequencies(range(0, 6000), HyperLogLog())
+	right = approx_frequencies(range(4000, 10000), HyperLogLog())
+	assert abs(len(left.merge(right)) - 10000) < 10000 * 0.05
+	with pytest.raises(ValueError):
+		left.merge(HyperLogLog(10))
+	with pytest.raises(ValueError):
+		HyperLogLog(3)
+
+def test_approx_countby():
+	records = [{'user': 'ann', 'url': '/a'}, {'user': 'bo', 'url': '/b'}, {'user': 'ann', 'url': '/b'}]
+	assert dict(approx_countby('user', records)) == countby('user', records)
+	assert dict(approx_countby(len, ['cat', 'mouse', 'dog'])) == countby(len, ['cat', 'mouse', 'dog'])
+	assert len(approx_countby('url', records, HyperLogLog())) == 2
+	assert approx_countby(['user'], records, CountMinSketch())[('ann',)] >= 2
+
+def test_topk():
+	words = ['Alice', 'Bob', 'Charlie', 'Dan', 'Eve', 'Mallory', 'Trent']
+	top = TopK(3, key=len)
+	top.update(words)
+	assert top.result() == topk(3, words, key=len)
+	assert TopK(10).result() == ()
+	top = TopK(2)
+	for item in [5, 1, 9, 7]:
+		top.add(item)
+	assert top.result() == (9, 7)
+	pairs = [(index % 4, index) for index in range(20)]
+	left, right = TopK(5, key=0), TopK(5, key=0)
+	left.update(pairs[:11])
+	right.update(pairs[11:])
+	assert left.merge(right).result() == topk(5, pairs, key=lambda pair: pair[0])
+	assert right.merge(left).result() == topk(5, pairs[11:] + pairs[:11], key=lambda pair: pair[0])
+	with pytest.raises(ValueError, match='`k`'):
+		TopK(0)
+	with pytest.raises(ValueError, match='merged'):
+		TopK(2).merge(TopK(3))
+
+def test_topk_frequent():
+	stream = [index % 7 for index in range(100)] + [3] * 50 + [5] * 30
+	top = TopK(2, frequent=True)
+	top.update(stream)
+	assert top.result() == ((3, 64), (5, 44))
+	first, second = TopK(2, frequent=True), TopK(2, frequent=True)
+	first.update(stream[:90])
+	second.update(stream[90:])
+	assert first.merge(second).result() == top.result()
+	assert TopK(1, key=len, frequent=True, capacity=4).merge(TopK(1, frequent=True)).result() == ()
+	first, second = TopK(1, frequent=True, capacity=2), TopK(1, frequent=True, capacity=2)
+	first.update('xxxab')
+	second.update('yyyxab')
+	assert first.merge(second).sketch['x'] >= 4
+	with pytest.raises(ValueError, match='merged'):
+		TopK(2).merge(TopK(2, frequent=True))
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from humpy_toolz import aitertoolz, itertoolz
+from humpy_toolz.sandbox import LRUSet
+from humpy_toolz.utils import raises
+from operator import add
+from typing import TYPE_CHECKING
+import asyncio
+
+if TYPE_CHECKING:
+	from collections.abc import AsyncIterable, AsyncIterator
+	from typing import Any
+
+async def numbers(*items: Any) -> AsyncIterator[Any]:
+	for item in items:
+		await asyncio.sleep(0)
+		yield item
+
+async def collect[T](seq: AsyncIterable[T]) -> list[T]:
+	return [item async for item in seq]
+
+def run[T](seq: AsyncIterable[T]) -> list[T]:
+	return asyncio.run(collect(seq))
+
+def test_same_results_as_itertoolz() -> None:
+	data: list[int] = [5, 3, 3, 8, 1, 9, 1, 2, 7]
+	for n in (0, 1, 2, 4, 20):
+		assert run(aitertoolz.take(n, numbers(*data))) == list(itertoolz.take(n, data))
+		assert run(aitertoolz.drop(n, numbers(*data))) == list(itertoolz.drop(n, data))
+	for n in (1, 2, 4, 20):
+		assert run(aitertoolz.partition_all(n, numbers(*data))) == list(itertoolz.partition_all(n, data))
+		assert run(aitertoolz.sliding_window(n, numbers(*data))) == list(itertoolz.sliding_window(n, data))
+	assert run(aitertoolz.unique(numbers(*data))) == list(itertoolz.unique(data))
+	assert run(aitertoolz.unique(data, key=lambda x: x % 3)) == list(itertoolz.unique(data, key=lambda x: x % 3))
+	seen = {3}
+	assert run(aitertoolz.unique(numbers(*data), seen=seen)) == list(itertoolz.unique(data, seen={3}))
+	assert seen == set(data)
+	assert run(aitertoolz.unique(numbers(1, 2, 1, 3, 1), seen=LRUSet(2))) == list(itertoolz.unique([1, 2, 1, 3, 1], seen=LRUSet(2)))
+	assert run(aitertoolz.interleave([numbers(1, 2, 3), [4], numbers()])) == list(itertoolz.interleave([[1, 2, 3], [4], []]))
+	assert asyncio.run(aitertoolz.groupby(lambda x: x % 3, numbers(*data))) == itertoolz.groupby(lambda x: x % 3, data)
+	assert asyncio.run(aitertoolz.groupby(0, [(1, 'a'), (2, 'b'), (1, 'c')])) == {1: [(1, 'a'), (1, 'c')], 2: [(2, 'b')]}
+	assert asyncio.run(aitertoolz.reduceby(lambda x: x % 2, add, numbers(*data))) == itertoolz.reduceby(lambda x: x % 2, add, data)
+	assert asyncio.run(aitertoolz.reduceby(lambda x: x % 2, add, data, 100)) == itertoolz.reduceby(lambda x: x % 2, add, data, 100)
+	assert asyncio.run(aitertoolz.reduceby(lambda x: x % 2, lambda acc, x: [*acc, x], data, list)) == itertoolz.reduceby(
+		lambda x: x % 2, lambda acc, x: [*acc, x], data, list)
+
+def test_merge_sorted() -> None:
+	assert run(aitertoolz.merge_sorted(numbers(1, 4, 7), [2, 5], numbers(3, 6, 8, 9))) == list(range(1, 10))
+	assert run(aitertoolz.merge_sorted()) == []
+	pairs: list[tuple[int, str]] = [(1, 'a'), (2, 'a')]
+	others: list[tuple[int, str]] = [(1, 'b'), (2, 'b')]
+	assert run(aitertoolz.merge_sorted(pairs, numbers(*others), key=lambda pair: pair[0])) == [(1, 'a'), (1, 'b'), (2, 'a'), (2, 'b')]
+
+def test_take_does_not_overread() -> None:
+	read: list[int] = []
+
+	async def source() -> AsyncIterator[int]:
+		for item in range(10):
+			read.append(item)
+			yield item
+
+	assert run(aitertoolz.take(3, source())) == [0, 1, 2]
+	assert read == [0, 1, 2]
+
+def test_amap() -> None:
+	running: list[int] = [0, 0]
+
+	async def slow_inc(x: int) -> int:
+		running[0] += 1
+		running[1] = max(running)
+		await asyncio.sleep(0.001 * (x % 3))
+		running[0] -= 1
+		return x + 1
+
+	assert run(aitertoolz.amap(slow_inc, range(20), max_inflight=4)) == list(range(1, 21))
+	assert running[1] == 4
+	assert sorted(run(aitertoolz.amap(slow_inc, numbers(*range(20)), ordered=False))) == list(range(1, 21))
+	assert run(aitertoolz.amap(slow_inc, [])) == []
+	assert raises(ValueError, lambda: aitertoolz.amap(slow_inc, [], max_inflight=0))
+
+	async def fail(x: int) -> int:
+		await asyncio.sleep(0)
+		return 1 // x
+
+	assert raises(ZeroDivisionError, lambda: run(aitertoolz.amap(fail, [1, 0, 2])))
+
+def test_amap_cancels_on_close() -> None:
+	cancelled: list[int] = []
+
+	async def wait_forever(x: int) -> int:
+		try:
+			await asyncio.sleep(0 if x == 0 else 60)
+		except asyncio.CancelledError:
+			cancelled.append(x)
+			raise
+		return x
+
+	async def main() -> int:
+		mapped: AsyncIterator[int] = aitertoolz.amap(wait_forever, range(5), ordered=False, max_inflight=3)
+		first: int = await anext(mapped)
+		await mapped.aclose()  # pyright: ignore[reportAttributeAccessIssue]
+		return first
+
+	assert asyncio.run(main()) == 0
+	assert sorted(cancelled) == [1, 2]
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from humpy_toolz.functoolz import (
-	apply, complement, compose, compose_left, curry, do, excepts, flip, juxt, memoize, pipe, thread_first, thread_last)
+	apply, checked_curry, complement, compose, compose_left, curry, do, excepts, flip, juxt, memoize, pipe, thread_first, thread_last)
 from humpy_toolz.utils import raises
 from operator import add, itemgetter, mul
 from typing import NoReturn
+import asyncio
 import humpy_toolz
 import inspect
+import threading
+import time
 
 def iseven(x: int) -> bool:
 	return x % 2 == 0
@@ -176,6 +180,181 @@ def test_memoize_wrapped() -> None:
 	assert memoized_foo.__wrapped__ is foo
 
 
+def test_memoize_maxsize() -> None:
+	calls = []
+
+	@memoize(maxsize=2)
+	def f(x: int) -> int:
+		calls.append(x)
+		return x * 2
+
+	assert [f(x) for x in [1, 2, 1, 3, 1, 2]] == [2, 4, 2, 6, 2, 4]
+	assert calls == [1, 2, 3, 2]
+	assert f.cache_info() == (2, 4, 2, 2, 2)
+	assert f.cache_info().hits == 2
+
+	@memoize(maxsize=2, policy='lfu')
+	def g(x: int) -> int:
+		calls.append(x)
+		return x
+
+	calls.clear()
+	assert [g(x) for x in [1, 1, 2, 3, 2, 1]] == [1, 1, 2, 3, 2, 1]
+	assert calls == [1, 2, 3, 2]
+	assert g.cache_info().evictions == 2
+
+	nothing = memoize(inc, maxsize=0)
+	assert nothing(1) == nothing(1) == 2
+	assert nothing.cache_info() == (0, 2, 0, 0, 0)
+
+	plain = memoize(inc, cache={1: 5})
+	assert plain(1) == 5
+	assert plain(2) == 3
+	assert plain.cache_info() == (None, None, None, None, 2)
+
+	assert raises(ValueError, lambda: memoize(inc, cache={}, maxsize=1))
+	assert raises(ValueError, lambda: memoize(inc, maxsize=1, policy='fifo'))
+	assert raises(ValueError, lambda: memoize(inc, maxsize=-1))
+	assert raises(ValueError, lambda: memoize(inc, ttl=0))
+
+
+def test_memoize_getsizeof() -> None:
+	@memoize(maxsize=10, getsizeof=len)
+	def f(n: int) -> str:
+		return 'x' * n
+
+	f(4)
+	f(5)
+	assert f.cache_info().currsize == 9
+	f(3)
+	assert f.cache_info() == (0, 3, 1, 10, 8)
+	f(11)
+	assert f.cache_info().currsize == 8
+	f(5)
+	assert f.cache_info().hits == 1
+
+
+def test_memoize_ttl(monkeypatch) -> None:
+	now = [0.0]
+	monkeypatch.setattr(humpy_toolz._caches.time, 'monotonic', lambda: now[0])
+	calls = []
+
+	@memoize(ttl=10)
+	def f(x: int) -> int:
+		calls.append(x)
+		return x
+
+	f(1)
+	now[0] = 5.0
+	f(2)
+	f(1)
+	assert calls == [1, 2]
+	now[0] = 12.0
+	f(1)
+	f(3)
+	assert calls == [1, 2, 1, 3]
+	assert f.cache_info() == (1, 4, 1, None, 3)
+	now[0] = 16.0
+	f(4)
+	assert f.cache_info().currsize == 3
+
+	cache = humpy_toolz._caches.LRUCache(maxsize=10, ttl=3600)
+	for key in range(1000):
+		cache[key] = key
+	assert len(cache) == 10
+	assert len(cache._deadlines) == 10
+
+
+def test_memoize_single_flight() -> None:
+	calls = []
+	started = threading.Event()
+	release = threading.Event()
+
+	@memoize(concurrency='single_flight')
+	def slow(x: int) -> int:
+		calls.append(x)
+		started.set()
+		release.wait()
+		if x < 0:
+			message = 'negative'
+			raise ValueError(message)
+		return x * 2
+
+	with ThreadPoolExecutor(8) as executor:
+		futures = [executor.submit(slow, 1)]
+		started.wait()
+		futures += [executor.submit(slow, 1) for _ in range(7)]
+		time.sleep(0.05)
+		release.set()
+		assert [future.result() for future in futures] == [2] * 8
+	assert calls == [1]
+	assert slow(1) == 2
+	assert slow.cache_info() == (None, None, None, None, 1)
+	assert slow.__wrapped__.__name__ == slow.__name__ == 'slow'
+
+	calls.clear()
+	with ThreadPoolExecutor(4) as executor:
+		futures = [executor.submit(slow, -1) for _ in range(4)]
+		assert all(isinstance(future.exception(), ValueError) for future in futures)
+	assert raises(ValueError, lambda: slow(-1))
+	assert len(calls) >= 2
+
+	bounded = memoize(inc, maxsize=1, concurrency='single_flight')
+	assert [bounded(x) for x in [1, 1, 2]] == [2, 2, 3]
+	assert bounded.cache_info() == (1, 2, 1, 1, 1)
+	assert raises(TypeError, lambda: bounded([]))
+	assert raises(ValueError, lambda: memoize(inc, concurrency='threads'))
+
+	class FullCache(dict):
+		def __setitem__(self, key, value):
+			message = 'full'
+			raise MemoryError(message)
+
+	calls.clear()
+	release.clear()
+	started.clear()
+	full = memoize(slow.__wrapped__, cache=FullCache(), concurrency='single_flight')
+	with ThreadPoolExecutor(4) as executor:
+		futures = [executor.submit(full, 3)]
+		started.wait()
+		futures += [executor.submit(full, 3) for _ in range(3)]
+		time.sleep(0.05)
+		release.set()
+		assert isinstance(futures[0].exception(timeout=5), MemoryError)
+		assert [future.result(timeout=5) for future in futures[1:]] == [6] * 3
+	assert raises(MemoryError, lambda: full(3))
+	assert calls == [3, 3]
+
+
+def test_memoize_single_flight_asyncio() -> None:
+	calls = []
+
+	@memoize(concurrency='single_flight')
+	async def slow(x: int) -> int:
+		calls.append(x)
+		await asyncio.sleep(0.01)
+		return x * 2
+
+	assert inspect.iscoroutinefunction(slow)
+
+	async def main() -> list[int]:
+		return await asyncio.gather(*(slow(x) for x in [1, 2, 1, 1, 2]))
+
+	assert asyncio.run(main()) == [2, 4, 2, 2, 4]
+	assert calls == [1, 2]
+
+	async def cancel_the_first() -> int:
+		first = asyncio.ensure_future(slow(3))
+		await asyncio.sleep(0)
+		second = asyncio.ensure_future(slow(3))
+		await asyncio.sleep(0)
+		first.cancel()
+		return await second
+
+	assert asyncio.run(cancel_the_first()) == 6
+	assert calls == [1, 2, 3, 3]
+
+
 def test_curry_simple() -> None:
 	cmul = curry(mul)
 	double = cmul(2)
@@ -501,6 +680,45 @@ def test_curry_subclassable() -> None:
 	'\n    class curry2(curry):\n        def _should_curry(self, args, kwargs, exc=None):\n            return len(self.args) + len(args) < 2\n\n    add = curry2(lambda x, y: x+y)\n    assert isinstance(add(1), curry2)\n    assert add(1)(2) == 3\n    assert isinstance(add(1)(x=2), curry2)\n    assert raises(TypeError, lambda: add(1)(x=2)(3))\n    '
 
 
+def test_checked_curry(monkeypatch) -> None:
+
+	def f(x: int, y: int, *, z: int = 0, w: int) -> int:
+		if x < 0:
+			raise TypeError('negative')
+		return x + y + z + w
+
+	g = checked_curry(f)
+	assert g(1)(2)(w=3) == g(1, w=3)(2) == g(w=3)(1, 2) == 6
+	assert g(1, 2, z=4)(w=3) == 10
+	assert isinstance(g(1), checked_curry)
+	assert g(1, z=10)(2, w=0) == 13
+
+	def should_curry(*args: object) -> NoReturn:
+		raise AssertionError('checked_curry inspected the signature after a call')
+
+	monkeypatch.setattr(curry, '_should_curry', should_curry)
+	assert raises(TypeError, lambda: g(-1, 2, w=0))
+	assert raises(TypeError, lambda: g(1, 2, 3))
+	assert raises(TypeError, lambda: g(1, v=2))
+	assert raises(TypeError, lambda: g(1)(x=2))
+	monkeypatch.undo()
+
+	@checked_curry
+	def h(*args: int) -> int:
+		return f(*args, w=0)
+
+	assert h(1)(2) == h(1, 2) == 3
+	assert list(checked_curry(map)(str)([1])) == ['1']
+
+	class A:
+		@checked_curry
+		def add(self, x: int, y: int) -> int:
+			return x + y
+
+	assert isinstance(A().add(1), checked_curry)
+	assert A().add(1)(2) == 3
+
+
 def generate_compose_test_cases():
 	"""
 	Generate test cases for parametrized tests of the compose function.
@@ -523,6 +741,22 @@ def test_compose() -> None:
 	for compose_args, args, kw, expected in generate_compose_test_cases():
 		assert compose(*compose_args)(*args, **kw) == expected
 
+def test_compose_compile() -> None:
+	for compose_args, args, kw, expected in generate_compose_test_cases():
+		assert compose(*compose_args, compile=True)(*args, **kw) == expected
+	funcs = (str, *[inc] * 40, abs)
+	composed = compose(*funcs, compile=True)
+	assert composed(-2) == compose(*funcs)(-2) == '42'
+	assert composed == compose(*funcs)
+	assert hash(composed) == hash(compose(*funcs))
+	assert composed != compose(*funcs[1:], compile=True)
+	assert isinstance(composed, humpy_toolz.functoolz.Compose)
+	assert repr(compose(str, abs, compile=True)) == f'Compose({str!r}, {abs!r})'
+	assert compose(str, abs, compile=True).__name__ == 'str_of_abs'
+	assert compose(inc, inc, compile=True).__doc__ == compose(inc, inc).__doc__ is not None
+	assert compose_left(abs, str, compile=True)(-3) == '3'
+	assert compose(inc, compile=True) is inc
+
 
 def test_compose_metadata() -> None:
 
@@ -482,3 +482,68 @@ def test_inspect_wrapped_property() -> None:
 		assert num_required_args(Wrapped) is None
 		_sigs.signatures[Wrapped] = (_sigs.expand_sig((0, lambda func: None)),)
 	assert num_required_args(Wrapped) == 1
+
+def test_signature_cache(monkeypatch) -> None:
+	calls = []
+	signature = inspect.signature
+
+	def counting(func, *args, **kwargs):
+		calls.append(func)
+		return signature(func, *args, **kwargs)
+
+	monkeypatch.setattr(inspect, 'signature', counting)
+
+	def f(a, b, c):
+		return a + b + c
+
+	g = curry(f)
+	assert g(1)(2)(3) == g(1, 2)(3) == g(1)(2, 3) == 6
+	assert humpy_toolz.memoize(f)(1, 2, 3) == 6
+	assert is_arity(3, f)
+	assert calls == [f]
+	f.__defaults__ = (0,)
+	assert g(1)(2) == 3
+	assert is_arity(2, f) is False
+	assert calls == [f, f]
+	f.__signature__ = 34
+	assert has_varargs(f) is False
+	assert calls == [f, f, f]
+
+
+def test_bind_agrees_with_signature() -> None:
+	# `Signature.bind` of some CPython versions disagrees with the interpreter about positional-only names passed as
+	# keywords, so the expected answers come from calling the function.
+	def accepts(func, args, kwargs) -> bool:
+		try:
+			func(*args, **kwargs)
+		except TypeError:
+			return False
+		return True
+
+	kinds = [None, inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY]
+	for kind_a, kind_b, default_b, var_positional, var_keyword in itertools.product(kinds, kinds, [False, True], [False, True], [False, True]):
+		params = []
+		if kind_a is not None:
+			params.append(inspect.Parameter('a', kind_a))
+		if kind_b is not None:
+			params.append(inspect.Parameter('b', kind_b, default=0 if default_b else inspect.Parameter.empty))
+		if var_positional:
+			params.insert(len([p for p in params if p.kind != p.KEYWORD_ONLY]), inspect.Parameter('args', inspect.Parameter.VAR_POSITIONAL))
+		if var_keyword:
+			params.append(inspect.Parameter('kwargs', inspect.Parameter.VAR_KEYWORD))
+		try:
+			sigspec = inspect.Signature(params)
+		except ValueError:
+			continue
+		func = make_func(str(sigspec)[1:-1], raise_if_called=False)
+		for nargs in range(4):
+			for names in itertools.chain.from_iterable(itertools.combinations('abz', r) for r in range(4)):
+				args, kwargs = (None,) * nargs, dict.fromkeys(names)
+				missing = [name for name in 'ab' if name not in kwargs]
+				completions = [
+					(args + (None,) * extra, {**kwargs, **dict.fromkeys(more)})
+					for extra in range(3)
+					for more in itertools.chain.from_iterable(itertools.combinations(missing, r) for r in range(len(missing) + 1))
+				]
+				assert is_valid_args(func, args, kwargs) is accepts(func, args, kwargs)
+				assert is_partial_args(func, args, kwargs) is any(accepts(func, *completion) for completion in completions)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from humpy_toolz import countby, first, identity, partitionby
+import pytest
 
 def iseven(x: int) -> bool:
 	return x % 2 == 0
@@ -10,6 +11,15 @@ def test_countby() -> None:
 	assert countby(len, ['cat', 'dog', 'mouse']) == {3: 2, 5: 1}
 	assert countby(0, ('ab', 'ac', 'bc')) == {'a': 2, 'b': 1}
 
+def test_countby_numpy() -> None:
+	numpy = pytest.importorskip('numpy')
+	values = numpy.array([3, -1, 3, 0, -5])
+	assert countby(numpy.sign, values) == {1: 2, -1: 2, 0: 1}
+	records = numpy.array([('ann', 1), ('bo', 2), ('ann', 3)], dtype=[('user', 'U3'), ('visits', 'i4')])
+	assert countby('user', records) == {'ann': 2, 'bo': 1}
+	assert countby(['user'], records) == {('ann',): 2, ('bo',): 1}
+	assert countby(iseven, values) == countby(iseven, values.tolist())
+
 def test_partitionby() -> None:
 	assert list(partitionby(identity, [])) == []
 	vowels = 'aeiou'
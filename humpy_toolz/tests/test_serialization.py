@@ -11,6 +11,11 @@ def test_compose() -> None:
 	f = compose(str, sum)
 	g = pickle.loads(pickle.dumps(f))
 	assert f((1, 2)) == g((1, 2))
+	f = compose(str, sum, compile=True)
+	g = pickle.loads(pickle.dumps(f))
+	assert f((1, 2)) == g((1, 2))
+	assert f == g
+	assert type(f) is type(g)
 
 def test_curry() -> None:
 	f = curry(map)(str)